@@ -1,10 +1,12 @@
 {
   coloraide,
   # fontforge,
+  fonttools,
   jsonpickle,
   lib,
   mkPythonEditablePackage,
   lxml,
+  numpy,
   poetry-core,
   svg-py,
 }:
@@ -33,8 +35,10 @@ mkPythonEditablePackage {
   dependencies = [
     coloraide
     # fontforge
+    fonttools
     jsonpickle
     lxml
+    numpy
     svg-py
   ];
 
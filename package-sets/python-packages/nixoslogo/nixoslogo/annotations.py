@@ -12,9 +12,9 @@ from nixoslogo.core import (
     BaseRenderable,
     get_nixos_annotation_font_file,
 )
-from nixoslogo.geometry import Point
+from nixoslogo.geometry import Point, simplify_transforms
 from nixoslogo.helpers import arc_sagitta
-from nixoslogo.logotype import FontLoader, Glyph
+from nixoslogo.logotype import FontLoader, Glyph, font_loaders, get_font_loader
 
 
 class TextAnnotations(BaseRenderable):
@@ -33,6 +33,7 @@ class TextAnnotations(BaseRenderable):
         self.scale = scale
         self.cap_height = cap_height
 
+        font_loaders.hold(self, self.loader)
         self._load_glyphs()
         self.original_cap_height = self.loader.capHeight
         self.original_scale = self.loader.scale
@@ -108,6 +109,19 @@ class TextAnnotations(BaseRenderable):
         )
 
 
+def get_annotation_font_loader(
+    get_font_file: Callable[[], Path] = get_nixos_annotation_font_file,
+    transforms_map: dict = DEFAULT_JURA_TRANSFORMS,
+    owner: object | None = None,
+) -> FontLoader:
+    return get_font_loader(
+        get_font_file=get_font_file,
+        transforms_map=transforms_map,
+        offset_glyph=False,
+        owner=owner,
+    )
+
+
 @dataclass
 class LineGroup:
     name: str
@@ -132,11 +146,18 @@ class DimensionLines(LineGroup):
         self,
         font_loader: FontLoader,
         font_config: dict,
+        collapse_transforms: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.font_loader = font_loader
         self.font_config = font_config
+        self.collapse_transforms = collapse_transforms
+
+    def _make_transform(self, transforms):
+        if self.collapse_transforms:
+            return simplify_transforms(transforms)
+        return transforms
 
     def make_dimension_line(
         self,
@@ -193,11 +214,13 @@ class DimensionLines(LineGroup):
                 translate_to = (point1_end + point2_end) / 2
                 text_element = (
                     svg.G(
-                        transform=[
-                            svg.Translate(*(-annotation_center)),
-                            svg.Translate(*translate_to),
-                            svg.Translate(0, -annotation_center.y * 3 / 2),
-                        ],
+                        transform=self._make_transform(
+                            [
+                                svg.Translate(*(-annotation_center)),
+                                svg.Translate(*translate_to),
+                                svg.Translate(0, -annotation_center.y * 3 / 2),
+                            ]
+                        ),
                         elements=(text_annotation.make_svg_elements()),
                     ),
                 )
@@ -205,20 +228,22 @@ class DimensionLines(LineGroup):
                 translate_to = (point1_dim + point2_dim) / 2
                 text_element = (
                     svg.G(
-                        transform=[
-                            svg.Translate(*(-annotation_center)),
-                            svg.Translate(*translate_to),
-                            svg.Rotate(
-                                -math.degrees(
-                                    math.atan2(*(point2_dim - point1_dim).normal())
+                        transform=self._make_transform(
+                            [
+                                svg.Translate(*(-annotation_center)),
+                                svg.Translate(*translate_to),
+                                svg.Rotate(
+                                    -math.degrees(
+                                        math.atan2(*(point2_dim - point1_dim).normal())
+                                    ),
+                                    *annotation_center,
                                 ),
-                                *annotation_center,
-                            ),
-                            svg.Rotate(
-                                180 if side == "left" else 0, *annotation_center
-                            ),
-                            svg.Translate(0, annotation_center.y * 5 / 4),
-                        ],
+                                svg.Rotate(
+                                    180 if side == "left" else 0, *annotation_center
+                                ),
+                                svg.Translate(0, annotation_center.y * 5 / 4),
+                            ]
+                        ),
                         elements=(text_annotation.make_svg_elements()),
                     ),
                 )
@@ -327,17 +352,21 @@ class DimensionLines(LineGroup):
 
             text_element = (
                 svg.G(
-                    transform=[
-                        svg.Translate(*(-annotation_center)),
-                        svg.Translate(*translate_to),
-                        svg.Rotate(
-                            -math.degrees(
-                                math.atan2(*(point2_dim - point1_dim).normal())
+                    transform=self._make_transform(
+                        [
+                            svg.Translate(*(-annotation_center)),
+                            svg.Translate(*translate_to),
+                            svg.Rotate(
+                                -math.degrees(
+                                    math.atan2(*(point2_dim - point1_dim).normal())
+                                ),
+                                *annotation_center,
                             ),
-                            *annotation_center,
-                        ),
-                        svg.Rotate(180 if side == "left" else 0, *annotation_center),
-                    ],
+                            svg.Rotate(
+                                180 if side == "left" else 0, *annotation_center
+                            ),
+                        ]
+                    ),
                     elements=(text_annotation.make_svg_elements()),
                 ),
             )
@@ -457,11 +486,13 @@ class DimensionLines(LineGroup):
                 marker_end="url(#dimension-arrow-head)",
             ),
             svg.G(
-                transform=[
-                    svg.Translate(*(-annotation_center)),
-                    svg.Translate(*arc_midpoint),
-                    svg.Translate(*annotation_offset),
-                ],
+                transform=self._make_transform(
+                    [
+                        svg.Translate(*(-annotation_center)),
+                        svg.Translate(*arc_midpoint),
+                        svg.Translate(*annotation_offset),
+                    ]
+                ),
                 elements=(text_annotation.make_svg_elements()),
             ),
         )
@@ -499,10 +530,10 @@ class Annotations:
         get_font_file: Callable[[], Path] = get_nixos_annotation_font_file,
         transforms_map: dict = DEFAULT_JURA_TRANSFORMS,
     ):
-        self.font_loader = FontLoader(
+        self.font_loader = get_annotation_font_loader(
             get_font_file=get_font_file,
             transforms_map=transforms_map,
-            offset_glyph=False,
+            owner=self,
         )
         self.font_config = font_config
         self.object_lines = ObjectLines(**object_lines_config)
@@ -48,13 +48,11 @@ class LogoClearspace(BaseRenderable):
         )
 
     def make_svg_elements(self):
-        return (
-            self.make_greyscale_def(),
-            self.make_grid_lines(),
-            self.make_clearspace_lines(),
-            self.recommended.make_svg_elements(),
-            self.make_space_object_elements(),
-        )
+        yield self.make_greyscale_def()
+        yield self.make_grid_lines()
+        yield self.make_clearspace_lines()
+        yield self.recommended.make_svg_elements()
+        yield self.make_space_object_elements()
 
     def make_greyscale_def(self):
         return (
@@ -112,7 +110,7 @@ class LogoClearspace(BaseRenderable):
                 )
             )
         ]
-        return tuple(
+        return (
             self.make_space_object_element(
                 space=self.space_object,
                 transform=transform,
@@ -0,0 +1,392 @@
+import math
+from collections.abc import Iterable, Iterator
+
+import svg
+
+from nixoslogo.geometry import Affine, Point, PointArray, Vector
+
+# === Constants ===
+
+BoundingBox = tuple[float, float, float, float]
+
+IDENTITY = Affine()
+
+# Elements that are referenced or painted with, not drawn where they are.
+UNRENDERED_ELEMENTS = (
+    svg.ClipPath,
+    svg.Defs,
+    svg.Filter,
+    svg.LinearGradient,
+    svg.Marker,
+    svg.Mask,
+    svg.Pattern,
+    svg.RadialGradient,
+    svg.Style,
+    svg.Symbol,
+)
+
+# === Functions ===
+
+
+def union(boxes: Iterable[BoundingBox | None]) -> BoundingBox | None:
+    """The smallest box containing all of `boxes`; `None` ones are skipped."""
+    boxes = [box for box in boxes if box is not None]
+    if not boxes:
+        return None
+    min_x, min_y, max_x, max_y = zip(*boxes)
+    return (min(min_x), min(min_y), max(max_x), max(max_y))
+
+
+def _array_box(points: PointArray) -> BoundingBox | None:
+    if not len(points):
+        return None
+    return (
+        points.x.min().item(),
+        points.y.min().item(),
+        points.x.max().item(),
+        points.y.max().item(),
+    )
+
+
+def _points_box(points: Iterable[Point]) -> BoundingBox | None:
+    xs, ys = [], []
+    for point in points:
+        xs.append(point.x)
+        ys.append(point.y)
+    if not xs:
+        return None
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _quadratic_extrema(p0: float, p1: float, p2: float) -> list[float]:
+    """Where a quadratic Bézier coordinate turns around, for 0 < t < 1."""
+    denominator = p0 - 2 * p1 + p2
+    if denominator == 0:
+        return []
+    t = (p0 - p1) / denominator
+    return [t] if 0 < t < 1 else []
+
+
+def _cubic_extrema(p0: float, p1: float, p2: float, p3: float) -> list[float]:
+    """Where a cubic Bézier coordinate turns around, for 0 < t < 1."""
+    a = -p0 + 3 * p1 - 3 * p2 + p3
+    b = 2 * (p0 - 2 * p1 + p2)
+    c = p1 - p0
+    if a == 0:
+        roots = [] if b == 0 else [-c / b]
+    else:
+        discriminant = b * b - 4 * a * c
+        if discriminant < 0:
+            return []
+        root = math.sqrt(discriminant)
+        roots = [(-b + root) / (2 * a), (-b - root) / (2 * a)]
+    return [t for t in roots if 0 < t < 1]
+
+
+def _quadratic_points(p0: Point, p1: Point, p2: Point) -> list[Point]:
+    def at(t):
+        u = 1 - t
+        return Point(
+            (
+                u * u * p0.x + 2 * u * t * p1.x + t * t * p2.x,
+                u * u * p0.y + 2 * u * t * p1.y + t * t * p2.y,
+            )
+        )
+
+    ts = _quadratic_extrema(p0.x, p1.x, p2.x) + _quadratic_extrema(p0.y, p1.y, p2.y)
+    return [p0, p2] + [at(t) for t in ts]
+
+
+def _cubic_points(p0: Point, p1: Point, p2: Point, p3: Point) -> list[Point]:
+    def at(t):
+        u = 1 - t
+        return Point(
+            (
+                u**3 * p0.x + 3 * u * u * t * p1.x + 3 * u * t * t * p2.x + t**3 * p3.x,
+                u**3 * p0.y + 3 * u * u * t * p1.y + 3 * u * t * t * p2.y + t**3 * p3.y,
+            )
+        )
+
+    ts = _cubic_extrema(p0.x, p1.x, p2.x, p3.x) + _cubic_extrema(p0.y, p1.y, p2.y, p3.y)
+    return [p0, p3] + [at(t) for t in ts]
+
+
+def _ellipse_points(
+    center: Point,
+    u: Point,
+    v: Point,
+    start: float = 0,
+    sweep: float = 2 * math.pi,
+) -> list[Point]:
+    """
+    The extreme points of `center + u cos(t) + v sin(t)` for `t` from
+    `start` to `start + sweep`, together with the end points.
+    """
+
+    def at(t):
+        return Point(
+            (
+                center.x + u.x * math.cos(t) + v.x * math.sin(t),
+                center.y + u.y * math.cos(t) + v.y * math.sin(t),
+            )
+        )
+
+    def within(t):
+        if sweep >= 0:
+            return (t - start) % (2 * math.pi) <= sweep
+        return (start - t) % (2 * math.pi) <= -sweep
+
+    points = [at(start), at(start + sweep)]
+    for t in (math.atan2(v.x, u.x), math.atan2(v.y, u.y)):
+        points.extend(at(elem) for elem in (t, t + math.pi) if within(elem))
+    return points
+
+
+def _arc_points(
+    transform: Affine,
+    start: Point,
+    end: Point,
+    arc: svg.Arc | svg.ArcRel,
+) -> list[Point]:
+    """The extreme points of an elliptical arc, per SVG's implementation notes."""
+    rx, ry = abs(arc.rx), abs(arc.ry)
+    if rx == 0 or ry == 0 or start == end:
+        return [transform @ start, transform @ end]
+
+    cos, sin = math.cos(math.radians(arc.angle)), math.sin(math.radians(arc.angle))
+    half_x, half_y = (start.x - end.x) / 2, (start.y - end.y) / 2
+    x1 = cos * half_x + sin * half_y
+    y1 = -sin * half_x + cos * half_y
+
+    radii_scale = x1**2 / rx**2 + y1**2 / ry**2
+    if radii_scale > 1:
+        rx *= math.sqrt(radii_scale)
+        ry *= math.sqrt(radii_scale)
+
+    numerator = rx**2 * ry**2 - rx**2 * y1**2 - ry**2 * x1**2
+    denominator = rx**2 * y1**2 + ry**2 * x1**2
+    coefficient = math.sqrt(max(0, numerator / denominator))
+    if bool(arc.large_arc) == bool(arc.sweep):
+        coefficient = -coefficient
+    center_x = coefficient * rx * y1 / ry
+    center_y = -coefficient * ry * x1 / rx
+
+    theta_start = math.atan2((y1 - center_y) / ry, (x1 - center_x) / rx)
+    theta_end = math.atan2((-y1 - center_y) / ry, (-x1 - center_x) / rx)
+    theta_sweep = theta_end - theta_start
+    if arc.sweep and theta_sweep < 0:
+        theta_sweep += 2 * math.pi
+    elif not arc.sweep and theta_sweep > 0:
+        theta_sweep -= 2 * math.pi
+
+    center = Point(
+        (
+            cos * center_x - sin * center_y + (start.x + end.x) / 2,
+            sin * center_x + cos * center_y + (start.y + end.y) / 2,
+        )
+    )
+    return _ellipse_points(
+        transform @ center,
+        transform.linear @ Point((rx * cos, rx * sin)),
+        transform.linear @ Point((-ry * sin, ry * cos)),
+        theta_start,
+        theta_sweep,
+    )
+
+
+def _path_points(path: svg.Path, transform: Affine) -> Iterator[Point]:
+    current = start = Point((0, 0))
+    # The last control point, which the next smooth curve reflects if it is
+    # of the same kind.
+    control, control_kind = None, None
+
+    for command in path.d or ():
+        kind = None
+        match command:
+            case svg.MoveTo() | svg.MoveToRel():
+                current = start = _xy(command, None, current)
+            case svg.ClosePath():
+                yield transform @ current
+                current = start
+            case svg.HorizontalLineTo() | svg.HorizontalLineToRel():
+                yield transform @ current
+                current = Point((_xy(command, None, current, y=0).x, current.y))
+            case svg.VerticalLineTo() | svg.VerticalLineToRel():
+                yield transform @ current
+                current = Point((current.x, _xy(command, None, current, x=0).y))
+            case svg.LineTo() | svg.LineToRel():
+                yield transform @ current
+                current = _xy(command, None, current)
+            case svg.QuadraticBezier() | svg.QuadraticBezierRel():
+                p1 = _xy(command, 1, current)
+                p2 = _xy(command, None, current)
+                yield from _quadratic_points(
+                    transform @ current, transform @ p1, transform @ p2
+                )
+                current, control, kind = p2, p1, "quadratic"
+            case svg.SmoothQuadraticBezier() | svg.SmoothQuadraticBezierRel():
+                p1 = _reflect(current, control if control_kind == "quadratic" else None)
+                p2 = _xy(command, None, current)
+                yield from _quadratic_points(
+                    transform @ current, transform @ p1, transform @ p2
+                )
+                current, control, kind = p2, p1, "quadratic"
+            case svg.CubicBezier() | svg.CubicBezierRel():
+                p1 = _xy(command, 1, current)
+                p2 = _xy(command, 2, current)
+                p3 = _xy(command, None, current)
+                yield from _cubic_points(
+                    transform @ current,
+                    transform @ p1,
+                    transform @ p2,
+                    transform @ p3,
+                )
+                current, control, kind = p3, p2, "cubic"
+            case svg.SmoothCubicBezier() | svg.SmoothCubicBezierRel():
+                p1 = _reflect(current, control if control_kind == "cubic" else None)
+                p2 = _xy(command, 2, current)
+                p3 = _xy(command, None, current)
+                yield from _cubic_points(
+                    transform @ current,
+                    transform @ p1,
+                    transform @ p2,
+                    transform @ p3,
+                )
+                current, control, kind = p3, p2, "cubic"
+            case svg.Arc() | svg.ArcRel():
+                end = _xy(command, None, current)
+                yield from _arc_points(transform, current, end, command)
+                current = end
+            case _:
+                raise ValueError(f"Unknown PathData: {command}")
+        control_kind = kind
+    yield transform @ current
+
+
+def _xy(command, index: int | None, current: Point, **defaults) -> Point:
+    """
+    The point `x<index>`, `y<index>` of `command`, or `dx<index>`, `dy<index>`
+    relative to `current`. `defaults` fill in a missing coordinate.
+    """
+    suffix = "" if index is None else str(index)
+    if command.command.isupper():
+        return Point(
+            (
+                getattr(command, f"x{suffix}", defaults.get("x")),
+                getattr(command, f"y{suffix}", defaults.get("y")),
+            )
+        )
+    return current + Vector(
+        (
+            getattr(command, f"dx{suffix}", defaults.get("x")),
+            getattr(command, f"dy{suffix}", defaults.get("y")),
+        )
+    )
+
+
+def _reflect(current: Point, control: Point | None) -> Point:
+    if control is None:
+        return current
+    return Point((2 * current.x - control.x, 2 * current.y - control.y))
+
+
+def _flat_points(numbers) -> PointArray:
+    return PointArray([float(elem) for elem in numbers])
+
+
+def _number(value, default: float = 0) -> float:
+    """Plain numeric SVG lengths; percentages and units are not resolved."""
+    return default if value is None else float(value)
+
+
+def measure(elements, transform: Affine = IDENTITY) -> BoundingBox | None:
+    """The tight bounding box of `elements`, with a fresh cache."""
+    return BoundingBoxes()(elements, transform)
+
+
+# === Classes ===
+
+
+class BoundingBoxes:
+    """
+    Tight bounding boxes of svg.py element trees, like SVG's `getBBox()`.
+
+    Polygons, lines, rectangles, ellipses and paths with straight, quadratic,
+    cubic and arc segments are measured exactly, through any `transform` of
+    the elements or their ancestors. Strokes, markers, text and `<use>` are
+    not measured. Boxes are cached per element and transform for the
+    lifetime of this object, so an element must not be changed after it has
+    been measured.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def __call__(self, element, transform: Affine = IDENTITY) -> BoundingBox | None:
+        match element:
+            case None | str():
+                return None
+            case svg.Element():
+                key = (id(element), transform)
+                if key not in self._cache:
+                    # Keep the element alive so its id is not reused.
+                    self._cache[key] = (element, self._measure(element, transform))
+                return self._cache[key][1]
+            case _ if isinstance(element, Iterable):
+                return union(self(elem, transform) for elem in element)
+            case _:
+                return None
+
+    def _measure(self, element: svg.Element, transform: Affine) -> BoundingBox | None:
+        if isinstance(element, UNRENDERED_ELEMENTS):
+            return None
+        if getattr(element, "transform", None):
+            transform = transform @ Affine.from_svg(element.transform)
+
+        match element:
+            case svg.Polygon() | svg.Polyline():
+                return _array_box(transform @ _flat_points(element.points or ()))
+            case svg.Line():
+                return _array_box(
+                    transform
+                    @ PointArray(
+                        [
+                            (_number(element.x1), _number(element.y1)),
+                            (_number(element.x2), _number(element.y2)),
+                        ]
+                    )
+                )
+            case svg.Rect():
+                x, y = _number(element.x), _number(element.y)
+                width, height = _number(element.width), _number(element.height)
+                return _array_box(
+                    transform
+                    @ PointArray(
+                        [
+                            (x, y),
+                            (x + width, y),
+                            (x + width, y + height),
+                            (x, y + height),
+                        ]
+                    )
+                )
+            case svg.Circle() | svg.Ellipse():
+                if isinstance(element, svg.Circle):
+                    rx = ry = _number(element.r)
+                else:
+                    rx, ry = _number(element.rx), _number(element.ry)
+                return _points_box(
+                    _ellipse_points(
+                        transform @ Point((_number(element.cx), _number(element.cy))),
+                        transform.linear @ Point((rx, 0)),
+                        transform.linear @ Point((0, ry)),
+                    )
+                )
+            case svg.Path():
+                return _points_box(_path_points(element, transform))
+            case _:
+                return self(getattr(element, "elements", None), transform)
+
+    def of_renderable(self, renderable) -> BoundingBox | None:
+        """The measured box of everything `renderable.make_svg_elements` draws."""
+        return self(renderable.make_svg_elements())
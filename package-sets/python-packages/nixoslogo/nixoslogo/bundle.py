@@ -0,0 +1,290 @@
+import functools
+import itertools
+import json
+import logging
+import zipfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from nixoslogo.core import DEFAULT_ROUTE159_TRANSFORMS, get_nixos_logotype_font_file
+from nixoslogo.fonts import FontBackend, OutlineContour, OutlineLayer, layer_key
+from nixoslogo.logotype import FontLoader, _font_loader_key, font_loaders
+
+logger = logging.getLogger(__name__)
+
+# === Constants ===
+
+GLYPH_BUNDLE_ENVVAR = "NIXOSLOGO_GLYPH_BUNDLE"
+
+# Bump when the layout of glyph bundles changes.
+GLYPH_BUNDLE_FORMAT = 3
+
+# The arrays of a glyph bundle, besides its JSON index.
+GLYPH_BUNDLE_ARRAYS = (
+    "points",
+    "on_curve",
+    "contour_starts",
+    "glyph_contours",
+    "widths",
+    "left_side_bearings",
+    "box_keys",
+    "bounding_boxes",
+)
+
+# === Functions ===
+
+
+def bundle_key(
+    get_font_file: Callable[[], Path] = get_nixos_logotype_font_file,
+    transforms_map: dict[str, Any] = DEFAULT_ROUTE159_TRANSFORMS,
+    capHeight: int | None = None,
+    scale_glyph: bool = True,
+    offset_glyph: bool = True,
+    backend: type[FontBackend] | None = None,
+) -> str:
+    """
+    The bundle index key of the loader made with these `FontLoader` arguments.
+
+    Fonts are told apart by file name, so a bundle does not depend on where
+    the fonts are installed.
+    """
+    path, *options = _font_loader_key(
+        get_font_file, transforms_map, capHeight, scale_glyph, offset_glyph, backend
+    )
+    return json.dumps([Path(path).name, *options])
+
+
+def _load_arrays(path: Path, mmap: bool) -> dict[str, np.ndarray]:
+    """
+    The arrays of the `.npz` file at `path`, memory-mapped where possible.
+
+    `np.load` reads every array of an archive into memory. Arrays stored
+    without compression are instead mapped straight from the archive.
+    """
+    arrays = {}
+    with np.load(path) as archive:
+        if not mmap:
+            return {name: archive[name] for name in archive.files}
+        with zipfile.ZipFile(path) as zip_file, open(path, "rb") as f:
+            for info in zip_file.infolist():
+                name = info.filename.removesuffix(".npy")
+                if info.compress_type != zipfile.ZIP_STORED:
+                    arrays[name] = archive[name]
+                    continue
+                # Skip the local file header to the start of the .npy data.
+                f.seek(info.header_offset + 26)
+                name_length, extra_length = np.frombuffer(f.read(4), dtype="<u2")
+                f.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+                match np.lib.format.read_magic(f):
+                    case (1, 0):
+                        header = np.lib.format.read_array_header_1_0(f)
+                    case (2, 0):
+                        header = np.lib.format.read_array_header_2_0(f)
+                    case _:
+                        arrays[name] = archive[name]
+                        continue
+                shape, fortran_order, dtype = header
+                if dtype.hasobject or not shape:
+                    arrays[name] = archive[name]
+                    continue
+                arrays[name] = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=f.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+    return arrays
+
+
+def write_glyph_bundle(
+    path: Path,
+    loaders: Iterable[tuple[tuple, FontLoader]] = font_loaders,
+    characters: Iterable[str] | None = None,
+):
+    """
+    Write the prepared glyphs of `loaders` to a bundle at `path`.
+
+    `loaders` are the (key, loader) pairs of a `FontLoaderRegistry`. Each
+    loader contributes the glyphs it has prepared so far, or `characters`
+    if given. The contours are stored as they are after the loader's
+    transforms, with the advance widths, side bearings and cap heights.
+
+    The bounding boxes the backend measured are stored too, by `layer_key`:
+    those of the glyphs as bundled, and those the loader recorded, so that
+    a bundled layer moved the same way gets the very same box. Backends may
+    measure curves a little differently from `nixoslogo.bbox`.
+    """
+    index = {"format": GLYPH_BUNDLE_FORMAT, "loaders": {}}
+    points, on_curve, contour_starts, glyph_contours = [], [], [0], [0]
+    widths, left_side_bearings = [], []
+    bounding_boxes = {}
+
+    for key, loader in loaders:
+        if not isinstance(loader, FontLoader):
+            raise TypeError(f"Only font loaders can be bundled, got {loader}")
+        path_name, *options = key
+        glyphs = {}
+        names = loader.prepared_glyphs if characters is None else characters
+        for name in sorted(names):
+            glyph = loader.glyph(name)
+            foreground = glyph.foreground
+            for contour in foreground:
+                points.extend((point.x, point.y) for point in contour)
+                on_curve.extend(bool(point.on_curve) for point in contour)
+                contour_starts.append(len(points))
+            glyph_contours.append(len(contour_starts) - 1)
+            widths.append(glyph.width)
+            left_side_bearings.append(glyph.left_side_bearing)
+            bounding_boxes[layer_key(foreground)] = loader.bounding_box(foreground)
+            glyphs[name] = len(widths) - 1
+        bounding_boxes.update(loader.measured_boxes or {})
+        index["loaders"][json.dumps([Path(path_name).name, *options])] = {
+            "capHeight": loader.capHeight,
+            "scale": loader.scale,
+            "glyphs": glyphs,
+        }
+        logger.info(f"Bundled {len(glyphs)} glyphs of {Path(path_name).name}")
+
+    np.savez(
+        path,
+        index=np.array(json.dumps(index, sort_keys=True)),
+        points=np.array(points, dtype=np.float64).reshape(-1, 2),
+        on_curve=np.array(on_curve, dtype=bool),
+        contour_starts=np.array(contour_starts, dtype=np.int64),
+        glyph_contours=np.array(glyph_contours, dtype=np.int64),
+        widths=np.array(widths, dtype=np.float64),
+        left_side_bearings=np.array(left_side_bearings, dtype=np.float64),
+        box_keys=np.frombuffer(b"".join(bounding_boxes), dtype=np.uint8).reshape(
+            -1, 32
+        ),
+        bounding_boxes=np.array(
+            list(bounding_boxes.values()), dtype=np.float64
+        ).reshape(-1, 4),
+    )
+
+
+def build_glyph_bundle(specs: Iterable, path: Path):
+    """
+    Render `specs` in memory and bundle every glyph they use.
+
+    The artifacts are rendered from the fonts, in this process, so that the
+    shared loaders see every glyph that is asked for and record every box
+    they measure.
+    """
+    if font_loaders.bundle is not None:
+        raise ValueError("Glyph bundles have to be built from the fonts")
+    font_loaders.record_boxes = True
+    try:
+        with font_loaders.scope():
+            for spec in specs:
+                spec.build().render_bytes()
+                logger.info(f"Collected the glyphs of {spec.name}")
+            write_glyph_bundle(path)
+    finally:
+        font_loaders.record_boxes = False
+
+
+def use_glyph_bundle(path: Path | None):
+    """Serve font loaders from the glyph bundle at `path`, or from the fonts."""
+    font_loaders.bundle = None if path is None else GlyphBundle(path)
+
+
+# === Classes ===
+
+
+class BundleGlyph:
+    """A bundled glyph, like a fontforge glyph."""
+
+    def __init__(self, bundle: "GlyphBundle", index: int):
+        self.bundle = bundle
+        self.index = index
+        self.width = bundle.widths[index].item()
+        self.left_side_bearing = bundle.left_side_bearings[index].item()
+
+    @property
+    def foreground(self) -> OutlineLayer:
+        return self.bundle.layer(self.index)
+
+
+class BundleFontLoader:
+    """
+    A `FontLoader` that serves prepared glyphs from a `GlyphBundle`.
+
+    It needs neither a font backend nor the font files. `font` is the loader
+    itself, which looks glyphs up by name like a font backend.
+    """
+
+    def __init__(self, bundle: "GlyphBundle", entry: dict):
+        self.bundle = bundle
+        self.capHeight = entry["capHeight"]
+        self.scale = entry["scale"]
+        self.glyphs = entry["glyphs"]
+        self._shared = False
+
+    @property
+    def font(self) -> "BundleFontLoader":
+        return self
+
+    def glyph(self, character: str) -> BundleGlyph:
+        if character not in self.glyphs:
+            raise KeyError(f"{character!r} is not in the glyph bundle")
+        return BundleGlyph(self.bundle, self.glyphs[character])
+
+    def bounding_box(self, layer) -> tuple[float, float, float, float]:
+        """The box the font backend measured for `layer`, if bundled."""
+        box = self.bundle.boxes.get(layer_key(layer))
+        return layer.boundingBox() if box is None else box
+
+    def cleanup(self):
+        """Nothing to clean up; the bundle is only ever read."""
+
+
+class GlyphBundle:
+    """
+    Prepared glyph outlines of fonts, as written by `write_glyph_bundle`.
+
+    The arrays are memory-mapped from the file, so opening a bundle reads
+    little more than its index, and glyphs are views into the mapping until
+    they are transformed.
+    """
+
+    def __init__(self, path: Path, mmap: bool = True):
+        self.path = Path(path)
+        arrays = _load_arrays(self.path, mmap)
+        self.index = json.loads(arrays["index"].item())
+        if self.index["format"] != GLYPH_BUNDLE_FORMAT:
+            raise ValueError(f"Unsupported glyph bundle format in {self.path}")
+        for name in GLYPH_BUNDLE_ARRAYS:
+            setattr(self, name, arrays[name])
+
+    def loader(self, **kwargs) -> BundleFontLoader | None:
+        """The loader for the `FontLoader` arguments `kwargs`, if bundled."""
+        entry = self.index["loaders"].get(bundle_key(**kwargs))
+        if entry is None:
+            return None
+        return BundleFontLoader(self, entry)
+
+    def layer(self, index: int) -> OutlineLayer:
+        first, last = self.glyph_contours[index : index + 2].tolist()
+        starts = self.contour_starts[first : last + 1].tolist()
+        return OutlineLayer(
+            [
+                OutlineContour(self.points[start:stop], self.on_curve[start:stop])
+                for start, stop in itertools.pairwise(starts)
+            ]
+        )
+
+    @functools.cached_property
+    def boxes(self) -> dict[bytes, tuple]:
+        """The bundled bounding boxes, by `layer_key`."""
+        return {
+            key.tobytes(): tuple(box)
+            for key, box in zip(
+                self.box_keys, self.bounding_boxes.tolist(), strict=True
+            )
+        }
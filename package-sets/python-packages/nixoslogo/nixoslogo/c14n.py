@@ -0,0 +1,150 @@
+import re
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import svg
+from lxml import etree
+
+# === Constants ===
+
+# Attribute names that need no namespace handling.
+_PLAIN_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_.-]*")
+
+# Characters the XML parser would decode or normalize before lxml canonicalizes.
+_UNSAFE_ATTRIBUTE = re.compile(r'[&<"\t\n\r]')
+_UNSAFE_TEXT = re.compile(r"[&<\r]|]]>")
+
+WRITE_BUFFER_SIZE = 1 << 16
+
+# === Functions ===
+
+
+def _attributes(element: svg.Element) -> list[tuple[str, str]]:
+    """The attributes in the order and with the values `svg.py` writes them."""
+    attributes = list(element.as_dict().items())
+    if element.data:
+        attributes.extend(
+            (f"data-{key}", f"{value}") for key, value in element.data.items()
+        )
+    if element.extra:
+        attributes.extend(
+            (f"{key}", f"{value}") for key, value in element.extra.items()
+        )
+    return attributes
+
+
+def _is_plain(attributes: list[tuple[str, str]], text: str | None) -> bool:
+    names = [name for name, _ in attributes]
+    return (
+        len(set(names)) == len(names)
+        and all(_PLAIN_NAME.fullmatch(name) for name in names)
+        and not any(_UNSAFE_ATTRIBUTE.search(value) for _, value in attributes)
+        and not (text and _UNSAFE_TEXT.search(text))
+    )
+
+
+def _canonical_fallback(element: svg.Element, namespace: str | None) -> str:
+    """Canonicalize an unusual element with lxml, inside its namespace scope."""
+    materialize(element)
+    start = "<r>" if namespace is None else f'<r xmlns="{namespace}">'
+    canonical = etree.canonicalize(f"{start}{element}</r>")
+    return canonical[len(start) : -len("</r>")]
+
+
+def _iter_content(value: Any, namespace: str | None) -> Iterator[str]:
+    match value:
+        case None:
+            return
+        case svg.Element():
+            yield from _iter_element(value, namespace)
+        case list() | tuple() | Iterator():
+            # `svg.py` joins nested sequences with spaces.
+            for index, elem in enumerate(value):
+                if index:
+                    yield " "
+                yield from _iter_content(elem, namespace)
+        case _:
+            text = svg.Element._as_str(value)
+            if _UNSAFE_TEXT.search(text):
+                yield etree.canonicalize(f"<r>{text}</r>")[len("<r>") : -len("</r>")]
+            else:
+                yield text.replace(">", "&gt;")
+
+
+def _iter_element(element: svg.Element, namespace: str | None) -> Iterator[str]:
+    attributes = _attributes(element)
+    if not _is_plain(attributes, element.text):
+        yield _canonical_fallback(element, namespace)
+        return
+
+    declarations = ""
+    plain = []
+    for name, value in attributes:
+        if name != "xmlns":
+            plain.append((name, value))
+        elif value != namespace:
+            if not value:
+                yield _canonical_fallback(element, namespace)
+                return
+            declarations = f' xmlns="{value}"'
+            namespace = value
+
+    name = element.element_name
+    yield f"<{name}{declarations}"
+    yield "".join(f' {key}="{value}"' for key, value in sorted(plain))
+    yield ">"
+    if element.text:
+        yield element.text.replace(">", "&gt;")
+    elif element.elements:
+        for elem in element.elements:
+            yield from _iter_content(elem, namespace)
+    yield f"</{name}>"
+
+
+def materialize(value: Any) -> Any:
+    """
+    Replace the element iterators in `value` with tuples, in place.
+
+    Element producers may return iterators, which `iter_canonical` consumes
+    lazily but `str()` from `svg.py` cannot serialize.
+    """
+    match value:
+        case svg.Element():
+            if value.elements is not None:
+                value.elements = materialize(value.elements)
+            return value
+        case list() | tuple() | Iterator():
+            return tuple(materialize(elem) for elem in value)
+        case _:
+            return value
+
+
+def iter_canonical(element: svg.Element) -> Iterator[str]:
+    """
+    Serialize `element` as canonical XML, piece by piece.
+
+    The output is the same as `lxml.etree.canonicalize(str(element))`, but the
+    document is never built as a string and parsed again. The rare elements
+    with text or attributes the XML parser would rewrite, such as entity
+    references, are handed to lxml one subtree at a time.
+    """
+    return _iter_element(element, None)
+
+
+def write_canonical(
+    element: svg.Element,
+    write: Callable[[str], Any],
+    buffer_size: int = WRITE_BUFFER_SIZE,
+):
+    """Write `iter_canonical(element)` to `write` in chunks of `buffer_size`."""
+    chunks = []
+    size = 0
+    for chunk in iter_canonical(element):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            write("".join(chunks))
+            chunks.clear()
+            size = 0
+    if chunks:
+        write("".join(chunks))
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import nixoslogo
+from nixoslogo.core import (
+    get_nixos_annotation_font_file,
+    get_nixos_color_palette_file,
+    get_nixos_logotype_font_file,
+)
+from nixoslogo.fonts import get_font_backend
+from nixoslogo.logotype import font_loaders
+
+logger = logging.getLogger(__name__)
+
+# === Constants ===
+
+CACHE_DIR_ENVVAR = "NIXOSLOGO_CACHE_DIR"
+CACHE_MAX_SIZE_ENVVAR = "NIXOSLOGO_CACHE_MAX_SIZE"
+
+DEFAULT_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+# Bump when the layout of cache entries changes.
+CACHE_FORMAT = 1
+
+# === Functions ===
+
+
+@cache
+def _file_digest(path: Path, mtime_ns: int, size: int) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    stat = path.stat()
+    return _file_digest(path.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+def _optional_file_digest(get_file) -> str | None:
+    try:
+        return file_digest(get_file())
+    except OSError:
+        return None
+
+
+@cache
+def source_digest() -> str:
+    """Digest of the `nixoslogo` sources, so editable installs invalidate too."""
+    digest = hashlib.sha256()
+    root = Path(nixoslogo.__file__).parent
+    for path in sorted(root.rglob("*.py")):
+        digest.update(str(path.relative_to(root)).encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def package_version() -> str:
+    try:
+        return metadata.version("nixoslogo")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def render_environment() -> dict[str, Any]:
+    """Inputs besides the constructor parameters that affect the output."""
+    return {
+        "format": CACHE_FORMAT,
+        "version": package_version(),
+        "source": source_digest(),
+        "logotype_font": _optional_file_digest(get_nixos_logotype_font_file),
+        "annotations_font": _optional_file_digest(get_nixos_annotation_font_file),
+        "font_backend": (font_loaders.backend or get_font_backend()).name,
+        "palette": _optional_file_digest(get_nixos_color_palette_file),
+    }
+
+
+def make_cache_key(payload: Any) -> str:
+    document = {"environment": render_environment(), "payload": payload}
+    dump = json.dumps(document, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(dump.encode("utf-8")).hexdigest()
+
+
+def get_default_cache() -> "RenderCache | None":
+    """Cache configured by `NIXOSLOGO_CACHE_DIR`, if set."""
+    directory = os.getenv(CACHE_DIR_ENVVAR)
+    if not directory:
+        return None
+    max_size = int(os.getenv(CACHE_MAX_SIZE_ENVVAR, DEFAULT_CACHE_MAX_SIZE))
+    return RenderCache(directory=Path(directory), max_size=max_size)
+
+
+# === Classes ===
+
+
+@dataclass(kw_only=True)
+class CacheEntry:
+    filename: str
+    data: bytes
+
+
+class RenderCache:
+    """
+    Content-addressed store of rendered SVGs.
+
+    Entries are named by a hash of everything that affects the output and
+    evicted least-recently-used first once the directory exceeds `max_size`
+    bytes. Recency is tracked with the modification time of the entries.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+    ):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.evict()
+
+    def _svg_path(self, key: str) -> Path:
+        return self.directory / f"{key}.svg"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            with open(self._meta_path(key), "rb") as f:
+                meta = json.load(f)
+            data = self._svg_path(key).read_bytes()
+        except (FileNotFoundError, json.JSONDecodeError):
+            logger.debug(f"Cache miss: {key}")
+            return None
+        self._touch(key)
+        logger.debug(f"Cache hit: {key}")
+        return CacheEntry(filename=meta["filename"], data=data)
+
+    def put(self, key: str, entry: CacheEntry):
+        # The SVG goes first so a visible meta file always has its data.
+        self._write_atomic(self._svg_path(key), entry.data)
+        self._write_atomic(
+            self._meta_path(key),
+            json.dumps({"filename": entry.filename}).encode("utf-8"),
+        )
+        self.evict()
+
+    def _touch(self, key: str):
+        for path in (self._svg_path(key), self._meta_path(key)):
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+
+    def _write_atomic(self, path: Path, data: bytes):
+        fd, temp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp, path)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits `max_size`."""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.svg"):
+            try:
+                stat = path.stat()
+                meta_size = self._meta_path(path.stem).stat().st_size
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, path.stem, stat.st_size + meta_size))
+            total += stat.st_size + meta_size
+
+        for _, key, size in sorted(entries):
+            if total <= self.max_size:
+                break
+            logger.debug(f"Evicting cache entry: {key}")
+            self._meta_path(key).unlink(missing_ok=True)
+            self._svg_path(key).unlink(missing_ok=True)
+            total -= size
@@ -1,3 +1,6 @@
+import io
+import itertools
+import logging
 import os
 import string
 from abc import ABC, abstractmethod
@@ -7,10 +10,13 @@ from pathlib import Path
 
 import svg
 import tomllib
-from lxml import etree
 
+from nixoslogo.c14n import iter_canonical, materialize, write_canonical
 from nixoslogo.colors import Color
 from nixoslogo.layout import Canvas
+from nixoslogo.optimize import optimize
+
+logger = logging.getLogger(__name__)
 
 # === Functions ===
 
@@ -158,6 +164,12 @@ class LogotypeStyle(Enum):
     LAMBDAPRIME = auto()
 
 
+class FontOpenMode(Enum):
+    COPY = auto()  # a fresh copy of the font file per loader
+    SHARED_COPY = auto()  # one copy per font file contents, shared by loaders
+    DIRECT = auto()  # the font file itself, which is only ever read
+
+
 # === Base Classes ===
 
 
@@ -166,10 +178,13 @@ class BaseRenderable(ABC):
         self,
         canvas: Canvas | None = None,
         background_color: str | None = None,
+        tolerance: float | None = None,
         **kwargs,
     ):
         self.canvas = canvas
         self.background_color = background_color
+        self.tolerance = tolerance
+        self.optimize_report = None
         self._init_canvas()
 
     @property
@@ -187,19 +202,9 @@ class BaseRenderable(ABC):
 
     def _init_canvas(self):
         if self.canvas is None:
-            min_x, min_y, max_x, max_y = self.elements_bounding_box
-            clear_space = self._get_clearspace()
-
-            min_x -= clear_space
-            min_y -= clear_space
-            max_x += clear_space
-            max_y += clear_space
-
-            self.canvas = Canvas(
-                min_x=min_x,
-                min_y=min_y,
-                width=max_x - min_x,
-                height=max_y - min_y,
+            self.canvas = Canvas.around(
+                self.elements_bounding_box,
+                clear_space=self._get_clearspace(),
             )
 
     @property
@@ -218,18 +223,76 @@ class BaseRenderable(ABC):
             else self.canvas.make_svg_background(fill=self.background_color)
         )
 
-    def make_svg(self):
-        return svg.SVG(
+    def make_svg(self, lazy: bool = False):
+        """
+        Build the SVG document.
+
+        `make_svg_elements` may return a tuple or an iterator of elements. With
+        `lazy`, iterators are left for the serializer to consume one element at
+        a time; otherwise they are collected so that `str()` works.
+
+        With a `tolerance`, the coordinates of the elements are rounded and
+        redundant vertices dropped, moving nothing by more than `tolerance`;
+        the outcome is kept in `optimize_report`.
+        """
+        elements = self.make_svg_elements()
+        if self.tolerance is not None:
+            elements, self.optimize_report = optimize(elements, self.tolerance)
+            logger.info(
+                f"Optimized {type(self).__name__}: "
+                f"max deviation {self.optimize_report.max_deviation:.3g}, "
+                f"{self.optimize_report.vertices_removed} vertices removed"
+            )
+        document = svg.SVG(
             viewBox=self.canvas.make_view_box(),
-            elements=self.make_svg_background() + self.make_svg_elements(),
+            elements=itertools.chain(self.make_svg_background(), elements),
         )
+        return document if lazy else materialize(document)
 
-    def write_svg(self, filename=None):
+    def make_svg_filename(self, filename=None) -> str:
         if filename is None:
             filename = self.make_filename()
-        filename = filename.replace("/", "_")
-        with open(Path(filename + ".svg"), "w", encoding="utf-8") as file:
-            etree.canonicalize(str(self.make_svg()), out=file)
+        return filename.replace("/", "_") + ".svg"
+
+    def render_bytes(self) -> bytes:
+        """Return the canonical SVG as UTF-8 bytes."""
+        return "".join(iter_canonical(self.make_svg(lazy=True))).encode("utf-8")
+
+    def render_to(self, target):
+        """
+        Stream the canonical SVG to `target` as it is serialized.
+
+        `target` can be a path, a binary or text stream, or an object with an
+        `update` method such as a `hashlib` hash. Only a path touches the
+        filesystem.
+        """
+        match target:
+            case str() | os.PathLike():
+                with open(target, "wb") as file:
+                    self.render_to(file)
+                return
+            case io.TextIOBase():
+                write_canonical(self.make_svg(lazy=True), target.write)
+                return
+            case _ if hasattr(target, "write"):
+                sink = target.write
+            case _ if hasattr(target, "update"):
+                sink = target.update
+            case _:
+                raise TypeError(f"Cannot render to {target!r}")
+        write_canonical(
+            self.make_svg(lazy=True), lambda text: sink(text.encode("utf-8"))
+        )
+
+    def write_svg(self, filename=None, directory=None) -> Path:
+        """
+        Write the canonical SVG to `directory` as `<filename>.svg`.
+
+        `filename` defaults to `make_filename()`, with `/` replaced by `_`.
+        """
+        path = Path(directory or ".") / self.make_svg_filename(filename)
+        self.render_to(path)
+        return path
 
     @property
     def elements_x_min(self):
@@ -0,0 +1,386 @@
+import argparse
+import ast
+import json
+import logging
+import subprocess
+import sys
+import tomllib
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import coloraide
+
+import nixoslogo
+from nixoslogo.core import NIXOS_COLOR_PALETTE, get_path_from_envvar
+from nixoslogo.specs import CALL_TAG, REF_TAG, ArtifactSpec, load_manifest
+
+logger = logging.getLogger(__name__)
+
+# === Constants ===
+
+PACKAGE_ROOT = Path(nixoslogo.__file__).parent
+
+# Repository paths, relative to the repository root.
+NIXOSLOGO_DIR = "package-sets/python-packages/nixoslogo/"
+NIXOSLOGO_SOURCE_DIR = NIXOSLOGO_DIR + "nixoslogo/"
+ARTIFACTS_DIR = "package-sets/top-level/nixos-branding/artifacts/"
+PALETTE_FILE = "package-sets/top-level/nixos-branding/nixos-color-palette/colors.toml"
+FONT_SOURCES = {
+    "NIXOS_LOGOTYPE_FONT_FILE": "package-sets/top-level/route159/",
+    "NIXOS_ANNOTATIONS_FONT_FILE": "package-sets/top-level/jura/",
+}
+# Changes to these affect every artifact.
+GLOBAL_INPUTS = (
+    "flake.lock",
+    "package-sets/top-level/nixos-branding/artifact-builder/",
+    "package-sets/top-level/nixos-branding/nixos-color-palette/package.nix",
+    NIXOSLOGO_DIR + "package.nix",
+    NIXOSLOGO_DIR + "poetry.lock",
+    NIXOSLOGO_DIR + "pyproject.toml",
+)
+
+# === Functions ===
+
+
+def module_name(path: Path) -> str:
+    """Dotted module name of a file below the `nixoslogo` package."""
+    parts = ("nixoslogo",) + path.relative_to(PACKAGE_ROOT).with_suffix("").parts
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+def _imported_modules(tree: ast.Module, name: str, is_package: bool) -> set[str]:
+    package = name if is_package else name.rpartition(".")[0]
+    imported = set()
+    # Imports inside functions count too, they can still change the output.
+    for node in ast.walk(tree):
+        match node:
+            case ast.Import():
+                imported.update(alias.name for alias in node.names)
+            case ast.ImportFrom():
+                base = node.module or ""
+                if node.level:
+                    parent = package.rsplit(".", node.level - 1)[0]
+                    base = f"{parent}.{base}" if base else parent
+                imported.add(base)
+                imported.update(f"{base}.{alias.name}" for alias in node.names)
+    return imported
+
+
+def import_graph() -> dict[str, set[str]]:
+    """Map every `nixoslogo` module to the `nixoslogo` modules it imports."""
+    paths = {module_name(path): path for path in PACKAGE_ROOT.rglob("*.py")}
+    graph = {}
+    for name, path in paths.items():
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+        imported = _imported_modules(tree, name, path.name == "__init__.py")
+        graph[name] = {elem for elem in imported if elem in paths} - {name}
+    return graph
+
+
+def module_closure(roots: Iterable[str], graph: dict[str, set[str]]) -> set[str]:
+    """`roots`, the modules they import, and the packages that contain them."""
+    seen = set()
+    stack = list(roots)
+    while stack:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        stack.extend(graph[name])
+        # Importing a module runs the `__init__` of every enclosing package.
+        parent = name.rpartition(".")[0]
+        if parent:
+            stack.append(parent)
+    return seen
+
+
+def _dotted_paths(value: Any) -> Iterable[str]:
+    if isinstance(value, dict):
+        for tag in (REF_TAG, CALL_TAG):
+            if tag in value:
+                yield value[tag]
+        for elem in value.values():
+            yield from _dotted_paths(elem)
+    elif isinstance(value, list):
+        for elem in value:
+            yield from _dotted_paths(elem)
+
+
+def spec_modules(spec: ArtifactSpec, graph: dict[str, set[str]]) -> set[str]:
+    """Modules a spec needs, found by following imports from what it names."""
+    roots = set()
+    for path in (spec.renderable, *_dotted_paths(spec.kwargs)):
+        parts = path.split(".")
+        for index in range(len(parts), 0, -1):
+            if ".".join(parts[:index]) in graph:
+                roots.add(".".join(parts[:index]))
+                break
+    return module_closure(roots, graph)
+
+
+def palette_entries(palette: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """
+    Flatten a color palette into `section/name` keys for every named color.
+
+    The other values of a named color, such as its tints, get keys of their
+    own so that changing them does not count as changing the color.
+    """
+    entries = {}
+    for key, value in palette.items():
+        path = f"{prefix}.{key}" if prefix else key
+        match value:
+            case dict():
+                entries |= palette_entries(value, path)
+            case [dict(), *_] if all("name" in elem for elem in value):
+                for elem in value:
+                    entry = f"{path}/{elem['name']}"
+                    for field_name, field_value in elem.items():
+                        if field_name == "value":
+                            entries[entry] = field_value
+                        elif field_name != "name":
+                            entries[f"{entry}/{field_name}"] = field_value
+            case _:
+                entries[path] = value
+    return entries
+
+
+def _palette_colors(palette: dict[str, Any]) -> dict[tuple, set[str]]:
+    colors = {}
+    for entry, value in palette_entries(palette).items():
+        if isinstance(value, list) and all(
+            isinstance(elem, int | float) for elem in value
+        ):
+            key = tuple(float(elem) for elem in value)
+            colors.setdefault(key, set()).add(entry)
+    return colors
+
+
+def trace_inputs(spec: ArtifactSpec) -> tuple[set[str], set[str]]:
+    """
+    Render `spec` in memory and record the palette entries and fonts it reads.
+
+    Palette colors are only ever used through methods of the colors made from
+    them, so watching which palette colors receive calls finds the entries
+    an artifact depends on. Fonts are found through their environment
+    variables.
+    """
+    colors = _palette_colors(NIXOS_COLOR_PALETTE)
+    color_files = (
+        str(Path(coloraide.__file__).parent),
+        str(PACKAGE_ROOT / "colors.py"),
+    )
+    palette = set()
+    fonts = set()
+
+    def profile(frame, event, arg):
+        if event != "call":
+            return
+        code = frame.f_code
+        if code is get_path_from_envvar.__code__:
+            envvar = frame.f_locals["envvar"]
+            if envvar in FONT_SOURCES:
+                fonts.add(envvar)
+        elif (
+            code.co_filename.startswith(color_files)
+            and code.co_varnames[:1] == ("self",)
+            and code.co_name != "__init__"
+        ):
+            thing = frame.f_locals.get("self")
+            if isinstance(thing, coloraide.Color) and thing.space() == "oklch":
+                palette.update(colors.get(tuple(thing.coords()), ()))
+
+    previous = sys.getprofile()
+    sys.setprofile(profile)
+    try:
+        spec.build().render_bytes()
+    finally:
+        sys.setprofile(previous)
+    return palette, fonts
+
+
+def analyze(specs: Iterable[ArtifactSpec]) -> list["ArtifactDependencies"]:
+    graph = import_graph()
+    dependencies = []
+    for spec in specs:
+        palette, fonts = trace_inputs(spec)
+        dependencies.append(
+            ArtifactDependencies(
+                name=spec.name,
+                output=spec.output,
+                modules=sorted(spec_modules(spec, graph)),
+                palette=sorted(palette),
+                fonts=sorted(fonts),
+            )
+        )
+        logger.info(f"Analyzed {spec.name}")
+    return dependencies
+
+
+def save_dependencies(path: Path, dependencies: Iterable["ArtifactDependencies"]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([asdict(elem) for elem in dependencies], f, indent=2)
+        f.write("\n")
+
+
+def load_dependencies(path: Path) -> list["ArtifactDependencies"]:
+    with open(path, "rb") as f:
+        return [ArtifactDependencies(**elem) for elem in json.load(f)]
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def _git_show(repo: Path, revision: str, path: str) -> str | None:
+    try:
+        return _git(repo, "show", f"{revision}:{path}")
+    except subprocess.CalledProcessError:
+        return None
+
+
+def changed_inputs(repo: Path, revision: str, manifest: Path) -> "ChangedInputs":
+    """Inputs that differ between `revision` and the working tree of `repo`."""
+    changes = ChangedInputs()
+    manifest_path = manifest.resolve().relative_to(repo.resolve()).as_posix()
+    for path in _git(repo, "diff", "--name-only", revision, "--").splitlines():
+        if path.startswith(GLOBAL_INPUTS):
+            changes.everything = True
+        elif path.startswith(NIXOSLOGO_SOURCE_DIR) and path.endswith(".py"):
+            changes.modules.add(
+                module_name(PACKAGE_ROOT / path.removeprefix(NIXOSLOGO_SOURCE_DIR))
+            )
+        elif path == PALETTE_FILE:
+            old = tomllib.loads(_git_show(repo, revision, path) or "")
+            with open(repo / path, "rb") as f:
+                new = tomllib.load(f)
+            old, new = palette_entries(old), palette_entries(new)
+            changes.palette.update(
+                key for key in old.keys() | new.keys() if old.get(key) != new.get(key)
+            )
+        elif path == manifest_path:
+            old = json.loads(_git_show(repo, revision, path) or '{"artifacts": []}')
+            old = {elem["name"]: elem for elem in old["artifacts"]}
+            with open(manifest, "rb") as f:
+                new = {elem["name"]: elem for elem in json.load(f)["artifacts"]}
+            changes.artifacts.update(name for name in new if old.get(name) != new[name])
+        elif path.startswith(ARTIFACTS_DIR):
+            changes.outputs.add(path.removeprefix(ARTIFACTS_DIR).rpartition("/")[0])
+        else:
+            for envvar, source in FONT_SOURCES.items():
+                if path.startswith(source):
+                    changes.fonts.add(envvar)
+    return changes
+
+
+def affected_artifacts(
+    dependencies: Iterable["ArtifactDependencies"], changes: "ChangedInputs"
+) -> list[str]:
+    return [elem.name for elem in dependencies if elem.affected_by(changes)]
+
+
+# === Classes ===
+
+
+@dataclass(kw_only=True)
+class ArtifactDependencies:
+    name: str
+    output: str
+    modules: list[str]
+    palette: list[str]
+    fonts: list[str]
+
+    def affected_by(self, changes: "ChangedInputs") -> bool:
+        return (
+            changes.everything
+            or self.name in changes.artifacts
+            or self.output in changes.outputs
+            or not changes.modules.isdisjoint(self.modules)
+            or not changes.palette.isdisjoint(self.palette)
+            or not changes.fonts.isdisjoint(self.fonts)
+        )
+
+
+@dataclass(kw_only=True)
+class ChangedInputs:
+    everything: bool = False
+    artifacts: set[str] = field(default_factory=set)
+    outputs: set[str] = field(default_factory=set)
+    modules: set[str] = field(default_factory=set)
+    palette: set[str] = field(default_factory=set)
+    fonts: set[str] = field(default_factory=set)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m nixoslogo.deps",
+        description="Find the artifacts affected by a change.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    analyze_parser = subparsers.add_parser(
+        "analyze",
+        help="record the modules, palette entries and fonts of every artifact",
+    )
+    analyze_parser.add_argument("manifest", type=Path)
+    analyze_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        required=True,
+        help="JSON file the dependencies are written to",
+    )
+
+    affected_parser = subparsers.add_parser(
+        "affected",
+        help="print the artifacts affected by the changes since a revision",
+    )
+    affected_parser.add_argument("manifest", type=Path)
+    affected_parser.add_argument(
+        "--since",
+        default="HEAD",
+        metavar="REV",
+        help="git revision to compare the working tree with (default: HEAD)",
+    )
+    affected_parser.add_argument(
+        "--dependencies",
+        type=Path,
+        metavar="PATH",
+        help="dependencies recorded by `analyze`; analyzed now if not given",
+    )
+    affected_parser.add_argument(
+        "--repo",
+        type=Path,
+        default=Path("."),
+        help="root of the repository (default: the current directory)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    match args.command:
+        case "analyze":
+            save_dependencies(args.output, analyze(load_manifest(args.manifest)))
+        case "affected":
+            if args.dependencies is not None:
+                dependencies = load_dependencies(args.dependencies)
+            else:
+                dependencies = analyze(load_manifest(args.manifest))
+            changes = changed_inputs(args.repo, args.since, args.manifest)
+            for name in affected_artifacts(dependencies, changes):
+                print(name)
+        case _:
+            raise ValueError(f"Unknown command: {args.command}")
+
+
+if __name__ == "__main__":
+    main()
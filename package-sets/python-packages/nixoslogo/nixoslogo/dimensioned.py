@@ -1,15 +1,158 @@
 import math
+from collections.abc import Sequence
 
 import svg
 from svg._types import Number
 
-from nixoslogo.annotations import Annotations
+from nixoslogo.annotations import Annotations, DimensionLines, TextAnnotations
+from nixoslogo.bbox import measure
 from nixoslogo.core import ClearSpace
 from nixoslogo.geometry import Point, Points
+from nixoslogo.helpers import arc_sagitta
 from nixoslogo.layout import Canvas
 from nixoslogo.logo import NixosLogo
 from nixoslogo.logomark import Lambda, Logomark
 from nixoslogo.logotype import Logotype
+from nixoslogo.placement import Candidate, Label, PlacementSolver, polygon_segments
+
+# === Constants ===
+
+# Offsets tried for an automatically placed dimension line, nearest first.
+# Lines drawn over what they measure try these after an offset of zero, as
+# their text can only sit on one side of the line.
+PLACEMENT_OFFSETS = (1 / 8, 1 / 4, 3 / 8, 1 / 2)
+
+# Distances tried for an automatically placed dimension line around the
+# logotype, nearest first, in logotype cap heights.
+PLACEMENT_DISTANCES = (1 / 8, 1 / 4, 3 / 8, 1 / 2, 3 / 4, 1)
+
+# Directions tried for an automatically placed vertex label, as (x, y) steps.
+PLACEMENT_DIRECTIONS = (
+    (1, 0),
+    (-1, 0),
+    (1, -1),
+    (-1, -1),
+    (1, 1),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+)
+
+# Arc positions tried for an automatically placed angle, as fractions of the
+# shorter arm; beyond about 4 / 7 the arc no longer fits a 120 degree angle.
+PLACEMENT_RATIOS = (1 / 2, 3 / 8, 1 / 4)
+
+# === Functions ===
+
+
+def _line_segments(elements):
+    """The segments of the `svg.Line`s among `elements`."""
+    return [
+        ((elem.x1, elem.y1), (elem.x2, elem.y2))
+        for elem in elements
+        if isinstance(elem, svg.Line)
+    ]
+
+
+def _add_obstacles(solver: PlacementSolver, elements):
+    """Make the lines among `elements` and the boxes of the rest obstacles."""
+    solver.add_obstacle_segments(_line_segments(elements))
+    for elem in elements:
+        if not isinstance(elem, svg.Line):
+            solver.add_obstacle_box(measure(elem))
+
+
+def _arc_segments(path: svg.Path):
+    """Two chords standing in for the single arc of `path`."""
+    move, arc = path.d
+    start, end = Point((move.x, move.y)), Point((arc.x, arc.y))
+    middle, _ = arc_sagitta(start, end, arc.rx, arc.large_arc, arc.sweep)
+    return [(start, middle), (middle, end)]
+
+
+def dimension_line_candidates(
+    dimension_lines: DimensionLines,
+    point1: Point,
+    point2: Point,
+    center: Point,
+    offsets: Sequence[float],
+    outer: bool = False,
+    **kwargs,
+):
+    """
+    Dimension lines along `point1` to `point2`, nearest first.
+
+    At each offset, the line on the side away from `center` is tried
+    before the one towards it, and the text is turned to read upright.
+    `outer` draws the arrows outside the measured length instead.
+    """
+    make_dimension_line = (
+        dimension_lines.make_dimension_line_outer
+        if outer
+        else dimension_lines.make_dimension_line
+    )
+    outward = (point1 + point2) / 2 - center
+    flips = sorted(
+        (False, True),
+        key=lambda flip: (
+            -((point1 - point2) if not flip else (point2 - point1))
+            .normal()
+            .dot(outward)
+        ),
+    )
+    for offset in offsets:
+        for flip in flips:
+            start, end = (point2, point1) if flip else (point1, point2)
+            side = "left" if (end - start).normal().y < 0 else "right"
+            elements = make_dimension_line(
+                point1=point1,
+                point2=point2,
+                flip=flip,
+                side=side,
+                offset=offset,
+                **kwargs,
+            )
+            yield Candidate(
+                box=measure(elements[-1]),
+                segments=_line_segments(elements),
+                value=elements,
+            )
+
+
+def label_candidates(point: Point, annotation: TextAnnotations, center: Point):
+    """Offsets of `annotation` around `point`, facing away from `center` first."""
+    min_x, min_y, max_x, max_y = measure(annotation.make_svg_elements())
+    gap = annotation.elements_height / 2
+    outward = point - center
+    for step_x, step_y in sorted(
+        PLACEMENT_DIRECTIONS,
+        key=lambda step: -outward.dot(step) / math.hypot(*step),
+    ):
+        dx = step_x * ((max_x - min_x) / 2 + gap) - (min_x + max_x) / 2
+        dy = step_y * ((max_y - min_y) / 2 + gap) - (min_y + max_y) / 2
+        yield Candidate(
+            box=(
+                point.x + dx + min_x,
+                point.y + dy + min_y,
+                point.x + dx + max_x,
+                point.y + dy + max_y,
+            ),
+            value=(dx, dy),
+        )
+
+
+def place_label(point: Point, annotation: TextAnnotations, candidate: Candidate):
+    """`annotation` moved next to `point` by the offset `candidate` chose."""
+    return svg.G(
+        transform=[
+            svg.Translate(point.x, point.y),
+            svg.Translate(*candidate.value),
+        ],
+        elements=annotation.make_svg_elements(),
+    )
+
+
+# === Classes ===
 
 
 class DimensionedLambda(Lambda):
@@ -17,11 +160,13 @@ class DimensionedLambda(Lambda):
         self,
         annotations: Annotations,
         clear_space: ClearSpace = ClearSpace.NONE,
+        auto_place: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.annotations = annotations
         self.clear_space = clear_space
+        self.auto_place = auto_place
 
     def _init_canvas(self):
         if self.canvas is None:
@@ -100,6 +245,29 @@ class DimensionedLambda(Lambda):
             ),
         )
 
+    def make_lambda_center(self) -> Point:
+        points = self.make_lambda_points(gap=0)
+        return Point(
+            (
+                sum(point.x for point in points) / len(points),
+                sum(point.y for point in points) / len(points),
+            )
+        )
+
+    def make_placement_solver(self) -> PlacementSolver:
+        """A solver that keeps labels on the canvas and off the drawn lines."""
+        solver = PlacementSolver(
+            cell_size=self.radius / 8,
+            bounds=self.canvas.bounding_box,
+            margin=self.radius / 64,
+        )
+        for points in (self.make_lambda_points(gap=0), self.make_lambda_points()):
+            solver.add_obstacle_segments(polygon_segments(points))
+        diagonal = self.make_diagonal_line(radius=self.radius)
+        solver.add_obstacle_segments([(diagonal[0], diagonal[1])])
+        solver.add_obstacle_segments(_line_segments(self.make_lambda_off_diagonal()))
+        return solver
+
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
             [
@@ -112,51 +280,59 @@ class DimensionedLambda(Lambda):
 
 
 class DimensionedLambdaLinear(DimensionedLambda):
-    def make_lambda_linear_dimensions(self):
+    def make_lambda_linear_dimension_points(self):
         hexagon_points = self.make_hexagon_points(radius=self.radius)
         lambda_points_no_gap = self.make_lambda_points(gap=0)
         lambda_points_gap = self.make_named_lambda_points()
 
-        dim_main_diagonal = self.annotations.dimension_lines.make_dimension_line(
-            point1=hexagon_points[1],
-            point2=hexagon_points[4],
-            flip=False,
-            side="right",
-            offset=1 / 2,
-            reference=2 * self.radius,
+        return (
+            (hexagon_points[1], hexagon_points[4]),
+            (
+                (lambda_points_gap["forward_tip"] + lambda_points_gap["forward_heel"])
+                / 2,
+                (lambda_points_gap["upper_notch"] + lambda_points_gap["upper_apex"])
+                / 2,
+            ),
+            (lambda_points_gap["upper_apex"], lambda_points_gap["forward_tip"]),
+            (lambda_points_gap["midpoint_join"], lambda_points_gap["upper_notch"]),
+        ) + tuple(
+            (
+                lambda_points_no_gap[(index + 0) % 9],
+                lambda_points_no_gap[(index + 1) % 9],
+            )
+            for index in range(9)
         )
 
-        dim_gap_diagonal = self.annotations.dimension_lines.make_dimension_line(
-            point1=(
-                lambda_points_gap["forward_tip"] + lambda_points_gap["forward_heel"]
+    def place_lambda_linear_dimensions(self):
+        center = self.make_lambda_center()
+        labels = [
+            Label(
+                candidates=dimension_line_candidates(
+                    self.annotations.dimension_lines,
+                    point1,
+                    point2,
+                    center,
+                    offsets=PLACEMENT_OFFSETS,
+                    reference=2 * self.radius,
+                ),
+                priority=point1.distance(point2),
             )
-            / 2,
-            point2=(lambda_points_gap["upper_notch"] + lambda_points_gap["upper_apex"])
-            / 2,
-            flip=False,
-            side="right",
-            offset=15 / 32,
-            reference=2 * self.radius,
-        )
-        dim_gap_long_edge = self.annotations.dimension_lines.make_dimension_line(
-            point1=lambda_points_gap["upper_apex"],
-            point2=lambda_points_gap["forward_tip"],
-            flip=True,
-            side="right",
-            offset=7 / 16,
-            reference=2 * self.radius,
-        )
-        dim_gap_left_top = self.annotations.dimension_lines.make_dimension_line(
-            point1=lambda_points_gap["midpoint_join"],
-            point2=lambda_points_gap["upper_notch"],
-            flip=False,
-            side="right",
-            offset=1 / 8,
-            reference=2 * self.radius,
+            for point1, point2 in self.make_lambda_linear_dimension_points()
+        ]
+        return tuple(
+            candidate.value for candidate in self.make_placement_solver().place(labels)
         )
 
+    def make_lambda_linear_dimensions(self):
+        if self.auto_place:
+            return self.place_lambda_linear_dimensions()
+
         # fmt: off
         options = [
+            {"side": "right", "flip": False, "offset": 1 / 2},
+            {"side": "right", "flip": False, "offset": 15 / 32},
+            {"side": "right", "flip": True,  "offset": 7 / 16},
+            {"side": "right", "flip": False, "offset": 1 / 8},
             {"side": "right", "flip": True,  "offset": 1 / 4},
             {"side": "right", "flip": True,  "offset": 15 / 32},
             {"side": "left",  "flip": True,  "offset": 1 / 4},
@@ -169,31 +345,26 @@ class DimensionedLambdaLinear(DimensionedLambda):
         ]
         # fmt: on
 
-        return (
-            dim_main_diagonal,
-            dim_gap_diagonal,
-            dim_gap_long_edge,
-            dim_gap_left_top,
-        ) + tuple(
+        return tuple(
             self.annotations.dimension_lines.make_dimension_line(
-                point1=lambda_points_no_gap[(index + 0) % 9],
-                point2=lambda_points_no_gap[(index + 1) % 9],
+                point1=point1,
+                point2=point2,
                 reference=2 * self.radius,
                 **opts,
             )
-            for index, opts in enumerate(options)
+            for (point1, point2), opts in zip(
+                self.make_lambda_linear_dimension_points(), options
+            )
         )
 
     def make_svg_elements(self):
-        return (
-            self.canvas.make_axis_lines()
-            + self.annotations.dimension_lines.make_dimension_arrow_defs()
-            + self.make_lambda_construction_lines()
-            + self.make_lambda_main_diagonal()
-            + self.make_lambda_off_diagonal()
-            + self.make_lambda_polygons()
-            + self.make_lambda_linear_dimensions()
-        )
+        yield from self.canvas.make_axis_lines()
+        yield from self.annotations.dimension_lines.make_dimension_arrow_defs()
+        yield from self.make_lambda_construction_lines()
+        yield from self.make_lambda_main_diagonal()
+        yield from self.make_lambda_off_diagonal()
+        yield from self.make_lambda_polygons()
+        yield from self.make_lambda_linear_dimensions()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
@@ -206,7 +377,63 @@ class DimensionedLambdaLinear(DimensionedLambda):
 
 
 class DimensionedLambdaAngular(DimensionedLambda):
+    def make_angle_dimension_candidates(self, point1, point2, reference, text):
+        """Arcs across the angle at `reference`, outermost first."""
+        vector1, vector2 = point1 - reference, point2 - reference
+        # Draw the arc through the angle itself rather than around the outside.
+        flip = vector1.x * vector2.y < vector1.y * vector2.x
+        for ratio in PLACEMENT_RATIOS:
+            elements = self.annotations.dimension_lines.make_dimension_angle(
+                point1=point1,
+                point2=point2,
+                reference=reference,
+                flip=flip,
+                large=False,
+                side="left",
+                ratio=ratio,
+                text=text,
+            )
+            yield Candidate(
+                box=measure(elements[1]),
+                segments=_arc_segments(elements[0]),
+                value=elements,
+            )
+
+    def place_lambda_angular_dimensions(self):
+        lambda_points = self.make_lambda_points()
+        corners = [
+            (
+                lambda_points[(index + 0) % 9],
+                lambda_points[(index + 2) % 9],
+                lambda_points[(index + 1) % 9],
+            )
+            for index in range(9)
+        ]
+        # Equal angles share a letter, from the smallest angle up.
+        angles = [
+            round(math.degrees((point1 - reference).angle_from(point2 - reference)))
+            for point1, point2, reference in corners
+        ]
+        letters = {
+            angle: chr(ord("A") + index)
+            for index, angle in enumerate(sorted(set(angles)))
+        }
+        labels = [
+            Label(
+                candidates=self.make_angle_dimension_candidates(
+                    point1, point2, reference, letters[angle]
+                )
+            )
+            for (point1, point2, reference), angle in zip(corners, angles)
+        ]
+        return tuple(
+            candidate.value for candidate in self.make_placement_solver().place(labels)
+        )
+
     def make_lambda_angular_dimensions(self):
+        if self.auto_place:
+            return self.place_lambda_angular_dimensions()
+
         lambda_points_no_gap = self.make_lambda_points()
         # fmt: off
         options = [
@@ -232,14 +459,12 @@ class DimensionedLambdaAngular(DimensionedLambda):
             for index, opts in enumerate(options)
         )
 
-    def make_svg_elements(self) -> svg.SVG:
-        return (
-            self.canvas.make_axis_lines()
-            + self.annotations.dimension_lines.make_dimension_arrow_defs()
-            + self.make_lambda_construction_lines()
-            + self.make_lambda_polygons()
-            + self.make_lambda_angular_dimensions()
-        )
+    def make_svg_elements(self):
+        yield from self.canvas.make_axis_lines()
+        yield from self.annotations.dimension_lines.make_dimension_arrow_defs()
+        yield from self.make_lambda_construction_lines()
+        yield from self.make_lambda_polygons()
+        yield from self.make_lambda_angular_dimensions()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
@@ -263,7 +488,31 @@ class DimensionedLambdaAnnotatedVertices(DimensionedLambda):
             for point in self.make_lambda_points()
         )
 
+    def place_named_lambda_vertices(self):
+        center = self.make_lambda_center()
+        solver = self.make_placement_solver()
+        for dot in self.make_dotted_lambda_vertices():
+            solver.add_obstacle_box(measure(dot))
+
+        named_annotations = [
+            (point, self.annotations.make_annotation(text=name.replace("_", " ")))
+            for name, point in self.make_named_lambda_points().items()
+        ]
+        chosen = solver.place(
+            [
+                Label(candidates=label_candidates(point, annotation, center))
+                for point, annotation in named_annotations
+            ]
+        )
+        return tuple(
+            place_label(point, annotation, candidate)
+            for (point, annotation), candidate in zip(named_annotations, chosen)
+        )
+
     def make_named_lambda_vertices(self):
+        if self.auto_place:
+            return self.place_named_lambda_vertices()
+
         named_points = self.make_named_lambda_points()
         translations = [
             lambda elem: [
@@ -340,16 +589,14 @@ class DimensionedLambdaAnnotatedVertices(DimensionedLambda):
             for point, annotation, translation in named_annotations.values()
         )
 
-    def make_svg_elements(self) -> svg.SVG:
-        return (
-            self.canvas.make_axis_lines()
-            + self.make_lambda_construction_lines()
-            + self.make_lambda_main_diagonal()
-            + self.make_lambda_off_diagonal()
-            + self.make_lambda_polygons()
-            + self.make_dotted_lambda_vertices()
-            + self.make_named_lambda_vertices()
-        )
+    def make_svg_elements(self):
+        yield from self.canvas.make_axis_lines()
+        yield from self.make_lambda_construction_lines()
+        yield from self.make_lambda_main_diagonal()
+        yield from self.make_lambda_off_diagonal()
+        yield from self.make_lambda_polygons()
+        yield from self.make_dotted_lambda_vertices()
+        yield from self.make_named_lambda_vertices()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
@@ -363,21 +610,9 @@ class DimensionedLambdaAnnotatedVertices(DimensionedLambda):
 
 
 class DimensionedLambdaAnnotatedParameters(DimensionedLambda):
-    def make_parametric_annotations(self):
-        hexagon_points = self.make_hexagon_points(radius=self.radius)
-        lambda_points_no_gap = self.make_named_lambda_points(gap=0)
+    def make_thickness_points(self):
         lambda_points_gap = self.make_named_lambda_points()
-
-        radius = self.annotations.dimension_lines.make_dimension_line(
-            point1=Point((0, 0)),
-            point2=hexagon_points[5],
-            flip=False,
-            side="left",
-            offset=0,
-            text="radius",
-        )
-
-        thickness_points = [
+        return [
             Point((0, 0)),
             Point((self.radius * self.thickness, 0)),
             Point(
@@ -391,6 +626,95 @@ class DimensionedLambdaAnnotatedParameters(DimensionedLambda):
             / 2,
             Point(lambda_points_gap["midpoint_join"]),
         ]
+
+    def place_parametric_annotations(self):
+        hexagon_points = self.make_hexagon_points(radius=self.radius)
+        lambda_points_no_gap = self.make_named_lambda_points(gap=0)
+        lambda_points_gap = self.make_named_lambda_points()
+        center = self.make_lambda_center()
+        dimension_lines = self.annotations.dimension_lines
+
+        thickness_points = self.make_thickness_points()
+        thickness_lines = tuple(
+            dimension_lines.make_dimension_line(
+                point1=thickness_points[(index + 0) % len(thickness_points)],
+                point2=thickness_points[(index + 1) % len(thickness_points)],
+                flip=False,
+                side="left",
+                offset=0,
+                text="",
+            )
+            for index in range(len(thickness_points))
+        )
+        solver = self.make_placement_solver()
+        for elements in thickness_lines:
+            solver.add_obstacle_segments(_line_segments(elements))
+
+        thickness_annotation = self.annotations.make_annotation(text="thickness")
+        radius, thickness, gap = solver.place(
+            [
+                Label(
+                    candidates=dimension_line_candidates(
+                        dimension_lines,
+                        Point((0, 0)),
+                        hexagon_points[5],
+                        center,
+                        offsets=(0,) + PLACEMENT_OFFSETS,
+                        text="radius",
+                    ),
+                ),
+                Label(
+                    candidates=label_candidates(
+                        thickness_points[3], thickness_annotation, center
+                    ),
+                ),
+                Label(
+                    candidates=dimension_line_candidates(
+                        dimension_lines,
+                        (
+                            lambda_points_gap["upper_notch"]
+                            + lambda_points_gap["upper_apex"]
+                        )
+                        / 2,
+                        (
+                            lambda_points_no_gap["upper_notch"]
+                            + lambda_points_no_gap["upper_apex"]
+                        )
+                        / 2,
+                        center,
+                        offsets=(0,),
+                        outer=True,
+                        text="gap",
+                        text_offset=True,
+                    ),
+                ),
+            ]
+        )
+        return (
+            radius.value
+            + thickness_lines
+            + (place_label(thickness_points[3], thickness_annotation, thickness),)
+            + gap.value
+        )
+
+    def make_parametric_annotations(self):
+        if self.auto_place:
+            return self.place_parametric_annotations()
+
+        hexagon_points = self.make_hexagon_points(radius=self.radius)
+        lambda_points_no_gap = self.make_named_lambda_points(gap=0)
+        lambda_points_gap = self.make_named_lambda_points()
+
+        radius = self.annotations.dimension_lines.make_dimension_line(
+            point1=Point((0, 0)),
+            point2=hexagon_points[5],
+            flip=False,
+            side="left",
+            offset=0,
+            text="radius",
+        )
+
+        thickness_points = self.make_thickness_points()
         thickness_annotation = self.annotations.make_annotation(text="thickness")
         thickness = tuple(
             self.annotations.dimension_lines.make_dimension_line(
@@ -432,16 +756,14 @@ class DimensionedLambdaAnnotatedParameters(DimensionedLambda):
 
         return radius + thickness + gap
 
-    def make_svg_elements(self) -> svg.SVG:
-        return (
-            self.canvas.make_axis_lines()
-            + self.annotations.dimension_lines.make_dimension_arrow_defs()
-            + self.make_lambda_construction_lines()
-            + self.make_lambda_main_diagonal()
-            + self.make_lambda_off_diagonal()
-            + self.make_lambda_polygons()
-            + self.make_parametric_annotations()
-        )
+    def make_svg_elements(self):
+        yield from self.canvas.make_axis_lines()
+        yield from self.annotations.dimension_lines.make_dimension_arrow_defs()
+        yield from self.make_lambda_construction_lines()
+        yield from self.make_lambda_main_diagonal()
+        yield from self.make_lambda_off_diagonal()
+        yield from self.make_lambda_polygons()
+        yield from self.make_parametric_annotations()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
@@ -458,10 +780,12 @@ class DimensionedLogomark(Logomark):
     def __init__(
         self,
         annotations: Annotations,
+        auto_place: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.annotations = annotations
+        self.auto_place = auto_place
 
     def _init_canvas(self):
         if self.canvas is None:
@@ -503,7 +827,54 @@ class DimensionedLogomark(Logomark):
             ),
         )
 
+    def make_placement_solver(self) -> PlacementSolver:
+        """A solver that keeps labels on the canvas and off the drawn lines."""
+        radius = self.ilambda.radius
+        solver = PlacementSolver(
+            cell_size=radius / 4,
+            bounds=self.canvas.bounding_box,
+            margin=radius / 64,
+        )
+        for points in self.make_flake_points():
+            solver.add_obstacle_segments(polygon_segments(points))
+        for hexagon_radius in (radius, radius * 2.25):
+            solver.add_obstacle_segments(
+                polygon_segments(
+                    self.ilambda.make_hexagon_points(radius=hexagon_radius)
+                )
+            )
+        diagonal = self.ilambda.make_diagonal_line(radius=radius * 2.25)
+        solver.add_obstacle_segments([(diagonal[0], diagonal[1])])
+        return solver
+
+    def place_flake_linear_dimensions(self):
+        flake_points = self.make_flake_points()
+        hexagon_points = self.ilambda.make_hexagon_points(radius=self.ilambda.radius)
+        labels = [
+            Label(
+                candidates=dimension_line_candidates(
+                    self.annotations.dimension_lines,
+                    point1,
+                    point2,
+                    Point((0, 0)),
+                    offsets=PLACEMENT_OFFSETS,
+                    reference=2 * self.ilambda.radius,
+                ),
+                priority=point1.distance(point2),
+            )
+            for point1, point2 in (
+                (hexagon_points[1], hexagon_points[4]),
+                (flake_points[2][6], flake_points[5][6]),
+            )
+        ]
+        return tuple(
+            candidate.value for candidate in self.make_placement_solver().place(labels)
+        )
+
     def make_flake_linear_dimensions(self):
+        if self.auto_place:
+            return self.place_flake_linear_dimensions()
+
         flake_points = self.make_flake_points()
         hexagon_points = self.ilambda.make_hexagon_points(radius=self.ilambda.radius)
 
@@ -546,14 +917,12 @@ class DimensionedLogomark(Logomark):
         )
 
     def make_svg_elements(self):
-        return (
-            self.make_flake_polygons_for_dimensions()
-            + self.canvas.make_axis_lines()
-            + self.annotations.dimension_lines.make_dimension_arrow_defs()
-            + self.ilambda.make_lambda_construction_lines()
-            + self.make_flake_construction_lines()
-            + self.make_flake_linear_dimensions()
-        )
+        yield from self.make_flake_polygons_for_dimensions()
+        yield from self.canvas.make_axis_lines()
+        yield from self.annotations.dimension_lines.make_dimension_arrow_defs()
+        yield from self.ilambda.make_lambda_construction_lines()
+        yield from self.make_flake_construction_lines()
+        yield from self.make_flake_linear_dimensions()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
@@ -571,10 +940,12 @@ class DimensionedLogomarkGradient(Logomark):
     def __init__(
         self,
         annotations: Annotations,
+        auto_place: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.annotations = annotations
+        self.auto_place = auto_place
 
     def _init_canvas(self):
         if self.canvas is None:
@@ -585,7 +956,24 @@ class DimensionedLogomarkGradient(Logomark):
                 height=4 * self.ilambda.radius,
             )
 
-    def make_dimensioned_gradient_lines(self):
+    def make_placement_solver(self) -> PlacementSolver:
+        """A solver that keeps labels on the canvas and off the drawn lines."""
+        radius = self.ilambda.radius
+        solver = PlacementSolver(
+            cell_size=radius / 8,
+            bounds=self.canvas.bounding_box,
+            margin=radius / 64,
+        )
+        for points in (
+            self.ilambda.make_hexagon_points(radius=radius),
+            self.ilambda.make_lambda_points(gap=0),
+            self.ilambda.make_lambda_points(),
+        ):
+            solver.add_obstacle_segments(polygon_segments(points))
+        return solver
+
+    def make_gradient_stops(self):
+        """The gradient line and the points and labels of its stops."""
         gradient_end_points = self.make_gradient_end_points()
         point_start = Point((gradient_end_points["x1"], gradient_end_points["y1"]))
         point_stop = Point((gradient_end_points["x2"], gradient_end_points["y2"]))
@@ -600,24 +988,58 @@ class DimensionedLogomarkGradient(Logomark):
             for offset in self._gradient_stop_offsets
         ]
 
-        return tuple(
+        elements = [
+            svg.Line(
+                **gradient_end_points,
+                stroke=self.annotations.construction_lines.stroke,
+                stroke_width=self.annotations.construction_lines.stroke_width,
+                stroke_dasharray=self.annotations.construction_lines.stroke_dasharray,
+            ),
+        ] + [
+            svg.Circle(
+                cx=stop_point.x,
+                cy=stop_point.y,
+                r=2 * self.annotations.construction_lines.stroke_width,
+                fill=self.annotations.construction_lines.stroke,
+            )
+            for stop_point in stop_points
+        ]
+        return elements, stop_points, text_annotations
+
+    def make_gradient_annotation_labels(self) -> list[Label]:
+        """Labels of the dimensions drawn over the gradient line, if any."""
+        return []
+
+    def place_gradient_labels(self) -> list[Candidate]:
+        """The chosen stop labels, then the chosen gradient annotation labels."""
+        elements, stop_points, text_annotations = self.make_gradient_stops()
+        solver = self.make_placement_solver()
+        _add_obstacles(solver, elements)
+
+        center = self.ilambda.make_lambda_center()
+        return solver.place(
             [
-                svg.Line(
-                    **gradient_end_points,
-                    stroke=self.annotations.construction_lines.stroke,
-                    stroke_width=self.annotations.construction_lines.stroke_width,
-                    stroke_dasharray=self.annotations.construction_lines.stroke_dasharray,
-                ),
-            ]
-            + [
-                svg.Circle(
-                    cx=stop_point.x,
-                    cy=stop_point.y,
-                    r=2 * self.annotations.construction_lines.stroke_width,
-                    fill=self.annotations.construction_lines.stroke,
-                )
-                for stop_point in stop_points
+                Label(candidates=label_candidates(stop_point, text_annotation, center))
+                for stop_point, text_annotation in zip(stop_points, text_annotations)
             ]
+            + self.make_gradient_annotation_labels()
+        )
+
+    def make_dimensioned_gradient_lines(self):
+        elements, stop_points, text_annotations = self.make_gradient_stops()
+        if self.auto_place:
+            return tuple(
+                elements
+                + [
+                    place_label(stop_point, text_annotation, candidate)
+                    for stop_point, text_annotation, candidate in zip(
+                        stop_points, text_annotations, self.place_gradient_labels()
+                    )
+                ]
+            )
+
+        return tuple(
+            elements
             + [
                 svg.G(
                     transform=[
@@ -634,13 +1056,11 @@ class DimensionedLogomarkGradient(Logomark):
         )
 
     def make_svg_elements(self):
-        return (
-            self.canvas.make_axis_lines()
-            + self.annotations.dimension_lines.make_dimension_arrow_defs()
-            + self.ilambda.make_lambda_construction_lines()
-            + self.ilambda.make_lambda_polygons()
-            + self.make_dimensioned_gradient_lines()
-        )
+        yield from self.canvas.make_axis_lines()
+        yield from self.annotations.dimension_lines.make_dimension_arrow_defs()
+        yield from self.ilambda.make_lambda_construction_lines()
+        yield from self.ilambda.make_lambda_polygons()
+        yield from self.make_dimensioned_gradient_lines()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
@@ -655,7 +1075,41 @@ class DimensionedLogomarkGradient(Logomark):
 
 
 class DimensionedLogomarkGradientAnnotated(DimensionedLogomarkGradient):
+    def make_gradient_annotation_labels(self) -> list[Label]:
+        gradient_end_points = self.make_gradient_end_points()
+        point_start = Point((gradient_end_points["x1"], gradient_end_points["y1"]))
+        point_stop = Point((gradient_end_points["x2"], gradient_end_points["y2"]))
+        lambda_points_no_gap = self.ilambda.make_named_lambda_points(gap=0)
+        center = self.ilambda.make_lambda_center()
+
+        # These only have two candidates each, so they go before the stops.
+        return [
+            Label(
+                candidates=dimension_line_candidates(
+                    self.annotations.dimension_lines,
+                    point1,
+                    point2,
+                    center,
+                    offsets=(0,) + PLACEMENT_OFFSETS,
+                    reference=2 * self.ilambda.radius,
+                    text=text,
+                ),
+                priority=1,
+            )
+            for point1, point2, text in (
+                (lambda_points_no_gap["upper_notch"], point_start, "V"),
+                (lambda_points_no_gap["upper_apex"], point_start, "H"),
+                (lambda_points_no_gap["joint_crotch"], point_stop, "H"),
+            )
+        ]
+
     def make_gradient_annotations(self):
+        if self.auto_place:
+            stops = len(self._gradient_stop_offsets)
+            return tuple(
+                candidate.value for candidate in self.place_gradient_labels()[stops:]
+            )
+
         gradient_end_points = self.make_gradient_end_points()
         point_start = Point((gradient_end_points["x1"], gradient_end_points["y1"]))
         point_stop = Point((gradient_end_points["x2"], gradient_end_points["y2"]))
@@ -692,7 +1146,8 @@ class DimensionedLogomarkGradientAnnotated(DimensionedLogomarkGradient):
         )
 
     def make_svg_elements(self):
-        return super().make_svg_elements() + self.make_gradient_annotations()
+        yield from super().make_svg_elements()
+        yield from self.make_gradient_annotations()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
@@ -706,11 +1161,11 @@ class DimensionedLogomarkGradientAnnotated(DimensionedLogomarkGradient):
 
 class DimensionedLogomarkGradientBackground(DimensionedLogomarkGradient):
     def make_svg_elements(self):
-        return (
-            self.make_flake_gradients_defs()
-            + self.canvas.make_svg_background(fill=f"url(#{self.css_color_names[0]})")
-            + super().make_svg_elements()
+        yield from self.make_flake_gradients_defs()
+        yield from self.canvas.make_svg_background(
+            fill=f"url(#{self.css_color_names[0]})"
         )
+        yield from super().make_svg_elements()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
@@ -726,25 +1181,120 @@ class DimensionedLogotype(Logotype):
     def __init__(
         self,
         annotations: Annotations,
+        auto_place: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.annotations = annotations
+        self.auto_place = auto_place
+
+    def make_placement_solver(self) -> PlacementSolver:
+        """A solver that keeps labels on the canvas and off the glyphs."""
+        solver = PlacementSolver(
+            cell_size=self.cap_height / 4,
+            bounds=self.canvas.bounding_box,
+            margin=self.cap_height / 64,
+        )
+        solver.add_obstacle_box(self.elements_bounding_box)
+        return solver
+
+    def make_edge_dimension_candidates(self, edges, **kwargs):
+        """Dimension lines along each of `edges` in turn, nearest first."""
+        center = Point(
+            (
+                (self.elements_x_min + self.elements_x_max) / 2,
+                (self.elements_y_min + self.elements_y_max) / 2,
+            )
+        )
+        for point1, point2 in edges:
+            length = point1.distance(point2)
+            yield from dimension_line_candidates(
+                self.annotations.dimension_lines,
+                point1,
+                point2,
+                center,
+                offsets=[
+                    distance * self.cap_height / length
+                    for distance in PLACEMENT_DISTANCES
+                ],
+                reference=self.cap_height,
+                **kwargs,
+            )
+
+    def place_logotype_dimensions(self):
+        """The width, height, cap height and spacing dimensions, placed."""
+        top, bottom = self.elements_y_min, self.elements_y_max
+        left, right = self.elements_x_min, self.elements_x_max
+        glyph = self.glyphs[0]
+        labels = [
+            Label(
+                candidates=self.make_edge_dimension_candidates(
+                    [
+                        (Point((right, top)), Point((left, top))),
+                        (Point((right, bottom)), Point((left, bottom))),
+                    ],
+                    fractional=False,
+                ),
+            ),
+            Label(
+                candidates=self.make_edge_dimension_candidates(
+                    [
+                        (Point((right, bottom)), Point((right, top))),
+                        (Point((left, bottom)), Point((left, top))),
+                    ],
+                    fractional=False,
+                ),
+            ),
+            # The short dimensions have the least room, so they go first.
+            Label(
+                candidates=self.make_edge_dimension_candidates(
+                    [
+                        (
+                            Point((glyph.elements_x_min, glyph.elements_y_min)),
+                            Point((glyph.elements_x_min, glyph.elements_y_max)),
+                        ),
+                    ],
+                ),
+                priority=1,
+            ),
+        ] + [
+            Label(
+                candidates=self.make_edge_dimension_candidates(
+                    [
+                        (Point((x_max, top)), Point((x_min, top))),
+                        (Point((x_max, bottom)), Point((x_min, bottom))),
+                    ],
+                    text_offset=True,
+                    fractional=False,
+                ),
+                priority=1,
+            )
+            for x_max, x_min in zip(
+                (glyph.elements_x_max for glyph in self.glyphs[:-1]),
+                (glyph.elements_x_min for glyph in self.glyphs[1:]),
+            )
+        ]
+        return [
+            candidate.value for candidate in self.make_placement_solver().place(labels)
+        ]
 
     def svg_bounding_box(self):
         bbox = self.elements_bounding_box
+        rect = svg.Rect(
+            x=bbox[0],
+            y=bbox[1],
+            width=self.elements_width,
+            height=self.elements_height,
+            stroke=self.annotations.construction_lines.stroke,
+            stroke_width=self.annotations.construction_lines.stroke_width,
+            stroke_dasharray=self.annotations.construction_lines.stroke_dasharray,
+            fill="transparent",
+        )
+        if self.auto_place:
+            return (rect,) + tuple(self.place_logotype_dimensions()[:2])
 
         return (
-            svg.Rect(
-                x=bbox[0],
-                y=bbox[1],
-                width=self.elements_width,
-                height=self.elements_height,
-                stroke=self.annotations.construction_lines.stroke,
-                stroke_width=self.annotations.construction_lines.stroke_width,
-                stroke_dasharray=self.annotations.construction_lines.stroke_dasharray,
-                fill="transparent",
-            ),
+            rect,
             self.annotations.dimension_lines.make_dimension_line(
                 point1=Point((self.elements_x_max, self.elements_y_min)),
                 point2=Point((self.elements_x_min, self.elements_y_min)),
@@ -766,6 +1316,9 @@ class DimensionedLogotype(Logotype):
         )
 
     def dimension_cap_height(self):
+        if self.auto_place:
+            return tuple(self.place_logotype_dimensions()[2:3])
+
         point1 = Point((self.glyphs[0].elements_x_min, self.glyphs[0].elements_y_min))
         point2 = Point((self.glyphs[0].elements_x_min, self.glyphs[0].elements_y_max))
         return (
@@ -780,6 +1333,9 @@ class DimensionedLogotype(Logotype):
         )
 
     def dimension_spacings(self):
+        if self.auto_place:
+            return tuple(self.place_logotype_dimensions()[3:])
+
         points = [
             (
                 Point((self.glyphs[index + 0].elements_x_max, self.elements_y_min)),
@@ -806,12 +1362,10 @@ class DimensionedLogotype(Logotype):
         )
 
     def make_svg_elements(self):
-        return (
-            self.svg_bounding_box()
-            + self.dimension_cap_height()
-            + self.dimension_spacings()
-            + super().make_svg_elements()
-        )
+        yield from self.svg_bounding_box()
+        yield from self.dimension_cap_height()
+        yield from self.dimension_spacings()
+        yield from super().make_svg_elements()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
@@ -828,10 +1382,24 @@ class DimensionedLogo(NixosLogo):
     def __init__(
         self,
         annotations: Annotations,
+        auto_place: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.annotations = annotations
+        self.auto_place = auto_place
+
+    def make_placement_solver(self) -> PlacementSolver:
+        """A solver that keeps labels on the canvas and off the logo and guides."""
+        solver = PlacementSolver(
+            cell_size=self.logotype_cap_height / 4,
+            bounds=self.canvas.bounding_box,
+            margin=self.logotype_cap_height / 64,
+        )
+        for elements in super().make_svg_elements():
+            solver.add_obstacle_box(measure(elements))
+        _add_obstacles(solver, self.dimension_cap_height())
+        return solver
 
     def dimension_cap_height(self):
         return (
@@ -855,17 +1423,49 @@ class DimensionedLogo(NixosLogo):
             ),
         )
 
+    def make_bearing_points(self):
+        return (
+            Point((self.logomark.circumradius, 0)),
+            Point(
+                (
+                    self.logomark.circumradius
+                    + self.logotype.scale * self.logotype_spacings[0],
+                    0,
+                )
+            ),
+        )
+
+    def place_bearing_dimension(self):
+        point1, point2 = self.make_bearing_points()
+        length = point1.distance(point2)
+        label = Label(
+            candidates=dimension_line_candidates(
+                self.annotations.dimension_lines,
+                point1,
+                point2,
+                Point((0, 0)),
+                offsets=[
+                    distance * self.logotype_cap_height / length
+                    for distance in PLACEMENT_DISTANCES
+                ],
+                reference=self.logotype_cap_height,
+                text_offset=True,
+                fractional=False,
+            ),
+        )
+        return tuple(
+            candidate.value for candidate in self.make_placement_solver().place([label])
+        )
+
     def dimension_bearing(self):
+        if self.auto_place:
+            return self.place_bearing_dimension()
+
+        point1, point2 = self.make_bearing_points()
         return (
             self.annotations.dimension_lines.make_dimension_line(
-                point1=Point((self.logomark.circumradius, 0)),
-                point2=Point(
-                    (
-                        self.logomark.circumradius
-                        + self.logotype.scale * self.logotype_spacings[0],
-                        0,
-                    )
-                ),
+                point1=point1,
+                point2=point2,
                 offset=2.5,
                 reference=self.logotype_cap_height,
                 text_offset=True,
@@ -874,11 +1474,9 @@ class DimensionedLogo(NixosLogo):
         )
 
     def make_svg_elements(self):
-        return (
-            self.dimension_cap_height()
-            + self.dimension_bearing()
-            + super().make_svg_elements()
-        )
+        yield from self.dimension_cap_height()
+        yield from self.dimension_bearing()
+        yield from super().make_svg_elements()
 
     def make_filename(self, extras: tuple[str] = ()) -> str:
         return "-".join(
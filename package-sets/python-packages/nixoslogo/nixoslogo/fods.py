@@ -0,0 +1,157 @@
+import argparse
+import logging
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from nixoslogo.cache import RenderCache, get_default_cache
+from nixoslogo.logotype import font_loaders, get_font_open_mode
+from nixoslogo.nar import nar_hash_files
+from nixoslogo.render import (
+    BATCH_FONT_OPEN_MODE,
+    digest_artifacts,
+    select_artifacts,
+)
+from nixoslogo.specs import ArtifactSpec, load_manifest
+
+logger = logging.getLogger(__name__)
+
+# === Constants ===
+
+OUTPUT_HASH_PATTERN = re.compile(r'(outputHash\s*=\s*")([^"]*)(")')
+
+# === Functions ===
+
+
+def read_output_hash(package: Path) -> str:
+    match = OUTPUT_HASH_PATTERN.search(package.read_text(encoding="utf-8"))
+    if match is None:
+        raise ValueError(f"No outputHash found in {package}")
+    return match.group(2)
+
+
+def write_output_hash(package: Path, output_hash: str):
+    text = package.read_text(encoding="utf-8")
+    text = OUTPUT_HASH_PATTERN.sub(
+        lambda match: match.group(1) + output_hash + match.group(3), text, count=1
+    )
+    package.write_text(text, encoding="utf-8")
+
+
+def predict_output_hashes(
+    specs: list[ArtifactSpec],
+    artifacts_dir: Path,
+    jobs: int = 1,
+    cache: RenderCache | None = None,
+) -> list["OutputHash"]:
+    """
+    Render `specs` in memory and hash the would-be FOD outputs.
+
+    Each artifact derivation copies the SVG its script writes into `$out`,
+    so the NAR hash of a directory holding just that file is its
+    `outputHash`. Nothing is written to disk.
+    """
+    hashes = []
+    for result in digest_artifacts(specs, jobs=jobs, cache=cache):
+        package = artifacts_dir / result.spec.output / "package.nix"
+        hashes.append(
+            OutputHash(
+                spec=result.spec,
+                package=package,
+                specified=read_output_hash(package),
+                got=nar_hash_files({result.path.name: result.data}),
+            )
+        )
+    return hashes
+
+
+# === Classes ===
+
+
+@dataclass(kw_only=True)
+class OutputHash:
+    spec: ArtifactSpec
+    package: Path
+    specified: str
+    got: str
+
+    @property
+    def matches(self) -> bool:
+        return self.specified == self.got
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m nixoslogo.fods",
+        description=(
+            "Predict the outputHash of the artifact fixed-output derivations "
+            "by rendering them in-process."
+        ),
+    )
+    parser.add_argument(
+        "manifest",
+        type=Path,
+        help="JSON manifest of artifact specs",
+    )
+    parser.add_argument(
+        "--artifacts-dir",
+        type=Path,
+        metavar="DIR",
+        help="directory holding the artifact package.nix files "
+        "(default: the directory of the manifest)",
+    )
+    parser.add_argument(
+        "-a",
+        "--artifact",
+        action="append",
+        dest="artifacts",
+        metavar="NAME",
+        help="only check the named artifact; may be repeated",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="number of worker processes; 0 uses one per CPU (default: 0)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        metavar="DIR",
+        help="directory of previously rendered artifacts to reuse "
+        "(default: $NIXOSLOGO_CACHE_DIR, if set)",
+    )
+    parser.add_argument(
+        "--write",
+        action="store_true",
+        help="rewrite mismatching outputHash values instead of failing",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    artifacts_dir = args.artifacts_dir or args.manifest.parent
+    specs = select_artifacts(load_manifest(args.manifest), args.artifacts)
+    cache = RenderCache(directory=args.cache) if args.cache else get_default_cache()
+    font_loaders.open_mode = get_font_open_mode(default=BATCH_FONT_OPEN_MODE)
+
+    start = time.perf_counter()
+    hashes = predict_output_hashes(specs, artifacts_dir, jobs=args.jobs, cache=cache)
+    logger.info(f"Hashed {len(hashes)} artifacts in {time.perf_counter() - start:.3f}s")
+
+    mismatches = [elem for elem in hashes if not elem.matches]
+    for elem in mismatches:
+        logger.info(f"{elem.spec.name}: specified: {elem.specified} got: {elem.got}")
+        if args.write:
+            write_output_hash(elem.package, elem.got)
+            logger.info(f"Updated {elem.package}")
+
+    if mismatches and not args.write:
+        raise SystemExit(f"{len(mismatches)} outputHash values are out of date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+import hashlib
+import os
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple, Protocol
+
+import numpy as np
+import svg
+
+from nixoslogo.bbox import measure
+
+# === Constants ===
+
+FONT_BACKEND_ENVVAR = "NIXOSLOGO_FONT_BACKEND"
+
+# Capitals with flat tops, whose most common height is the cap height.
+CAP_HEIGHT_GLYPHS = "HIEFTZBDKLNPRX"
+
+# === Functions ===
+
+
+def layer_key(layer) -> bytes:
+    """
+    A digest of the points of the contours of a font layer.
+
+    Layers with the same points, to the bit, have the same key.
+    """
+    digest = hashlib.sha256()
+    for contour in layer:
+        if isinstance(contour, OutlineContour):
+            points = contour.points
+        else:
+            points = [(point.x, point.y) for point in contour]
+        digest.update(np.asarray(points, dtype=np.float64).tobytes())
+        digest.update(b"|")
+    return digest.digest()
+
+
+def layer_path(layer) -> list[svg.PathData]:
+    """The svg.py path data of the contours of a font layer."""
+    path = []
+    for contour in layer:
+        first_iteration = True
+        points = list(contour)
+
+        # If last point is a control point
+        if not points[-1].on_curve:
+            points.append(points[0])
+
+        while points:
+            # First iteration of a contour should always be a move.
+            if first_iteration:
+                point = points.pop(0)
+                element = svg.MoveTo(point.x, point.y)
+                path.append(element)
+                first_iteration = False
+                continue
+
+            if points[0].on_curve:
+                # If the next point is on curve, it is a straight line from the previous point.
+                point = points.pop(0)
+                element = svg.LineTo(point.x, point.y)
+                path.append(element)
+                continue
+            if not points[0].on_curve and points[1].on_curve:
+                # If the next point is off curve and the following point is on curve,
+                # it is a quadratic Bézier curve. So take the next 2 points.
+                points_bezier = [
+                    elem
+                    for pair in (
+                        (point.x, point.y)
+                        for point in (points.pop(0) for _ in range(2))
+                    )
+                    for elem in pair
+                ]
+                element = svg.QuadraticBezier(*points_bezier)
+                path.append(element)
+            else:
+                # If the next two points are off curve, it is a cubic Bézier curve.
+                # So take the next 3 points.
+                points_bezier = [
+                    elem
+                    for pair in (
+                        (point.x, point.y)
+                        for point in (points.pop(0) for _ in range(3))
+                    )
+                    for elem in pair
+                ]
+                element = svg.CubicBezier(*points_bezier)
+                path.append(element)
+
+    return path
+
+
+def _read_contours(glyph_set, name: str) -> list[list[tuple[tuple, bool]]]:
+    """
+    The contours of glyph `name` of a fontTools glyph set, as lists of
+    (point, on_curve) pairs, with its components drawn in.
+
+    Quadratic splines are split into single curves at their implied on-curve
+    points. Like fontforge, a closed contour ends before it is back at its
+    first point.
+    """
+    from fontTools.pens.basePen import (
+        decomposeQuadraticSegment,
+        decomposeSuperBezierSegment,
+    )
+    from fontTools.pens.recordingPen import DecomposingRecordingPen
+
+    pen = DecomposingRecordingPen(glyph_set)
+    glyph_set[name].draw(pen)
+    contours = []
+    for operator, points in pen.value:
+        match operator:
+            case "moveTo":
+                contours.append([(points[0], True)])
+            case "lineTo":
+                contours[-1].append((points[0], True))
+            case "curveTo":
+                for first, second, point in decomposeSuperBezierSegment(points):
+                    contours[-1].extend(
+                        [(first, False), (second, False), (point, True)]
+                    )
+            case "qCurveTo":
+                if points[-1] is None:
+                    # A contour of only off-curve points starts between the
+                    # last and the first of them.
+                    (x0, y0), (x1, y1) = points[-2], points[0]
+                    start = ((x0 + x1) / 2, (y0 + y1) / 2)
+                    contours.append([(start, True)])
+                    points = points[:-1] + (start,)
+                for control, point in decomposeQuadraticSegment(points):
+                    contours[-1].extend([(control, False), (point, True)])
+            case "closePath":
+                contour = contours[-1]
+                if len(contour) > 1 and contour[-1] == contour[0]:
+                    contour.pop()
+            case "endPath":
+                pass
+            case _:
+                raise ValueError(f"Unknown pen operator: {operator}")
+    return contours
+
+
+def get_font_backend(name: str | None = None) -> type["FontBackend"]:
+    """
+    The font backend called `name`.
+
+    Defaults to the one named by `$NIXOSLOGO_FONT_BACKEND`, or fontforge.
+    """
+    name = name or os.getenv(FONT_BACKEND_ENVVAR) or FontforgeBackend.name
+    match name:
+        case FontforgeBackend.name:
+            return FontforgeBackend
+        case FontToolsBackend.name:
+            return FontToolsBackend
+        case _:
+            raise ValueError(f"Unknown font backend: {name}")
+
+
+# === Classes ===
+
+
+class OutlinePoint(NamedTuple):
+    x: float
+    y: float
+    on_curve: bool
+
+
+class OutlineContour:
+    """A contour of glyph outline points, like a fontforge contour."""
+
+    def __init__(self, points: np.ndarray, on_curve: np.ndarray):
+        self.points = points
+        self.on_curve = on_curve
+
+    def __len__(self):
+        return len(self.points)
+
+    def __iter__(self) -> Iterator[OutlinePoint]:
+        for (x, y), on_curve in zip(self.points.tolist(), self.on_curve.tolist()):
+            yield OutlinePoint(x, y, on_curve)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OutlineContour(self.points[index], self.on_curve[index])
+        (x, y), on_curve = self.points[index].tolist(), bool(self.on_curve[index])
+        return OutlinePoint(x, y, on_curve)
+
+    def __add__(self, other: "OutlineContour") -> "OutlineContour":
+        return OutlineContour(
+            np.concatenate([self.points, other.points]),
+            np.concatenate([self.on_curve, other.on_curve]),
+        )
+
+
+class OutlineLayer:
+    """The contours of a glyph, like a fontforge layer."""
+
+    def __init__(self, contours: list[OutlineContour]):
+        self.contours = contours
+
+    def __len__(self):
+        return len(self.contours)
+
+    def __iter__(self) -> Iterator[OutlineContour]:
+        return iter(self.contours)
+
+    def __getitem__(self, index) -> OutlineContour:
+        return self.contours[index]
+
+    def dup(self) -> "OutlineLayer":
+        # Transforms replace the point arrays, so the arrays can be shared.
+        return OutlineLayer(
+            [
+                OutlineContour(contour.points, contour.on_curve)
+                for contour in self.contours
+            ]
+        )
+
+    def transform(self, matrix: tuple) -> "OutlineLayer":
+        """Apply the affine `matrix` in place, with fontforge's arithmetic."""
+        xx, xy, yx, yy, dx, dy = matrix
+        for contour in self.contours:
+            x, y = contour.points[:, 0], contour.points[:, 1]
+            contour.points = np.column_stack(
+                [xx * x + yx * y + dx, xy * x + yy * y + dy]
+            )
+        return self
+
+    def boundingBox(self) -> tuple[float, float, float, float]:
+        box = measure(svg.Path(d=layer_path(self)))
+        return (0.0, 0.0, 0.0, 0.0) if box is None else box
+
+
+class FontBackend(Protocol):
+    """
+    An open font, as far as `FontLoader` uses it.
+
+    `glyph` returns a glyph with the fontforge glyph interface that the
+    renderables read: `width`, `left_side_bearing`, `transform(matrix)` and
+    `foreground`, a copy of its outline as a layer of contours of points
+    with `x`, `y` and `on_curve`. Transforming a glyph changes the outline
+    every later `glyph` call returns.
+    """
+
+    name: str
+
+    def __init__(self, path: Path): ...
+
+    @property
+    def cap_height(self) -> float: ...
+
+    def scale(self, factor: float):
+        """Scale every glyph, as changing the em size of the font does."""
+
+    def glyph(self, name: str): ...
+
+    def close(self): ...
+
+
+class FontforgeBackend:
+    """Fonts opened with fontforge, which the published artifacts are made with."""
+
+    name = "fontforge"
+
+    def __init__(self, path: Path):
+        # Imported here so that fontforge is only needed when it is used.
+        import fontforge
+
+        self.font = fontforge.open(str(path))
+
+    @property
+    def cap_height(self) -> float:
+        return self.font.capHeight
+
+    def scale(self, factor: float):
+        self.font.em = round(self.font.em * factor)
+
+    def glyph(self, name: str):
+        return self.font[name]
+
+    def close(self):
+        self.font.close()
+
+
+class OutlineGlyph:
+    """A glyph outline read with fontTools, with the fontforge glyph interface."""
+
+    def __init__(self, layer: OutlineLayer, width: float):
+        self.layer = layer
+        self.width = width
+
+    @property
+    def foreground(self) -> OutlineLayer:
+        return self.layer.dup()
+
+    @property
+    def left_side_bearing(self) -> float:
+        return self.layer.boundingBox()[0]
+
+    def transform(self, matrix: tuple):
+        xx, xy, yx, yy, dx, _ = matrix
+        self.layer.transform(matrix)
+        # fontforge moves the advance along with upright, unskewed scales only.
+        if xx > 0 and yy > 0 and xy == 0 and yx == 0:
+            self.width = round(self.width * xx + dx)
+
+
+class FontToolsBackend:
+    """
+    Fonts read with fontTools, which is pure Python and pip-installable.
+
+    Outlines are read the first time a glyph is asked for, with quadratic
+    curves spelled out point by point, so that every off-curve point is
+    followed by an on-curve one or by a second off-curve point of a cubic.
+    The results follow fontforge closely, but are not guaranteed to be
+    identical to it.
+    """
+
+    name = "fonttools"
+
+    def __init__(self, path: Path):
+        from fontTools.ttLib import TTFont
+
+        self.font = TTFont(str(path), lazy=True)
+        self.glyph_set = self.font.getGlyphSet()
+        self.cmap = self.font.getBestCmap() or {}
+        self.em = self.font["head"].unitsPerEm
+        self.factor = 1
+        self.glyphs: dict[str, OutlineGlyph] = {}
+        self._cap_height = self._read_cap_height()
+
+    def _glyph_name(self, name: str) -> str:
+        if name not in self.glyph_set and len(name) == 1 and ord(name) in self.cmap:
+            return self.cmap[ord(name)]
+        return name
+
+    def _read_cap_height(self) -> float:
+        """
+        The most common top of the flat-topped capitals, as fontforge
+        computes it, or the cap height the font declares.
+        """
+        tops = Counter(
+            self.glyph(character).layer.boundingBox()[3]
+            for character in CAP_HEIGHT_GLYPHS
+            if self._glyph_name(character) in self.glyph_set
+        )
+        if tops:
+            return tops.most_common(1)[0][0]
+        return getattr(self.font["OS/2"], "sCapHeight", 0)
+
+    @property
+    def cap_height(self) -> float:
+        return self._cap_height * self.factor
+
+    def scale(self, factor: float):
+        em = round(self.em * factor)
+        factor = em / self.em
+        self.em = em
+        self.factor *= factor
+        for glyph in self.glyphs.values():
+            glyph.layer.transform((factor, 0, 0, factor, 0, 0))
+            glyph.width = round(glyph.width * factor)
+
+    def glyph(self, name: str) -> OutlineGlyph:
+        if name not in self.glyphs:
+            glyph_name = self._glyph_name(name)
+            if glyph_name not in self.glyph_set:
+                raise KeyError(f"{name!r} is not in {self.font.reader.file.name}")
+            contours = _read_contours(self.glyph_set, glyph_name)
+            layer = OutlineLayer(
+                [
+                    OutlineContour(
+                        np.array([point for point, _ in contour], dtype=float)
+                        * self.factor,
+                        np.array([on_curve for _, on_curve in contour], dtype=bool),
+                    )
+                    for contour in contours
+                    if contour
+                ]
+            )
+            width = round(self.glyph_set[glyph_name].width * self.factor)
+            self.glyphs[name] = OutlineGlyph(layer, width)
+        return self.glyphs[name]
+
+    def close(self):
+        self.font.close()
@@ -1,9 +1,16 @@
 import math
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Self
 
+import numpy as np
+import svg
 from svg._types import Number
 
+# Coefficients closer than this to a whole number are snapped to it when an
+# Affine is written out as SVG transforms.
+AFFINE_TOLERANCE = 1e-12
+
 
 def cosd(angle) -> float:
     return math.cos(math.radians(angle))
@@ -13,16 +20,75 @@ def sind(angle) -> float:
     return math.sin(math.radians(angle))
 
 
-class Point(Sequence):
+def _snap(value: Number) -> Number:
+    nearest = round(value)
+    if math.isclose(value, nearest, rel_tol=0, abs_tol=AFFINE_TOLERANCE):
+        return int(nearest)
+    return value
+
+
+def simplify_transforms(transforms: Sequence[svg.Transform]) -> list[svg.Transform]:
+    """Collapse a chain of SVG transforms into its shortest equivalent."""
+    return min(
+        [list(transforms), Affine.from_svg(transforms).to_svg()],
+        key=_svg_length,
+    )
+
+
+def _svg_length(transforms: Sequence[svg.Transform]) -> int:
+    return len(" ".join(str(elem) for elem in transforms))
+
+
+class _Pair(Sequence):
+    """An immutable, hashable (x, y) pair."""
+
+    __slots__ = ("x", "y")
+
     def __init__(self, value):
-        self.value = value
-        super().__init__()
+        x, y = value
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), ((self.x, self.y),))
 
     def __getitem__(self, index):
-        return self.value[index]
+        return (self.x, self.y)[index]
 
     def __len__(self):
-        return len(self.value)
+        return 2
+
+    def __iter__(self):
+        return iter((self.x, self.y))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    @property
+    def value(self) -> tuple:
+        return (self.x, self.y)
+
+
+def _components(other) -> tuple:
+    if isinstance(other, _Pair):
+        return other.x, other.y
+    x, y = other
+    return x, y
+
+
+class Point(_Pair):
+    __slots__ = ()
 
     def __str__(self):
         return f"{self.x, self.y}"
@@ -31,13 +97,11 @@ class Point(Sequence):
         return f"Point{self.value}"
 
     def __neg__(self):
-        return Point(tuple(-elem for elem in self))
+        return Point((-self.x, -self.y))
 
     def __add__(self, other: Self | "Vector") -> Self:
-        if isinstance(other, Point):
+        if isinstance(other, _Pair):
             return Point((self.x + other.x, self.y + other.y))
-        elif isinstance(other, Vector):
-            return Point((self.x + other[0], self.y + other[1]))
         else:
             raise Exception(f"Not sure how to add {type(other)} to Point.")
 
@@ -45,22 +109,12 @@ class Point(Sequence):
         if isinstance(other, Point):
             return Vector((self.x - other.x, self.y - other.y))
         elif isinstance(other, Vector):
-            return Point((self.x - other[0], self.y - other[1]))
+            return Point((self.x - other.x, self.y - other.y))
         else:
             raise Exception(f"Not sure how to add {type(other)} to Point.")
 
     def __truediv__(self, other: Number) -> Self:
-        return Point(tuple(elem / other for elem in self))
-
-    @property
-    def x(self):
-        """The x property."""
-        return self.value[0]
-
-    @property
-    def y(self):
-        """The y property."""
-        return self.value[1]
+        return Point((self.x / other, self.y / other))
 
     def distance(self, other: Self) -> float:
         return (self - other).length()
@@ -75,20 +129,18 @@ class Point(Sequence):
         return normal.normalize()
 
     def rotate(self, angle: Number):
-        rotation_matrix = Matrix(
+        cos, sin = cosd(angle), sind(angle)
+        # Start from zero like the `sum` in `Matrix.__matmul__`, it turns -0.0
+        # into 0.0.
+        return Point(
             (
-                Vector(
-                    (cosd(angle), sind(-angle)),
-                ),
-                Vector(
-                    (sind(angle), cosd(angle)),
-                ),
+                0 + cos * self.x + sind(-angle) * self.y,
+                0 + sin * self.x + cos * self.y,
             )
         )
-        return Point(rotation_matrix @ self)
 
     def to_vector(self) -> "Vector":
-        return Vector(self.value)
+        return Vector((self.x, self.y))
 
 
 class Points(Sequence):
@@ -113,17 +165,92 @@ class Points(Sequence):
         return [elem for point in nested for elem in point]
 
 
-class Vector(Sequence):
+class PointArray(Sequence):
+    """
+    An (N, 2) array of points transformed all at once.
+
+    The arithmetic is done in the same order as the `Point` and `Vector`
+    methods, and the trigonometry with `math`, so the results are bit for bit
+    the same as transforming each `Point` on its own.
+    """
+
     def __init__(self, value):
-        self.value = value
+        self.value = np.array(value, dtype=float).reshape(-1, 2)
+        # Arrays are shared between memoized geometry, keep them immutable.
+        self.value.flags.writeable = False
         super().__init__()
 
     def __getitem__(self, index):
-        return self.value[index]
+        if isinstance(index, slice):
+            return PointArray(self.value[index])
+        return Point(tuple(self.value[index].tolist()))
 
     def __len__(self):
         return len(self.value)
 
+    def __repr__(self):
+        return f"PointArray{self.value.tolist()}"
+
+    def __str__(self):
+        return str(self.to_points())
+
+    def __neg__(self):
+        return PointArray(-self.value)
+
+    def __add__(self, other: "Vector") -> Self:
+        return self.translate(other)
+
+    def __sub__(self, other: "Vector") -> Self:
+        return self.translate(-other)
+
+    @classmethod
+    def from_points(cls, points: Sequence[Point]) -> Self:
+        return cls([(point.x, point.y) for point in points])
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.value[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.value[:, 1]
+
+    def translate(self, vector: "Vector") -> Self:
+        return PointArray(self.value + (vector[0], vector[1]))
+
+    def scale(self, factor: Number | Sequence[Number]) -> Self:
+        if isinstance(factor, Sequence):
+            return PointArray(self.value * (factor[0], factor[1]))
+        return PointArray(factor * self.value)
+
+    def rotate(self, angle: Number) -> Self:
+        cos, sin = cosd(angle), sind(angle)
+        # Start from zero like `Point.rotate`.
+        return PointArray(
+            np.column_stack(
+                (
+                    0 + cos * self.x + sind(-angle) * self.y,
+                    0 + sin * self.x + cos * self.y,
+                )
+            )
+        )
+
+    def lengths(self) -> np.ndarray:
+        return np.sqrt(0 + self.x * self.x + self.y * self.y)
+
+    def normalize(self) -> Self:
+        return PointArray(self.value / self.lengths()[:, np.newaxis])
+
+    def to_points(self) -> Points:
+        return Points([Point(tuple(elem)) for elem in self.value.tolist()])
+
+    def to_list(self):
+        return self.value.ravel().tolist()
+
+
+class Vector(_Pair):
+    __slots__ = ()
+
     def __repr__(self):
         return f"Vector{self.value}"
 
@@ -131,28 +258,32 @@ class Vector(Sequence):
         return f"{self.value}"
 
     def __add__(self, other: Self) -> Self:
-        return Vector(tuple(s + o for s, o in zip(self, other)))
+        x, y = _components(other)
+        return Vector((self.x + x, self.y + y))
 
     def __neg__(self):
-        return Vector(tuple(-elem for elem in self))
+        return Vector((-self.x, -self.y))
 
     def __sub__(self, other: Self) -> Self:
-        return self + (-other)
+        x, y = _components(other)
+        # Adding the negation turns -0.0 - 0 into 0.0, like it always has.
+        return Vector((self.x + (-x), self.y + (-y)))
 
     def __mul__(self, other: Self) -> Self:
-        return Vector(tuple(s * o for s, o in zip(self, other)))
+        x, y = _components(other)
+        return Vector((self.x * x, self.y * y))
 
     def __rmul__(self, other: Number) -> Self:
-        return Vector(tuple(other * elem for elem in self))
+        return Vector((other * self.x, other * self.y))
 
     def __matmul__(self, other: Self | Point) -> Self:
-        if isinstance(other, Point | Vector):
-            return [s * o for s, o in zip(self, other)]
+        if isinstance(other, _Pair):
+            return [self.x * other.x, self.y * other.y]
         else:
             raise Exception(f"Not sure how to add {type(other)} to Point.")
 
     def __truediv__(self, other: Number) -> Self:
-        return Vector(tuple(elem / other for elem in self))
+        return Vector((self.x / other, self.y / other))
 
     def _modulus_squared(self) -> Number:
         return self.dot(self)
@@ -161,19 +292,20 @@ class Vector(Sequence):
         return math.sqrt(self._modulus_squared())
 
     def dot(self, other: Self) -> float:
-        return sum((self * other))
+        x, y = _components(other)
+        return self.x * x + self.y * y
 
     def normalize(self) -> Self:
         return self / self.length()
 
     def normal(self) -> Self:
-        return Vector((self[1], -self[0])).normalize()
+        return Vector((self.y, -self.x)).normalize()
 
     def angle_from(self, other: Self) -> float:
         return math.acos(self.dot(other) / (self.length() * other.length()))
 
     def to_point(self) -> Point:
-        return Point(self.value)
+        return Point((self.x, self.y))
 
 
 class Matrix(Sequence):
@@ -200,3 +332,149 @@ class Matrix(Sequence):
             raise Exception(
                 f"Not sure how to matrix multiply {type(self)} and {type(other)}."
             )
+
+
+@dataclass(frozen=True, slots=True)
+class Affine:
+    """
+    A 2D affine transform with the coefficients of SVG's `matrix(a b c d e f)`.
+
+    `first @ second` applies `second` and then `first`, the same order as a
+    list of SVG transforms.
+    """
+
+    a: Number = 1
+    b: Number = 0
+    c: Number = 0
+    d: Number = 1
+    e: Number = 0
+    f: Number = 0
+
+    @classmethod
+    def translation(cls, x: Number, y: Number = 0) -> Self:
+        return cls(e=x, f=y)
+
+    @classmethod
+    def scaling(cls, x: Number, y: Number | None = None) -> Self:
+        return cls(a=x, d=x if y is None else y)
+
+    @classmethod
+    def rotation(cls, angle: Number, x: Number = 0, y: Number = 0) -> Self:
+        cos, sin = cosd(angle), sind(angle)
+        rotation = cls(a=cos, b=sin, c=-sin, d=cos)
+        if x == 0 and y == 0:
+            return rotation
+        return cls.translation(x, y) @ rotation @ cls.translation(-x, -y)
+
+    @classmethod
+    def from_svg(cls, transforms: Sequence[svg.Transform]) -> Self:
+        affine = cls()
+        for transform in transforms:
+            match transform:
+                case svg.Matrix():
+                    step = cls(
+                        a=transform.a,
+                        b=transform.b,
+                        c=transform.c,
+                        d=transform.d,
+                        e=transform.e,
+                        f=transform.f,
+                    )
+                case svg.Translate():
+                    step = cls.translation(transform.x, transform.y or 0)
+                case svg.Scale():
+                    step = cls.scaling(transform.x, transform.y)
+                case svg.Rotate():
+                    step = cls.rotation(transform.a, transform.x or 0, transform.y or 0)
+                case svg.SkewX():
+                    step = cls(c=math.tan(math.radians(transform.a)))
+                case svg.SkewY():
+                    step = cls(b=math.tan(math.radians(transform.a)))
+                case _:
+                    raise ValueError(f"Unknown Transform: {transform}")
+            affine = affine @ step
+        return affine
+
+    def __matmul__(self, other):
+        match other:
+            case Affine():
+                return Affine(
+                    a=self.a * other.a + self.c * other.b,
+                    b=self.b * other.a + self.d * other.b,
+                    c=self.a * other.c + self.c * other.d,
+                    d=self.b * other.c + self.d * other.d,
+                    e=self.a * other.e + self.c * other.f + self.e,
+                    f=self.b * other.e + self.d * other.f + self.f,
+                )
+            case Point():
+                return Point(self._apply(other.x, other.y))
+            case PointArray():
+                return PointArray(np.column_stack(self._apply(other.x, other.y)))
+            case _:
+                return NotImplemented
+
+    def _apply(self, x, y):
+        return (self.a * x + self.c * y + self.e, self.b * x + self.d * y + self.f)
+
+    @property
+    def linear(self) -> Self:
+        """This transform without its translation."""
+        return Affine(a=self.a, b=self.b, c=self.c, d=self.d)
+
+    @property
+    def determinant(self) -> Number:
+        return self.a * self.d - self.b * self.c
+
+    def inverse(self) -> Self:
+        determinant = self.determinant
+        if determinant == 0:
+            raise ValueError(f"{self} is not invertible")
+        return Affine(
+            a=self.d / determinant,
+            b=-self.b / determinant,
+            c=-self.c / determinant,
+            d=self.a / determinant,
+            e=(self.c * self.f - self.d * self.e) / determinant,
+            f=(self.b * self.e - self.a * self.f) / determinant,
+        )
+
+    def transform_bounding_box(
+        self, bounding_box: tuple[Number, Number, Number, Number]
+    ) -> tuple[float, float, float, float]:
+        """The bounding box of the transformed corners of `bounding_box`."""
+        min_x, min_y, max_x, max_y = bounding_box
+        corners = self @ PointArray(
+            [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)]
+        )
+        return (
+            corners.x.min().item(),
+            corners.y.min().item(),
+            corners.x.max().item(),
+            corners.y.max().item(),
+        )
+
+    def to_svg(self) -> list[svg.Transform]:
+        """The shortest list of SVG transforms equivalent to this one."""
+        a, b, c, d, e, f = (
+            _snap(elem) for elem in (self.a, self.b, self.c, self.d, self.e, self.f)
+        )
+        translate = (
+            [] if e == 0 and f == 0 else [svg.Translate(e, None if f == 0 else f)]
+        )
+
+        candidates = [[svg.Matrix(a, b, c, d, e, f)]]
+        if b == 0 and c == 0:
+            if a == 1 and d == 1:
+                candidates.append(translate)
+            else:
+                candidates.append(translate + [svg.Scale(a, None if a == d else d)])
+        if a == d and b == -c and math.isclose(a * a + b * b, 1):
+            angle = _snap(math.degrees(math.atan2(b, a)))
+            candidates.append(translate + [svg.Rotate(angle)])
+            # Rotating about a point moves every point except that point.
+            scale = (1 - a) ** 2 + b**2
+            if translate and scale > AFFINE_TOLERANCE:
+                x = _snap((e * (1 - a) - f * b) / scale)
+                y = _snap((e * b + f * (1 - a)) / scale)
+                candidates.append([svg.Rotate(angle, x, y)])
+        return min(candidates, key=_svg_length)
@@ -1,5 +1,8 @@
+import functools
 import hashlib
 import math
+from collections.abc import Callable, Hashable
+from typing import Any
 
 import jsonpickle
 
@@ -28,3 +31,30 @@ def arc_sagitta(point1, point2, radius, large, sweep):
     arc_midpoint = arc_center + radius * (+1 if sweep else -1) * chord_normal
     arc_midpoint_vector = (arc_midpoint - arc_center).normalize()
     return (arc_midpoint, arc_midpoint_vector)
+
+
+def memoize(key: Callable[[Any], Hashable]):
+    """
+    Cache a method's results on its instance, per set of arguments.
+
+    The results are thrown away whenever `key(instance)` changes, so they
+    follow any mutation of the attributes `key` reads.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            state = key(self)
+            memo = self.__dict__.setdefault("_memoized", {})
+            entry = memo.get(method.__qualname__)
+            if entry is None or entry[0] != state:
+                entry = memo[method.__qualname__] = (state, {})
+            results = entry[1]
+            call = (args, tuple(sorted(kwargs.items())))
+            if call not in results:
+                results[call] = method(self, *args, **kwargs)
+            return results[call]
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,230 @@
+import numpy as np
+
+from nixoslogo.bbox import BoundingBox
+from nixoslogo.metrics import FLATTEN_TOLERANCE, element_contours, flatten
+
+# === Constants ===
+
+# The most point and edge pairs compared at once, to bound memory use.
+MAX_BATCH = 1 << 20
+
+# How many edges of a band are tested per point, on average, at most.
+EDGES_PER_BAND = 16
+
+# === Functions ===
+
+
+def _sample_axes(
+    bounding_box: BoundingBox,
+    width: int,
+    height: int,
+    samples: int = 1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The x and y of the sample centers of a `width` by `height` raster of
+    `bounding_box`, with each pixel split into `samples` by `samples`.
+    """
+    min_x, min_y, max_x, max_y = bounding_box
+    xs = min_x + (np.arange(width * samples) + 0.5) * (
+        (max_x - min_x) / (width * samples)
+    )
+    ys = min_y + (np.arange(height * samples) + 0.5) * (
+        (max_y - min_y) / (height * samples)
+    )
+    return xs, ys
+
+
+# === Classes ===
+
+
+class HitTester:
+    """
+    Whether points are inside the filled outlines of an svg.py element tree.
+
+    The outlines are flattened to straight edges within `tolerance` once,
+    when the tester is made. Queries then take any number of points as one
+    array and count windings with NumPy, testing each point only against the
+    edges in its horizontal band.
+
+    Every element is filled by its own `fill_rule`, nonzero by default, and a
+    point is inside when it is inside any element, as it is when painted.
+    Unfilled elements are skipped.
+    """
+
+    def __init__(self, elements, tolerance: float = FLATTEN_TOLERANCE):
+        self.tolerance = tolerance
+
+        self.elements = []
+        indices, edges, owners = {}, [], []
+        for element, contour in element_contours(elements):
+            if id(element) not in indices:
+                indices[id(element)] = len(self.elements)
+                self.elements.append(element)
+            points, _ = flatten(contour, tolerance)
+            # Every contour is closed: its last point joins its first.
+            edges.append(np.column_stack([points, np.roll(points, -1, axis=0)]))
+            owners.append(np.full(len(points), indices[id(element)]))
+
+        self.evenodd = np.array(
+            [getattr(elem, "fill_rule", None) == "evenodd" for elem in self.elements],
+            dtype=bool,
+        )
+        edges = np.concatenate(edges) if edges else np.empty((0, 4))
+        owners = np.concatenate(owners) if owners else np.empty(0, dtype=np.intp)
+        # Horizontal edges never cross a horizontal ray.
+        sloped = edges[:, 1] != edges[:, 3]
+        self.edges = edges[sloped]
+        self.edge_owners = np.eye(len(self.elements), dtype=np.intp)[owners[sloped]]
+        self._init_bands()
+
+    @classmethod
+    def of_renderable(cls, renderable, **kwargs) -> "HitTester":
+        """A tester for everything `renderable.make_svg_elements` draws."""
+        return cls(renderable.make_svg_elements(), **kwargs)
+
+    def _init_bands(self):
+        """File the edges under the horizontal bands their heights span."""
+        edges = self.edges
+        if not len(edges):
+            self.bands = np.empty(1)
+            self.band_edges = [np.empty(0, dtype=np.intp)]
+            return
+
+        low = np.minimum(edges[:, 1], edges[:, 3])
+        high = np.maximum(edges[:, 1], edges[:, 3])
+        band_count = max(1, len(edges) // EDGES_PER_BAND)
+        self.bands = np.linspace(low.min(), high.max(), band_count + 1)
+
+        first = np.searchsorted(self.bands, low, side="right") - 1
+        last = np.searchsorted(self.bands, high, side="left") - 1
+        first = np.clip(first, 0, band_count - 1)
+        last = np.clip(last, first, band_count - 1)
+        counts = last - first + 1
+        filed = np.repeat(np.arange(len(edges)), counts)
+        bands = np.repeat(first, counts) + (
+            np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        )
+        order = np.argsort(bands, kind="stable")
+        splits = np.searchsorted(bands[order], np.arange(1, band_count))
+        self.band_edges = np.split(filed[order], splits)
+
+    def winding(self, points) -> np.ndarray:
+        """
+        The winding number of each of `points` around each element.
+
+        `points` is an array of (x, y) pairs of any shape (..., 2); the result
+        has shape (..., element count).
+        """
+        points = np.asarray(points, dtype=float)
+        shape = points.shape[:-1]
+        points = points.reshape(-1, 2)
+        winding = np.zeros((len(points), len(self.elements)), dtype=np.intp)
+
+        band_count = len(self.band_edges)
+        if len(self.edges) and len(points):
+            y = points[:, 1]
+            bands = np.searchsorted(self.bands, y, side="right") - 1
+            within = (bands >= 0) & (y < self.bands[-1])
+            indices = np.flatnonzero(within)
+            indices = indices[np.argsort(bands[indices], kind="stable")]
+            starts = np.searchsorted(bands[indices], np.arange(band_count + 1))
+
+            for band, edge_indices in enumerate(self.band_edges):
+                if not len(edge_indices):
+                    continue
+                band_points = indices[starts[band] : starts[band + 1]]
+                step = max(1, MAX_BATCH // len(edge_indices))
+                for start in range(0, len(band_points), step):
+                    batch = band_points[start : start + step]
+                    winding[batch] = self._crossings(points[batch], edge_indices)
+
+        return winding.reshape(*shape, len(self.elements))
+
+    def _crossings(self, points, edge_indices) -> np.ndarray:
+        """The windings of `points` around each element, from the given edges."""
+        x, y = points[:, 0, np.newaxis], points[:, 1, np.newaxis]
+        x0, y0, x1, y1 = self.edges[edge_indices].T
+        side = (x1 - x0) * (y - y0) - (y1 - y0) * (x - x0)
+        upward = (y0 <= y) & (y < y1) & (side > 0)
+        downward = (y1 <= y) & (y < y0) & (side < 0)
+        crossings = upward.astype(np.intp) - downward
+        return crossings @ self.edge_owners[edge_indices]
+
+    def _filled(self, points) -> np.ndarray:
+        winding = self.winding(points)
+        return np.where(self.evenodd, winding % 2 == 1, winding != 0)
+
+    def contains(self, points) -> np.ndarray:
+        """Whether each of `points`, an array of shape (..., 2), is filled."""
+        return self._filled(points).any(axis=-1)
+
+    def grid_winding(self, xs, ys) -> np.ndarray:
+        """
+        The winding numbers at every `xs` and `ys` of a grid, one row per `ys`.
+
+        Each row is scanned once: the crossings of the edges are counted into
+        the columns left of them and summed from the right, so the cost
+        grows with the rows times the edges plus the number of samples,
+        rather than their product. `xs` must be sorted. The result has shape
+        (len(ys), len(xs), element count).
+        """
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        element_count = len(self.elements)
+        winding = np.zeros((len(ys), len(xs), element_count), dtype=np.intp)
+        if not len(self.edges):
+            return winding
+
+        x0, y0, x1, y1 = self.edges.T
+        owners = np.argmax(self.edge_owners, axis=1)
+        step = max(1, MAX_BATCH // ((len(xs) + 1) * max(1, element_count)))
+        for start in range(0, len(ys), step):
+            y = ys[start : start + step, np.newaxis]
+            upward = (y0 <= y) & (y < y1)
+            downward = (y1 <= y) & (y < y0)
+            rows, edges = np.nonzero(upward | downward)
+            t = (y[rows, 0] - y0[edges]) / (y1[edges] - y0[edges])
+            columns = np.searchsorted(
+                xs, x0[edges] + t * (x1[edges] - x0[edges]), side="left"
+            )
+            counts = np.zeros((len(y), len(xs) + 1, element_count), dtype=np.intp)
+            np.add.at(
+                counts,
+                (rows, columns, owners[edges]),
+                np.where(upward[rows, edges], 1, -1),
+            )
+            # A crossing counts for every sample left of it.
+            winding[start : start + step] = np.cumsum(counts[:, :0:-1], axis=1)[:, ::-1]
+        return winding
+
+    def _grid_filled(self, xs, ys) -> np.ndarray:
+        winding = self.grid_winding(xs, ys)
+        return np.where(self.evenodd, winding % 2 == 1, winding != 0).any(axis=-1)
+
+    def mask(self, bounding_box: BoundingBox, width: int, height: int) -> np.ndarray:
+        """Whether the center of each pixel of a raster of `bounding_box` is filled."""
+        return self._grid_filled(*_sample_axes(bounding_box, width, height))
+
+    def coverage(
+        self,
+        bounding_box: BoundingBox,
+        width: int,
+        height: int,
+        samples: int = 4,
+    ) -> np.ndarray:
+        """
+        The share of each pixel of a raster of `bounding_box` that is filled.
+
+        Each pixel is sampled at `samples` by `samples` subpixel centers.
+        """
+        filled = self._grid_filled(*_sample_axes(bounding_box, width, height, samples))
+        return filled.reshape(height, samples, width, samples).mean(axis=(1, 3))
+
+    def pick(self, points) -> np.ndarray:
+        """
+        The index in `elements` of the topmost element at each of `points`.
+
+        Points that hit no element get -1.
+        """
+        filled = self._filled(points)
+        topmost = filled.shape[-1] - 1 - np.argmax(filled[..., ::-1], axis=-1)
+        return np.where(filled.any(axis=-1), topmost, -1)
@@ -10,6 +10,23 @@ class Canvas:
     width: int
     height: int
 
+    @classmethod
+    def around(cls, bounding_box, clear_space=0) -> "Canvas":
+        """A canvas around `bounding_box` with `clear_space` on every side."""
+        min_x, min_y, max_x, max_y = bounding_box
+
+        min_x -= clear_space
+        min_y -= clear_space
+        max_x += clear_space
+        max_y += clear_space
+
+        return cls(
+            min_x=min_x,
+            min_y=min_y,
+            width=max_x - min_x,
+            height=max_y - min_y,
+        )
+
     @property
     def max_y(self):
         return self.min_y + self.height
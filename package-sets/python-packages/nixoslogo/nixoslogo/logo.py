@@ -16,6 +16,8 @@ from nixoslogo.logomark import Lambda, Logomark
 from nixoslogo.logotype import (
     FontLoader,
     Logotype,
+    font_loaders,
+    get_font_loader,
 )
 
 
@@ -81,7 +83,11 @@ class NixosLogo(BaseRenderable):
 
     def _init_logotype(self):
         if self.loader is None:
-            self.loader = FontLoader(capHeight=self.logotype_cap_height)
+            self.loader = get_font_loader(
+                capHeight=self.logotype_cap_height, owner=self
+            )
+        else:
+            font_loaders.hold(self, self.loader)
         self.logotype = Logotype(
             characters=self.logotype_characters,
             loader=self.loader,
@@ -160,7 +166,7 @@ class NixosLogo(BaseRenderable):
         )
 
     def close(self):
-        self.loader.cleanup()
+        font_loaders.release(self.loader, owner=self)
 
 
 if __name__ == "__main__":
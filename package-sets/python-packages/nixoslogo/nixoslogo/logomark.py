@@ -1,10 +1,13 @@
 import fractions
 import itertools
 import math
+from operator import attrgetter
 
+import numpy as np
 import svg
 from svg._types import Number
 
+from nixoslogo import polygons
 from nixoslogo.colors import Color
 from nixoslogo.core import (
     BaseRenderable,
@@ -12,7 +15,22 @@ from nixoslogo.core import (
     ColorStyle,
     LogomarkColors,
 )
-from nixoslogo.geometry import Point, Points, Vector, cosd, sind
+from nixoslogo.geometry import (
+    Point,
+    PointArray,
+    Points,
+    Vector,
+    cosd,
+    simplify_transforms,
+    sind,
+)
+from nixoslogo.helpers import memoize
+
+# The attributes the memoized geometry is computed from.
+_LAMBDA_GEOMETRY = attrgetter("radius", "thickness", "gap")
+_FLAKE_GEOMETRY = attrgetter(
+    "ilambda", "ilambda.radius", "ilambda.thickness", "ilambda.gap"
+)
 
 
 class Lambda(BaseRenderable):
@@ -33,6 +51,7 @@ class Lambda(BaseRenderable):
         super().__init__(**kwargs)
 
     @property
+    @memoize(key=_LAMBDA_GEOMETRY)
     def elements_bounding_box(self):
         double_up = [
             (
@@ -62,63 +81,69 @@ class Lambda(BaseRenderable):
                 raise Exception(f"Unknown ClearSpace: {self.clear_space}")
 
     def make_svg_elements(self):
-        return (
-            svg.Polygon(
-                points=self.make_lambda_points().to_list(),
-                fill=self.color,
-            ),
+        yield svg.Polygon(
+            points=self.make_lambda_point_array().to_list(),
+            fill=self.color,
         )
 
-    def make_hexagon_points(self, radius: Number) -> Points:
+    def make_hexagon_point_array(self, radius: Number) -> PointArray:
         angles = [math.radians(angle) for angle in range(0, 360, 60)]
-        return Points(
-            [
-                Point(
-                    (
-                        radius * math.cos(angle),
-                        radius * math.sin(angle),
-                    )
-                )
-                for angle in angles
-            ]
-        )
+        unit = PointArray([(math.cos(angle), math.sin(angle)) for angle in angles])
+        return unit.scale(radius)
 
-    def make_lambda_points(
+    def make_hexagon_points(self, radius: Number) -> Points:
+        return self.make_hexagon_point_array(radius).to_points()
+
+    @memoize(key=_LAMBDA_GEOMETRY)
+    def make_lambda_point_array(
         self,
         radius: Number | None = None,
         thickness: Number | None = None,
         gap: Number | None = None,
-    ) -> Points:
+    ) -> PointArray:
         radius = radius if radius is not None else self.radius
         thickness = thickness if thickness is not None else self.thickness
         gap = gap if gap is not None else self.gap
 
-        hexagon_points = self.make_hexagon_points(radius)
+        hexagon_points = self.make_hexagon_point_array(radius).value
         hex_top_left = hexagon_points[2]
         hex_bottom_left = hexagon_points[4]
         hex_bottom_right = hexagon_points[5]
 
-        vector_0 = radius * thickness * Vector((cosd(0), sind(0)))
-        vector_60 = radius * thickness * Vector((cosd(60), sind(60)))
-        vector_270 = radius * thickness * Vector((cosd(270), sind(270)))
-        vector_300 = radius * thickness * Vector((cosd(300), sind(300)))
-        gap_vector = 2 * radius * gap * Vector((cosd(300), sind(300)))
-
-        points = [
-            (hex_top_left - vector_60 + gap_vector),
-            (hex_top_left + vector_60 + gap_vector),
-            (hex_bottom_right + vector_0),
-            (hex_bottom_right - vector_0),
-            (math.sqrt(3) * vector_270).to_point(),
-            (hex_bottom_left + vector_0),
-            hex_bottom_left,
-            (hex_bottom_left - vector_300),
-            (-vector_0).to_point(),
-        ]
+        vector_0 = radius * thickness * np.array((cosd(0), sind(0)))
+        vector_60 = radius * thickness * np.array((cosd(60), sind(60)))
+        vector_270 = radius * thickness * np.array((cosd(270), sind(270)))
+        vector_300 = radius * thickness * np.array((cosd(300), sind(300)))
+        gap_vector = 2 * radius * gap * np.array((cosd(300), sind(300)))
+
+        points = PointArray(
+            [
+                (hex_top_left - vector_60 + gap_vector),
+                (hex_top_left + vector_60 + gap_vector),
+                (hex_bottom_right + vector_0),
+                (hex_bottom_right - vector_0),
+                (math.sqrt(3) * vector_270),
+                (hex_bottom_left + vector_0),
+                hex_bottom_left,
+                (hex_bottom_left - vector_300),
+                (-vector_0),
+            ]
+        )
 
         # Need to negate the y-axis so the lambda is not upside down
-        points = Points([Point((point.x, -point.y)) for point in points])
-        return points
+        return points.scale((1, -1))
+
+    def make_lambda_points(
+        self,
+        radius: Number | None = None,
+        thickness: Number | None = None,
+        gap: Number | None = None,
+    ) -> Points:
+        return self.make_lambda_point_array(
+            radius=radius,
+            thickness=thickness,
+            gap=gap,
+        ).to_points()
 
     def make_named_lambda_points(
         self,
@@ -170,9 +195,13 @@ class Logomark(BaseRenderable):
         color_style: ColorStyle = ColorStyle.GRADIENT,
         clear_space: ClearSpace = ClearSpace.RECOMMENDED,
         colors: LogomarkColors | tuple[Color] = LogomarkColors.DEFAULT,
+        collapse_transforms: bool = False,
+        merge_monochrome: bool = False,
         **kwargs,
     ):
         self.ilambda = ilambda
+        self.collapse_transforms = collapse_transforms
+        self.merge_monochrome = merge_monochrome
         self.colors_name = getattr(colors, "name", "custom")
         self.colors_value = getattr(colors, "value", colors)
         self.color_style = color_style
@@ -194,9 +223,10 @@ class Logomark(BaseRenderable):
         )
 
     @property
+    @memoize(key=_FLAKE_GEOMETRY)
     def circumradius(self):
         """The logomark circumradius."""
-        return max(point.x for points in self.make_flake_points() for point in points)
+        return max(points.x.max() for points in self.make_flake_point_arrays()).item()
 
     @property
     def inradius(self):
@@ -235,33 +265,33 @@ class Logomark(BaseRenderable):
 
     def make_svg_elements(self):
         match self.color_style:
+            case ColorStyle.FLAT if self.is_merged:
+                yield self.make_merged_flake_path()
             case ColorStyle.FLAT:
-                return self.make_clean_flake_polygons_flat()
+                yield from self.make_clean_flake_polygons_flat()
             case ColorStyle.GRADIENT:
-                return (
-                    self.make_flake_gradients_defs(),
-                    self.make_clean_flake_polygons_gradient(),
-                )
+                yield self.make_flake_gradients_defs()
+                yield self.make_clean_flake_polygons_gradient()
             case _:
                 raise Exception(f"Unknown ColorStyle: {self.color_style}")
 
-    def make_flake_points(self):
-        lambda_points_gap = self.ilambda.make_lambda_points()
+    @memoize(key=_FLAKE_GEOMETRY)
+    def make_flake_point_arrays(self) -> tuple[PointArray, ...]:
+        lambda_points_gap = self.ilambda.make_lambda_point_array()
         lambda_points_no_gap = self.ilambda.make_named_lambda_points(gap=0)
 
         translation_to_tip = -Vector(tuple(lambda_points_no_gap["upper_apex"]))
         translation_left = Vector((-self.ilambda.radius, 0))
         translation = translation_to_tip + translation_left
 
-        lambdas_translated = [point + translation for point in lambda_points_gap]
-        flake_points = [
-            Points([point.rotate(angle) for point in lambdas_translated])
-            for angle in range(0, 360, 60)
-        ]
-        return flake_points
+        lambdas_translated = lambda_points_gap + translation
+        return tuple(lambdas_translated.rotate(angle) for angle in range(0, 360, 60))
+
+    def make_flake_points(self):
+        return [points.to_points() for points in self.make_flake_point_arrays()]
 
     def make_clean_flake_polygons_flat(self):
-        flake_points = self.make_flake_points()
+        flake_points = self.make_flake_point_arrays()
 
         return tuple(
             svg.Polygon(
@@ -273,6 +303,21 @@ class Logomark(BaseRenderable):
             )
         )
 
+    @property
+    def is_merged(self):
+        """Whether the flat snowflake is drawn as one path instead of six polygons."""
+        return self.merge_monochrome and len(set(self.css_color_names)) == 1
+
+    def make_merged_flake_path(self):
+        silhouette = polygons.union_all(
+            polygons.region(lambda_points)
+            for lambda_points in self.make_flake_point_arrays()
+        )
+        return svg.Path(
+            d=polygons.to_path_data(silhouette),
+            fill=self.css_color_names[0],
+        )
+
     def make_gradient_end_points(self):
         lambda_points_no_gap = self.ilambda.make_named_lambda_points(gap=0)
         stop_point = lambda_points_no_gap[
@@ -317,23 +362,30 @@ class Logomark(BaseRenderable):
             )
         return (svg.Defs(elements=linear_gradients),)
 
+    def _make_transform(self, transforms):
+        if self.collapse_transforms:
+            return simplify_transforms(transforms)
+        return transforms
+
     def make_clean_flake_polygons_gradient(self):
-        lambda_points_gap = self.ilambda.make_lambda_points()
+        lambda_points_gap = self.ilambda.make_lambda_point_array()
         return tuple(
             svg.Polygon(
                 points=lambda_points_gap.to_list(),
                 fill=f"url(#{fill})",
-                transform=[
-                    svg.Translate(
-                        1.25 * self.ilambda.radius * cosd(120),
-                        1.25 * self.ilambda.radius * sind(120),
-                    ),
-                    svg.Rotate(
-                        angle,
-                        -1.25 * self.ilambda.radius * cosd(120),
-                        -1.25 * self.ilambda.radius * sind(120),
-                    ),
-                ],
+                transform=self._make_transform(
+                    [
+                        svg.Translate(
+                            1.25 * self.ilambda.radius * cosd(120),
+                            1.25 * self.ilambda.radius * sind(120),
+                        ),
+                        svg.Rotate(
+                            angle,
+                            -1.25 * self.ilambda.radius * cosd(120),
+                            -1.25 * self.ilambda.radius * sind(120),
+                        ),
+                    ]
+                ),
             )
             for angle, fill in zip(
                 range(0, 360, 60), itertools.cycle(self.css_color_names)
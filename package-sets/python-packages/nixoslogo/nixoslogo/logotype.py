@@ -1,12 +1,16 @@
 import atexit
+import hashlib
 import logging
+import os
 import shutil
 import tempfile
-from collections.abc import Callable
+import weakref
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
-import fontforge
 import svg
 
 from nixoslogo.core import (
@@ -16,13 +20,61 @@ from nixoslogo.core import (
     NIXOS_LIGHT_BLUE,
     BaseRenderable,
     ClearSpace,
+    FontOpenMode,
     LogotypeStyle,
     get_nixos_logotype_font_file,
 )
+from nixoslogo.fonts import FontBackend, get_font_backend, layer_key, layer_path
 from nixoslogo.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
 
+FONT_OPEN_MODE_ENVVAR = "NIXOSLOGO_FONT_OPEN_MODE"
+
+# Copies of font files opened with `FontOpenMode.SHARED_COPY`, by SHA-256 digest.
+_shared_font_copies: dict[str, Path] = {}
+
+# The digests of font files, by path, modification time and size.
+_font_digests: dict[tuple[str, int, int], str] = {}
+
+
+def _font_digest(path: Path) -> str:
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _font_digests:
+        _font_digests[key] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return _font_digests[key]
+
+
+def get_font_open_mode(
+    name: str | None = None, default: FontOpenMode = FontOpenMode.COPY
+) -> FontOpenMode:
+    """
+    The `FontOpenMode` called `name`, such as "shared_copy".
+
+    Defaults to the one named by `$NIXOSLOGO_FONT_OPEN_MODE`, or `default`.
+    """
+    name = name or os.getenv(FONT_OPEN_MODE_ENVVAR)
+    if not name:
+        return default
+    try:
+        return FontOpenMode[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown font open mode: {name}") from None
+
+
+def _shared_font_copy(source_path: Path) -> Path:
+    """A copy of `source_path` shared by every loader of the same font."""
+    digest = _font_digest(source_path)
+    if digest not in _shared_font_copies:
+        tempdir = Path(tempfile.mkdtemp(prefix="fontforge_shared_"))
+        atexit.register(shutil.rmtree, tempdir, ignore_errors=True)
+        font_path = tempdir / source_path.name
+        shutil.copy2(source_path, font_path)
+        logger.debug(f"Shared font file copied: {font_path}")
+        _shared_font_copies[digest] = font_path
+    return _shared_font_copies[digest]
+
 
 class FontLoader:
     def __init__(
@@ -32,12 +84,17 @@ class FontLoader:
         capHeight: int | None = None,
         scale_glyph: bool = True,
         offset_glyph: bool = True,
+        open_mode: FontOpenMode | None = None,
+        backend: type[FontBackend] | None = None,
     ):
         self.get_font_file = get_font_file
         self.transforms_map = transforms_map
         self.capHeight = capHeight
         self.scale_glyph = scale_glyph
         self.offset_glyph = offset_glyph
+        self.open_mode = get_font_open_mode() if open_mode is None else open_mode
+        self.backend = get_font_backend() if backend is None else backend
+        self._shared = False
 
         self._open_font_file()
         self._setup_glyphs()
@@ -45,45 +102,73 @@ class FontLoader:
     def _open_font_file(self):
         source_path = self.get_font_file()
         logger.debug(f"Original font file: {source_path}")
-        self._tempdir = Path(tempfile.mkdtemp(prefix="fontforge_"))
-        logger.debug(f"Temporary directory created: {self._tempdir}")
-        self._font_path = self._tempdir / source_path.name
-        shutil.copy2(source_path, self._font_path)
-        logger.debug(f"Font file copied: {self._font_path}")
-
-        self.font = fontforge.open(str(self._font_path))
-        logger.debug(f"Font file loaded: {self._font_path}")
+        self._tempdir = None
+        match self.open_mode:
+            case FontOpenMode.COPY:
+                self._tempdir = Path(tempfile.mkdtemp(prefix="fontforge_"))
+                logger.debug(f"Temporary directory created: {self._tempdir}")
+                self._font_path = self._tempdir / source_path.name
+                shutil.copy2(source_path, self._font_path)
+                logger.debug(f"Font file copied: {self._font_path}")
+            case FontOpenMode.SHARED_COPY:
+                self._font_path = _shared_font_copy(source_path)
+            case FontOpenMode.DIRECT:
+                self._font_path = source_path
+            case _:
+                raise ValueError(f"Unknown FontOpenMode: {self.open_mode}")
+
+        self.font = self.backend(self._font_path)
+        logger.debug(f"Font file loaded with {self.backend.name}: {self._font_path}")
         self._cleaned_up = False
 
         # Register the cleanup function to be called when the Python process exits
-        atexit.register(self._cleanup_once)
+        if self._tempdir is not None:
+            atexit.register(self._cleanup_once)
 
     def _setup_glyphs(self):
         self._set_ref_size()
 
-        for character, transforms in self.transforms_map.items():
-            if self.scale_glyph:
-                self._scale_glyph(character, transforms)
-            if self.offset_glyph:
-                self._offset_glyph(character, transforms)
+        # Glyphs are scaled and offset by `glyph` when first asked for.
+        self.prepared_glyphs: set[str] = set()
+        # The boxes `bounding_box` has measured, by `layer_key`, if recorded.
+        self.measured_boxes: dict[bytes, tuple] | None = None
+
+    def glyph(self, character: str):
+        """The backend glyph for `character`, prepared on first access."""
+        if character not in self.prepared_glyphs:
+            transforms = self.transforms_map.get(character)
+            if transforms is not None:
+                if self.scale_glyph:
+                    self._scale_glyph(character, transforms)
+                if self.offset_glyph:
+                    self._offset_glyph(character, transforms)
+            self.prepared_glyphs.add(character)
+        return self.font.glyph(character)
+
+    def bounding_box(self, layer) -> tuple[float, float, float, float]:
+        """The bounding box of `layer`, as the font backend measures it."""
+        box = tuple(layer.boundingBox())
+        if self.measured_boxes is not None:
+            self.measured_boxes[layer_key(layer)] = box
+        return box
 
     def _set_ref_size(self):
         """
         Conditionally update the font size.
 
-        The glyphs can be scaled by updating the `em` attribute.
+        The glyphs are scaled by the backend, as updating the `em` attribute does.
         `capHeight` goes to zero because we are flipping glyphs so that is stored off for later use.
         """
         if self.capHeight is None:
             self.scale = 1
-            self.capHeight = int(self.font.capHeight)
+            self.capHeight = int(self.font.cap_height)
         else:
-            self.scale = self.capHeight / self.font.capHeight
-            self.font.em = round(self.font.em * self.scale)
+            self.scale = self.capHeight / self.font.cap_height
+            self.font.scale(self.scale)
 
     def _scale_glyph(self, character, transforms):
         """Scale a glyph; primarily used for vertically flipping."""
-        self.font[character].transform(
+        self.font.glyph(character).transform(
             (
                 transforms["scale_x"],
                 0,
@@ -96,19 +181,23 @@ class FontLoader:
 
     def _offset_glyph(self, character, transforms):
         """Offset a glyph; primarily used to remove the left side bearing."""
-        self.font[character].transform(
+        glyph = self.font.glyph(character)
+        glyph.transform(
             (
                 1,
                 0,
                 0,
                 1,
-                -self.font[character].left_side_bearing,
+                -glyph.left_side_bearing,
                 0,
             )
         )
 
     def cleanup(self):
         """Manual cleanup method."""
+        if self._shared:
+            logger.debug(f"Deferring cleanup of shared font file: {self._font_path}")
+            return
         logger.debug(f"Manual cleanup for font file: {self._font_path}")
         self._cleanup_once()
 
@@ -124,6 +213,8 @@ class FontLoader:
         except Exception as e:
             logger.error(f"Error closing font file: {self._font_path}, {e}")
         # Remove the temporary directory and its contents
+        if self._tempdir is None:
+            return
         try:
             shutil.rmtree(self._tempdir, ignore_errors=True)
             logger.debug(f"Temporary directory removed: {self._tempdir}")
@@ -135,6 +226,207 @@ class FontLoader:
         self._cleanup_once()
 
 
+def _font_loader_key(
+    get_font_file: Callable[[], Path],
+    transforms_map: dict[str, Any],
+    capHeight: int | None,
+    scale_glyph: bool,
+    offset_glyph: bool,
+    backend: type[FontBackend] | None = None,
+) -> tuple:
+    transforms = tuple(
+        sorted(
+            (character, tuple(sorted(transform.items())))
+            for character, transform in transforms_map.items()
+        )
+    )
+    return (
+        str(get_font_file()),
+        transforms,
+        capHeight,
+        scale_glyph,
+        offset_glyph,
+        (get_font_backend() if backend is None else backend).name,
+    )
+
+
+class FontLoaderRegistry:
+    """
+    Font loaders shared by the whole process, one per font and set of options.
+
+    `acquire` hands out the loader for a font file, cap height, transforms map
+    and glyph flags, opening it the first time, and counts a reference to it.
+    `release` drops a reference, and the loader is cleaned up once the last
+    one is gone. A reference taken for an `owner` is also dropped when the
+    owner is garbage collected, so renderables do not have to release their
+    loaders by hand.
+
+    Glyph transforms are applied to copies of the font layers, so a loader can
+    safely serve any number of renderables.
+    """
+
+    def __init__(self):
+        self._loaders: dict[tuple, FontLoader] = {}
+        self._references: Counter[tuple] = Counter()
+        self._owners: dict[tuple[int, tuple], weakref.finalize] = {}
+        self._scope: set[tuple] | None = None
+        # Serves prepared glyphs without opening fonts, see `nixoslogo.bundle`.
+        self.bundle = None
+        # The font backend of loaders that do not ask for one.
+        self.backend: type[FontBackend] | None = None
+        # The open mode of loaders that do not ask for one.
+        self.open_mode: FontOpenMode | None = None
+        # Whether loaders opened from now on record the boxes they measure.
+        self.record_boxes = False
+
+    def __iter__(self) -> Iterator[tuple[tuple, FontLoader]]:
+        """The key and loader of every loader that is currently shared."""
+        return iter(list(self._loaders.items()))
+
+    def __contains__(self, loader: FontLoader) -> bool:
+        key = getattr(loader, "_registry_key", None)
+        return self._loaders.get(key) is loader
+
+    def acquire(
+        self,
+        owner: object | None = None,
+        open_mode: FontOpenMode | None = None,
+        **kwargs,
+    ) -> FontLoader:
+        """
+        The shared loader for the `FontLoader` arguments `kwargs`.
+
+        A loader that is not shared yet is served from `bundle` if it has the
+        glyphs for `kwargs`, and otherwise opened with its font backend and
+        `open_mode`, `backend` and the registry's `open_mode` by default. The
+        open mode does not change the glyphs, so loaders are shared across
+        modes.
+        """
+        if kwargs.get("backend") is None:
+            kwargs["backend"] = self.backend
+        if open_mode is None:
+            open_mode = self.open_mode
+        key = _font_loader_key(**kwargs)
+        if key not in self._loaders:
+            loader = None
+            if self.bundle is not None:
+                loader = self.bundle.loader(**kwargs)
+            if loader is None:
+                loader = FontLoader(open_mode=open_mode, **kwargs)
+                if self.record_boxes:
+                    loader.measured_boxes = {}
+            loader._shared = True
+            loader._registry_key = key
+            self._loaders[key] = loader
+            logger.debug(f"Shared font loader opened: {key[0]}")
+        loader = self._loaders[key]
+        if self._scope is not None and key not in self._scope:
+            self._scope.add(key)
+            self._references[key] += 1
+        self._reference(key, owner)
+        return loader
+
+    def hold(self, owner: object, loader: FontLoader):
+        """Keep the shared `loader` open for as long as `owner` is alive."""
+        if loader in self:
+            self._reference(loader._registry_key, owner)
+
+    def _reference(self, key: tuple, owner: object | None):
+        if owner is not None:
+            if (id(owner), key) in self._owners:
+                return
+            self._owners[(id(owner), key)] = weakref.finalize(
+                owner, self._release_owner, id(owner), key
+            )
+        self._references[key] += 1
+
+    def _release_owner(self, owner_id: int, key: tuple):
+        del self._owners[(owner_id, key)]
+        self._release(key)
+
+    def release(self, loader: FontLoader, owner: object | None = None):
+        """
+        Drop a reference to `loader`, the one held for `owner` if given.
+
+        A loader that is not shared is cleaned up straight away.
+        """
+        if loader not in self:
+            loader.cleanup()
+            return
+        key = loader._registry_key
+        if owner is None:
+            self._release(key)
+        elif (id(owner), key) in self._owners:
+            self._owners[(id(owner), key)]()
+
+    def _release(self, key: tuple):
+        self._references[key] -= 1
+        if self._references[key] > 0:
+            return
+        del self._references[key]
+        loader = self._loaders.pop(key)
+        loader._shared = False
+        loader.cleanup()
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """
+        Keep every loader acquired inside the context open until it exits.
+
+        Renderables made one after the other then reuse the same loaders,
+        even though each releases its own when it is collected. Nested scopes
+        defer to the outermost one.
+        """
+        if self._scope is not None:
+            yield
+            return
+
+        self._scope = set()
+        try:
+            yield
+        finally:
+            keys, self._scope = self._scope, None
+            for key in keys:
+                self._release(key)
+
+
+# The registry `get_font_loader` hands out loaders from.
+font_loaders = FontLoaderRegistry()
+
+
+def get_font_loader(
+    get_font_file: Callable[[], Path] = get_nixos_logotype_font_file,
+    transforms_map: dict[str, Any] = DEFAULT_ROUTE159_TRANSFORMS,
+    capHeight: int | None = None,
+    scale_glyph: bool = True,
+    offset_glyph: bool = True,
+    owner: object | None = None,
+    open_mode: FontOpenMode | None = None,
+    backend: type[FontBackend] | None = None,
+) -> FontLoader:
+    """
+    The shared FontLoader for these arguments, from `font_loaders`.
+
+    The reference is held for `owner` if given; otherwise the caller has to
+    hand it back with `font_loaders.release`.
+    """
+    return font_loaders.acquire(
+        owner=owner,
+        get_font_file=get_font_file,
+        transforms_map=transforms_map,
+        capHeight=capHeight,
+        scale_glyph=scale_glyph,
+        offset_glyph=offset_glyph,
+        open_mode=open_mode,
+        backend=backend,
+    )
+
+
+def shared_font_loaders():
+    """Share font loaders between every renderable created inside the context."""
+    return font_loaders.scope()
+
+
 class Glyph(BaseRenderable):
     def __init__(
         self,
@@ -153,72 +445,24 @@ class Glyph(BaseRenderable):
 
         self._init_loader()
         self.font = self.loader.font
-        self.glyph = self.font[self.character]
+        self.glyph = self.loader.glyph(self.character)
         self.layer = self.glyph.foreground.dup()
 
         super().__init__(**kwargs)
 
     def _init_loader(self):
         if self.loader is None:
-            self.loader = FontLoader()
-
-    def get_path(self, layer):
-        path = []
-        for contour in layer:
-            first_iteration = True
-            points = list(contour)
-
-            # If last point is a control point
-            if not points[-1].on_curve:
-                points.append(points[0])
-
-            while points:
-                # First iteration of a contour should always be a move.
-                if first_iteration:
-                    point = points.pop(0)
-                    element = svg.MoveTo(point.x, point.y)
-                    path.append(element)
-                    first_iteration = False
-                    continue
-
-                if points[0].on_curve:
-                    # If the next point is on curve, it is a straight line from the previous point.
-                    point = points.pop(0)
-                    element = svg.LineTo(point.x, point.y)
-                    path.append(element)
-                    continue
-                if not points[0].on_curve and points[1].on_curve:
-                    # If the next point is off curve and the following point is on curve,
-                    # it is a quadratic Bézier curve. So take the next 2 points.
-                    points_bezier = [
-                        elem
-                        for pair in (
-                            (point.x, point.y)
-                            for point in (points.pop(0) for _ in range(2))
-                        )
-                        for elem in pair
-                    ]
-                    element = svg.QuadraticBezier(*points_bezier)
-                    path.append(element)
-                else:
-                    # If the next two points are off curve, it is a cubic Bézier curve.
-                    # So take the next 3 points.
-                    points_bezier = [
-                        elem
-                        for pair in (
-                            (point.x, point.y)
-                            for point in (points.pop(0) for _ in range(3))
-                        )
-                        for elem in pair
-                    ]
-                    element = svg.CubicBezier(*points_bezier)
-                    path.append(element)
+            self.loader = get_font_loader(owner=self)
+        else:
+            font_loaders.hold(self, self.loader)
 
-        return path
+    @staticmethod
+    def get_path(layer):
+        return layer_path(layer)
 
     @property
     def elements_bounding_box(self):
-        return self.layer.boundingBox()
+        return self.loader.bounding_box(self.layer)
 
     def _get_clearspace(self):
         match self.clear_space:
@@ -306,7 +550,9 @@ class Logotype(BaseRenderable):
 
     def _init_loader(self):
         if self.loader is None:
-            self.loader = FontLoader()
+            self.loader = get_font_loader(owner=self)
+        else:
+            font_loaders.hold(self, self.loader)
 
     def _load_glyphs(self):
         self.glyphs = tuple(
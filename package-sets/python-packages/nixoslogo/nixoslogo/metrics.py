@@ -0,0 +1,384 @@
+import itertools
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from operator import itemgetter
+
+import numpy as np
+import svg
+
+from nixoslogo.bbox import IDENTITY, UNRENDERED_ELEMENTS
+from nixoslogo.geometry import Affine, PointArray
+from nixoslogo.optimize import absolute_commands
+
+# === Constants ===
+
+# How far the flattened outline may stray from the curves, in user units.
+FLATTEN_TOLERANCE = 0.1
+
+# The most pieces a single curve is flattened into.
+MAX_SUBDIVISIONS = 1024
+
+# The control point distance of a cubic quarter circle of radius 1.
+KAPPA = 4 * (math.sqrt(2) - 1) / 3
+
+# === Functions ===
+
+
+def _line(start, end) -> list:
+    (x0, y0), (x1, y1) = start, end
+    dx, dy = (x1 - x0) / 3, (y1 - y0) / 3
+    return [start, (x0 + dx, y0 + dy), (x1 - dx, y1 - dy), end]
+
+
+def _quadratic(start, control, end) -> list:
+    """The quadratic Bézier `start`, `control`, `end` raised to a cubic."""
+    (x0, y0), (cx, cy), (x1, y1) = start, control, end
+    return [
+        start,
+        (x0 + 2 * (cx - x0) / 3, y0 + 2 * (cy - y0) / 3),
+        (x1 + 2 * (cx - x1) / 3, y1 + 2 * (cy - y1) / 3),
+        end,
+    ]
+
+
+def _reflect(point, control) -> tuple:
+    return (2 * point[0] - control[0], 2 * point[1] - control[1])
+
+
+def path_segments(path_data: Iterable[svg.PathData]) -> tuple[list, list]:
+    """
+    The segments of `path_data` as cubic Béziers, and the contour of each.
+
+    Lines and quadratic curves are raised to cubics so that every segment can
+    be flattened by the same vectorized code. Every contour is closed, as it
+    is when it is filled.
+    """
+    commands = absolute_commands(path_data)
+    if commands is None:
+        raise NotImplementedError("Elliptical arcs are not supported")
+
+    segments, contours = [], []
+    contour = -1
+    current = start = control = (0, 0)
+    previous = None
+    closed = True
+
+    def close():
+        if not closed and current != start:
+            segments.append(_line(current, start))
+            contours.append(contour)
+
+    for letter, points in commands:
+        points = [(point.x, point.y) for point in points]
+        match letter:
+            case "M":
+                close()
+                closed = True
+                current = start = control = points[0]
+                previous = letter
+                continue
+            case "Z":
+                close()
+                closed = True
+                current = control = start
+                previous = letter
+                continue
+        if closed:
+            contour += 1
+            closed = False
+        match letter:
+            case "L":
+                segment = _line(current, points[0])
+            case "Q":
+                control = points[0]
+                segment = _quadratic(current, control, points[1])
+            case "T":
+                control = (
+                    _reflect(current, control) if previous in ("Q", "T") else current
+                )
+                segment = _quadratic(current, control, points[0])
+            case "C":
+                segment = [current, *points]
+                control = points[1]
+            case "S":
+                first = (
+                    _reflect(current, control) if previous in ("C", "S") else current
+                )
+                segment = [current, first, *points]
+                control = points[0]
+            case _:
+                raise ValueError(f"Unknown PathData: {letter}")
+        segments.append(segment)
+        contours.append(contour)
+        current = points[-1]
+        previous = letter
+    close()
+    return segments, contours
+
+
+def polygon_segments(points: Sequence) -> list:
+    """The edges of the closed polygon `points` as cubic Béziers."""
+    vertices = [tuple(point) for point in points]
+    return [
+        _line(vertices[index], vertices[(index + 1) % len(vertices)])
+        for index in range(len(vertices))
+    ]
+
+
+def ellipse_segments(cx, cy, rx, ry) -> list:
+    """Four cubic Béziers within 0.03% of the ellipse radius."""
+    kx, ky = KAPPA * rx, KAPPA * ry
+    return [
+        [(cx + rx, cy), (cx + rx, cy + ky), (cx + kx, cy + ry), (cx, cy + ry)],
+        [(cx, cy + ry), (cx - kx, cy + ry), (cx - rx, cy + ky), (cx - rx, cy)],
+        [(cx - rx, cy), (cx - rx, cy - ky), (cx - kx, cy - ry), (cx, cy - ry)],
+        [(cx, cy - ry), (cx + kx, cy - ry), (cx + rx, cy - ky), (cx + rx, cy)],
+    ]
+
+
+def element_contours(elements, transform: Affine = IDENTITY):
+    """
+    The filled contours of an svg.py element tree.
+
+    Yields each contour as the element it belongs to and its cubic Béziers,
+    an (N, 4, 2) array, through the transforms of the element and its
+    ancestors.
+    """
+    match elements:
+        case None | str():
+            return
+        case svg.Element():
+            element = elements
+        case _ if isinstance(elements, Iterable):
+            for elem in elements:
+                yield from element_contours(elem, transform)
+            return
+        case _:
+            return
+    if isinstance(element, UNRENDERED_ELEMENTS) or getattr(element, "fill", None) in (
+        "none",
+        "transparent",
+    ):
+        return
+    if getattr(element, "transform", None):
+        transform = transform @ Affine.from_svg(element.transform)
+
+    def transformed(segments):
+        if not segments:
+            return []
+        points = transform @ PointArray(np.reshape(segments, (-1, 2)))
+        return [(element, points.value.reshape(-1, 4, 2))]
+
+    match element:
+        case svg.Path() if element.d:
+            segments, contours = path_segments(element.d)
+            for _, group in itertools.groupby(
+                zip(segments, contours), key=itemgetter(1)
+            ):
+                yield from transformed([segment for segment, _ in group])
+        case svg.Polygon() | svg.Polyline() if element.points:
+            numbers = [float(elem) for elem in element.points]
+            yield from transformed(
+                polygon_segments(list(zip(numbers[::2], numbers[1::2])))
+            )
+        case svg.Rect():
+            x, y = element.x or 0, element.y or 0
+            width, height = element.width or 0, element.height or 0
+            yield from transformed(
+                polygon_segments(
+                    [(x, y), (x + width, y), (x + width, y + height), (x, y + height)]
+                )
+            )
+        case svg.Circle():
+            yield from transformed(
+                ellipse_segments(element.cx or 0, element.cy or 0, element.r, element.r)
+            )
+        case svg.Ellipse():
+            yield from transformed(
+                ellipse_segments(
+                    element.cx or 0, element.cy or 0, element.rx, element.ry
+                )
+            )
+        case _:
+            yield from element_contours(getattr(element, "elements", None), transform)
+
+
+def flatten(
+    segments: np.ndarray,
+    tolerance: float = FLATTEN_TOLERANCE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten the cubic Béziers `segments`, an (N, 4, 2) array, all at once.
+
+    Each curve is cut into as many equal steps in `t` as keep the chords
+    within `tolerance` of it, from the bound on its second derivative; lines
+    stay in one piece. Returns the start of every piece and the index of the
+    segment it belongs to. A piece ends where the next one starts.
+    """
+    p0, p1, p2, p3 = (segments[:, index, :] for index in range(4))
+    second = np.maximum(
+        np.hypot(*(p0 - 2 * p1 + p2).T),
+        np.hypot(*(p1 - 2 * p2 + p3).T),
+    )
+    counts = np.clip(
+        np.ceil(np.sqrt(0.75 * second / tolerance)), 1, MAX_SUBDIVISIONS
+    ).astype(np.intp)
+    owners = np.repeat(np.arange(len(segments)), counts)
+    steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    t = (steps / counts[owners])[:, np.newaxis]
+    s = 1 - t
+    points = (
+        s**3 * p0[owners]
+        + 3 * s**2 * t * p1[owners]
+        + 3 * s * t**2 * p2[owners]
+        + t**3 * p3[owners]
+    )
+    return points, owners
+
+
+def _contour_depths(
+    points: np.ndarray,
+    following: np.ndarray,
+    vertex_contours: np.ndarray,
+    contour_elements: np.ndarray,
+) -> np.ndarray:
+    """
+    How many other contours of the same element each contour lies inside.
+
+    A contour is tested by its first vertex, with the even-odd rule against
+    every other contour of its element, so contours are taken to be nested
+    or apart, not crossing.
+    """
+    contour_count = len(contour_elements)
+    depths = np.zeros(contour_count, dtype=np.intp)
+    starts = np.searchsorted(vertex_contours, np.arange(contour_count))
+    x0, y0 = points.T
+    x1, y1 = points[following].T
+    for element in np.unique(contour_elements):
+        contours = np.flatnonzero(contour_elements == element)
+        if len(contours) < 2:
+            continue
+        edges = np.flatnonzero(np.isin(vertex_contours, contours))
+        px, py = points[starts[contours]].T[:, :, np.newaxis]
+        ex0, ey0, ex1, ey1 = x0[edges], y0[edges], x1[edges], y1[edges]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crosses = ((ey0 > py) != (ey1 > py)) & (
+                px < ex0 + (py - ey0) * (ex1 - ex0) / (ey1 - ey0)
+            )
+        owners = np.searchsorted(contours, vertex_contours[edges])
+        crossings = (
+            crosses.astype(np.intp) @ np.eye(len(contours), dtype=np.intp)[owners]
+        )
+        inside = crossings % 2 == 1
+        np.fill_diagonal(inside, False)
+        depths[contours] = inside.sum(axis=1)
+    return depths
+
+
+def outline_metrics(
+    shapes: Iterable,
+    tolerance: float = FLATTEN_TOLERANCE,
+) -> "OutlineMetrics":
+    """
+    Measure the filled outlines of each of `shapes` in one vectorized pass.
+
+    A shape is an svg.py element tree, such as what a renderable's
+    `make_svg_elements` returns. Its paths, polygons, rectangles, circles and
+    ellipses are measured through their transforms; unfilled elements are
+    skipped.
+
+    Contours are wound the same way before they are summed, whichever way
+    they were drawn, and those inside an odd number of other contours of
+    their element are holes. Overlapping elements are counted twice.
+    """
+    shapes = list(shapes)
+    shape_count = len(shapes)
+    segments, contours, owners, contour_elements = [], [], [], []
+    element_index, previous = -1, None
+    for shape, elements in enumerate(shapes):
+        # The contours of an element are yielded one after the other.
+        for element, contour in element_contours(elements):
+            if element is not previous:
+                element_index, previous = element_index + 1, element
+            segments.append(contour)
+            contours.append(np.full(len(contour), len(owners)))
+            owners.append(shape)
+            contour_elements.append(element_index)
+    if not segments:
+        empty = np.zeros(shape_count)
+        return OutlineMetrics(
+            area=empty,
+            perimeter=empty,
+            centroid=np.full((shape_count, 2), np.nan),
+            bounding_box=np.full((shape_count, 4), np.nan),
+        )
+
+    points, segment_owners = flatten(np.concatenate(segments), tolerance)
+    vertex_contours = np.concatenate(contours)[segment_owners]
+    vertex_shapes = np.asarray(owners)[vertex_contours]
+
+    # Close each contour: its last vertex is followed by its first.
+    following = np.arange(1, len(points) + 1)
+    ends = np.r_[vertex_contours[1:] != vertex_contours[:-1], True]
+    following[ends] = np.flatnonzero(np.r_[True, ends[:-1]])
+
+    x, y = points.T
+    next_x, next_y = x[following], y[following]
+    cross = x * next_y - next_x * y
+
+    # Wind outer contours positively and holes negatively.
+    depths = _contour_depths(
+        points, following, vertex_contours, np.asarray(contour_elements)
+    )
+    contour_areas = np.bincount(vertex_contours, cross, minlength=len(owners))
+    orientation = np.sign(contour_areas) * np.where(depths % 2 == 0, 1, -1)
+    cross = cross * orientation[vertex_contours]
+
+    area = np.bincount(vertex_shapes, cross, minlength=shape_count) / 2
+    perimeter = np.bincount(
+        vertex_shapes, np.hypot(next_x - x, next_y - y), minlength=shape_count
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centroid = np.column_stack(
+            [
+                np.bincount(vertex_shapes, (x + next_x) * cross, minlength=shape_count),
+                np.bincount(vertex_shapes, (y + next_y) * cross, minlength=shape_count),
+            ]
+        ) / (6 * area[:, np.newaxis])
+
+    bounding_box = np.full((shape_count, 4), np.inf)
+    bounding_box[:, 2:] = -np.inf
+    np.minimum.at(bounding_box[:, 0], vertex_shapes, x)
+    np.minimum.at(bounding_box[:, 1], vertex_shapes, y)
+    np.maximum.at(bounding_box[:, 2], vertex_shapes, x)
+    np.maximum.at(bounding_box[:, 3], vertex_shapes, y)
+    bounding_box[~np.isfinite(bounding_box)] = np.nan
+
+    return OutlineMetrics(
+        area=area,
+        perimeter=perimeter,
+        centroid=centroid,
+        bounding_box=bounding_box,
+    )
+
+
+# === Classes ===
+
+
+@dataclass(kw_only=True)
+class OutlineMetrics:
+    """Metrics of a batch of shapes, one row per shape."""
+
+    area: np.ndarray
+    perimeter: np.ndarray
+    centroid: np.ndarray
+    bounding_box: np.ndarray
+
+    @property
+    def coverage(self) -> np.ndarray:
+        """The share of each bounding box that is filled."""
+        width = self.bounding_box[:, 2] - self.bounding_box[:, 0]
+        height = self.bounding_box[:, 3] - self.bounding_box[:, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.area / (width * height)
@@ -0,0 +1,80 @@
+import base64
+import hashlib
+import os
+import stat
+import struct
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+# === Constants ===
+
+NAR_MAGIC = "nix-archive-1"
+
+# === Functions ===
+
+
+def _nar_string(value: bytes | str) -> bytes:
+    """Length-prefixed string padded to eight bytes, as in the Nix archive format."""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    padding = -len(value) % 8
+    return struct.pack("<Q", len(value)) + value + b"\0" * padding
+
+
+def _nar_strings(*values: bytes | str) -> bytes:
+    return b"".join(_nar_string(value) for value in values)
+
+
+def _serialise_regular(data: bytes, executable: bool = False) -> Iterator[bytes]:
+    yield _nar_strings("(", "type", "regular")
+    if executable:
+        yield _nar_strings("executable", "")
+    yield _nar_strings("contents", data, ")")
+
+
+def _serialise_path(path: Path) -> Iterator[bytes]:
+    mode = path.lstat().st_mode
+    if stat.S_ISLNK(mode):
+        yield _nar_strings("(", "type", "symlink", "target", os.readlink(path), ")")
+    elif stat.S_ISDIR(mode):
+        yield _nar_strings("(", "type", "directory")
+        for name in sorted(os.listdir(path), key=os.fsencode):
+            yield _nar_strings("entry", "(", "name", os.fsencode(name), "node")
+            yield from _serialise_path(path / name)
+            yield _nar_strings(")")
+        yield _nar_strings(")")
+    elif stat.S_ISREG(mode):
+        yield from _serialise_regular(path.read_bytes(), bool(mode & stat.S_IXUSR))
+    else:
+        raise ValueError(f"Cannot archive {path}: not a file, directory or symlink")
+
+
+def _serialise_files(files: Mapping[str, bytes]) -> Iterator[bytes]:
+    yield _nar_strings("(", "type", "directory")
+    for name in sorted(files, key=os.fsencode):
+        yield _nar_strings("entry", "(", "name", name, "node")
+        yield from _serialise_regular(files[name])
+        yield _nar_strings(")")
+    yield _nar_strings(")")
+
+
+def _sri_sha256(chunks: Iterator[bytes]) -> str:
+    digest = hashlib.sha256(_nar_string(NAR_MAGIC))
+    for chunk in chunks:
+        digest.update(chunk)
+    return "sha256-" + base64.b64encode(digest.digest()).decode("ascii")
+
+
+def nar_hash(path: Path) -> str:
+    """
+    SRI sha256 of the Nix archive of `path`.
+
+    This is the `outputHash` of a fixed-output derivation that uses
+    `outputHashMode = "recursive"` and produces `path`.
+    """
+    return _sri_sha256(_serialise_path(Path(path)))
+
+
+def nar_hash_files(files: Mapping[str, bytes]) -> str:
+    """`nar_hash` of a directory holding regular `files`, without writing them."""
+    return _sri_sha256(_serialise_files(files))
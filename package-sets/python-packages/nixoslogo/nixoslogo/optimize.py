@@ -0,0 +1,522 @@
+import dataclasses
+import math
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import svg
+from svg._types import Number
+
+from nixoslogo.bbox import IDENTITY, UNRENDERED_ELEMENTS
+from nixoslogo.geometry import Affine, Point
+
+# === Constants ===
+
+# The most decimal places a coordinate is rounded to; past that it is kept.
+MAX_DIGITS = 15
+
+# Path commands by letter: absolute and relative class, and the suffixes of
+# their point fields in order.
+PATH_COMMANDS = {
+    "M": (svg.MoveTo, svg.MoveToRel, ("",)),
+    "L": (svg.LineTo, svg.LineToRel, ("",)),
+    "Q": (svg.QuadraticBezier, svg.QuadraticBezierRel, ("1", "")),
+    "T": (svg.SmoothQuadraticBezier, svg.SmoothQuadraticBezierRel, ("",)),
+    "C": (svg.CubicBezier, svg.CubicBezierRel, ("1", "2", "")),
+    "S": (svg.SmoothCubicBezier, svg.SmoothCubicBezierRel, ("2", "")),
+}
+
+# The coordinates of simple shapes that are rounded.
+SHAPE_ATTRIBUTES = {
+    svg.Line: ("x1", "y1", "x2", "y2"),
+    svg.Rect: ("x", "y", "width", "height"),
+    svg.Circle: ("cx", "cy", "r"),
+    svg.Ellipse: ("cx", "cy", "rx", "ry"),
+}
+
+# A rounded (x, y) and the original point it came from.
+Vertex = tuple[tuple[Number, Number], Point]
+
+# === Functions ===
+
+
+def _quantize(value: Number, digits: int) -> Number:
+    """`value` rounded to `digits` decimal places, as an int when it is whole."""
+    value = round(value, digits)
+    return int(value) if float(value).is_integer() else value
+
+
+def _quantize_point(point: Point, digits: int) -> tuple[Number, Number]:
+    return (_quantize(point.x, digits), _quantize(point.y, digits))
+
+
+def _norm(transform: Affine) -> float:
+    """How much `transform` stretches lengths at most."""
+    a, b, c, d = transform.a, transform.b, transform.c, transform.d
+    squares = a * a + b * b + c * c + d * d
+    determinant = a * d - b * c
+    return math.sqrt((squares + math.sqrt(max(squares**2 - 4 * determinant**2, 0))) / 2)
+
+
+def _frame_error(original: Affine, quantized: Affine) -> float:
+    """How far rounding the translations has moved the coordinate frame."""
+    return math.hypot(quantized.e - original.e, quantized.f - original.f)
+
+
+def _segment_distance(point: Point, start: Point, end: Point) -> float:
+    dx, dy = end.x - start.x, end.y - start.y
+    length_squared = dx * dx + dy * dy
+    if not length_squared:
+        return math.dist(point, start)
+    t = ((point.x - start.x) * dx + (point.y - start.y) * dy) / length_squared
+    t = min(1, max(0, t))
+    return math.dist(point, (start.x + t * dx, start.y + t * dy))
+
+
+def absolute_commands(path_data) -> list[tuple[str, list[Point]]] | None:
+    """
+    `path_data` as command letters with absolute points, with `H` and `V`
+    turned into `L`. `None` if it has arcs, which are left as they are: moving
+    the end points of an arc can move the arc arbitrarily far.
+    """
+    commands = []
+    current = start = Point((0, 0))
+    for command in path_data:
+        letter = command.command.upper()
+        relative = command.command.islower()
+        origin = current if relative else Point((0, 0))
+        prefix = "d" if relative else ""
+        match letter:
+            case "Z":
+                commands.append(("Z", []))
+                current = start
+                continue
+            case "A":
+                return None
+            case "H":
+                points = [Point((origin.x + getattr(command, f"{prefix}x"), current.y))]
+            case "V":
+                points = [Point((current.x, origin.y + getattr(command, f"{prefix}y")))]
+            case _ if letter in PATH_COMMANDS:
+                points = [
+                    Point(
+                        (
+                            origin.x + getattr(command, f"{prefix}x{suffix}"),
+                            origin.y + getattr(command, f"{prefix}y{suffix}"),
+                        )
+                    )
+                    for suffix in PATH_COMMANDS[letter][2]
+                ]
+            case _:
+                raise ValueError(f"Unknown PathData: {command}")
+        commands.append(("L" if letter in "HV" else letter, points))
+        current = points[-1]
+        if letter == "M":
+            start = current
+    return commands
+
+
+def _shortest_command(
+    letter: str,
+    points: list[tuple[Number, Number]],
+    current: tuple[Number, Number],
+    digits: int,
+) -> svg.PathData:
+    """The shortest way to write a command from the quantized `current` point."""
+    absolute, relative, _ = PATH_COMMANDS[letter]
+    deltas = [
+        _quantize(value - origin, digits)
+        for point in points
+        for value, origin in zip(point, current)
+    ]
+    candidates = [
+        absolute(*(value for point in points for value in point)),
+        relative(*deltas),
+    ]
+    if letter == "L":
+        (x, y), (dx, dy) = points[0], deltas
+        if y == current[1]:
+            candidates += [svg.HorizontalLineTo(x), svg.HorizontalLineToRel(dx)]
+        if x == current[0]:
+            candidates += [svg.VerticalLineTo(y), svg.VerticalLineToRel(dy)]
+    return min(candidates, key=lambda candidate: len(str(candidate)))
+
+
+def optimize(elements, tolerance: float) -> tuple[list, "OptimizeReport"]:
+    """
+    `elements` with their coordinates rounded and redundant vertices removed,
+    moving no point by more than `tolerance` canvas units.
+    """
+    optimizer = Optimizer(tolerance=tolerance)
+    return optimizer(elements), optimizer.report
+
+
+# === Classes ===
+
+
+@dataclass(kw_only=True)
+class OptimizeReport:
+    tolerance: float
+    max_deviation: float = 0
+    vertices_removed: int = 0
+
+
+class Optimizer:
+    """
+    Shrink svg.py element trees by rounding coordinates and dropping vertices.
+
+    Coordinates are rounded to the fewest decimal places that keep every
+    point within `tolerance` of where it was, measured on the canvas, through
+    the transforms of the element and its ancestors. The translations of
+    those transforms are rounded too, within half the tolerance. Duplicate
+    and collinear vertices of polygons, polylines and straight path segments
+    are dropped when the remaining outline passes within `tolerance` of them,
+    and path commands are written relative or as `H`/`V` when that is
+    shorter. Curves move no further than their control points do.
+
+    The largest deviation of any point is recorded in `report`. The input
+    elements are not changed.
+    """
+
+    def __init__(self, tolerance: float):
+        self.tolerance = tolerance
+        self.report = OptimizeReport(tolerance=tolerance)
+
+    def __call__(
+        self,
+        elements,
+        original: Affine = IDENTITY,
+        quantized: Affine = IDENTITY,
+    ):
+        match elements:
+            case None | str():
+                return elements
+            case svg.Element():
+                return self._optimize(elements, original, quantized)
+            case _ if isinstance(elements, Iterable):
+                return [self(elem, original, quantized) for elem in elements]
+            case _:
+                return elements
+
+    def _optimize(
+        self,
+        element: svg.Element,
+        original: Affine,
+        quantized: Affine,
+    ) -> svg.Element:
+        if isinstance(element, UNRENDERED_ELEMENTS):
+            return element
+        changes = {}
+        if getattr(element, "transform", None):
+            changes["transform"] = self._quantize_transforms(
+                element.transform, original, quantized
+            )
+            original = original @ Affine.from_svg(element.transform)
+            quantized = quantized @ Affine.from_svg(changes["transform"])
+
+        match element:
+            case svg.Polygon() | svg.Polyline() if element.points:
+                numbers = list(element.points)
+                points = [Point((x, y)) for x, y in zip(numbers[::2], numbers[1::2])]
+                changes |= self._fit(
+                    self._quantize_vertices(
+                        points, isinstance(element, svg.Polygon), original, quantized
+                    ),
+                    original,
+                    quantized,
+                )
+            case svg.Line() | svg.Rect() | svg.Circle() | svg.Ellipse():
+                quantize = self._quantize_shape(element, original, quantized)
+                if quantize is not None:
+                    changes |= self._fit(quantize, original, quantized)
+            case svg.Path() if element.d:
+                commands = absolute_commands(element.d)
+                if commands is not None:
+                    changes |= self._fit(
+                        self._quantize_path(commands, original, quantized),
+                        original,
+                        quantized,
+                    )
+            case _ if getattr(element, "elements", None) is not None:
+                changes["elements"] = self(element.elements, original, quantized)
+        return dataclasses.replace(element, **changes)
+
+    def _digits(self, original: Affine, quantized: Affine) -> int:
+        """The fewest decimal places that could keep a point within tolerance."""
+        budget = self.tolerance - _frame_error(original, quantized)
+        if budget <= 0:
+            return MAX_DIGITS + 1
+        step = 2 * budget / (math.sqrt(2) * _norm(original))
+        return max(0, math.ceil(-math.log10(step)))
+
+    def _fit(
+        self,
+        quantize: Callable[[int], tuple[dict, float, int]],
+        original: Affine,
+        quantized: Affine,
+    ) -> dict:
+        """The changes `quantize` makes with the fewest digits within tolerance."""
+        for digits in range(self._digits(original, quantized), MAX_DIGITS + 1):
+            changes, deviation, removed = quantize(digits)
+            if deviation <= self.tolerance:
+                self.report.max_deviation = max(self.report.max_deviation, deviation)
+                self.report.vertices_removed += removed
+                return changes
+        return {}
+
+    def _deviation(
+        self,
+        original: Affine,
+        quantized: Affine,
+        vertices: Iterable[Vertex],
+    ) -> float:
+        return max(
+            (
+                math.dist(original @ point, quantized @ Point(value))
+                for value, point in vertices
+            ),
+            default=0,
+        )
+
+    def _quantize_transforms(
+        self,
+        transforms: list[svg.Transform],
+        original: Affine,
+        quantized: Affine,
+    ) -> list[svg.Transform]:
+        """`transforms` with each translation rounded while the frame stays put."""
+        target = original @ Affine.from_svg(transforms)
+        transforms = list(transforms)
+        for index, transform in enumerate(transforms):
+            if not isinstance(transform, svg.Translate):
+                continue
+            outer = original @ Affine.from_svg(transforms[:index])
+            step = self.tolerance / (math.sqrt(2) * _norm(outer))
+            digits = max(0, math.ceil(-math.log10(step)))
+            candidate = svg.Translate(
+                _quantize(transform.x, digits),
+                None if transform.y is None else _quantize(transform.y, digits),
+            )
+            attempt = [*transforms[:index], candidate, *transforms[index + 1 :]]
+            error = _frame_error(target, quantized @ Affine.from_svg(attempt))
+            if error <= self.tolerance / 2:
+                transforms = attempt
+        return transforms
+
+    def _simplify(
+        self,
+        chain: list[Vertex],
+        original: Affine,
+        quantized: Affine,
+        closed: bool = False,
+    ) -> tuple[list[Vertex], float]:
+        """
+        Drop the vertices of `chain` that the outline without them passes within
+        tolerance of. The first and, unless `closed`, the last vertex are kept.
+        """
+        kept = [chain[0]]
+        between = []  # the original points between kept[-2] and kept[-1]
+        pending = []  # the original points between kept[-1] and here
+        deviation = 0
+        for vertex in chain[1:] + chain[:1] if closed else chain[1:]:
+            if vertex[0] == kept[-1][0]:
+                pending.append(vertex[1])
+                continue
+            if len(kept) >= 2:
+                start = quantized @ Point(kept[-2][0])
+                end = quantized @ Point(vertex[0])
+                candidates = [*between, kept[-1][1], *pending]
+                distances = [
+                    _segment_distance(original @ point, start, end)
+                    for point in candidates
+                ]
+                if max(distances) <= self.tolerance:
+                    kept[-1] = vertex
+                    deviation = max(deviation, *distances)
+                    between = candidates
+                    pending = []
+                    continue
+            kept.append(vertex)
+            between = pending
+            pending = []
+        if closed and len(kept) > 1 and kept[-1][0] == chain[0][0]:
+            kept.pop()
+        return kept, deviation
+
+    def _quantize_vertices(
+        self,
+        points: list[Point],
+        closed: bool,
+        original: Affine,
+        quantized: Affine,
+    ) -> Callable[[int], tuple[dict, float, int]]:
+        def quantize(digits):
+            vertices = [(_quantize_point(point, digits), point) for point in points]
+            deviation = self._deviation(original, quantized, vertices)
+            kept, simplified = self._simplify(vertices, original, quantized, closed)
+            if len(kept) < (3 if closed else 2):
+                kept, simplified = vertices, 0
+            coordinates = [value for (x, y), _ in kept for value in (x, y)]
+            return (
+                {"points": coordinates},
+                max(deviation, simplified),
+                len(vertices) - len(kept),
+            )
+
+        return quantize
+
+    def _quantize_shape(
+        self,
+        element: svg.Line | svg.Rect | svg.Circle | svg.Ellipse,
+        original: Affine,
+        quantized: Affine,
+    ) -> Callable[[int], tuple[dict, float, int]] | None:
+        values = {
+            name: getattr(element, name) for name in SHAPE_ATTRIBUTES[type(element)]
+        }
+        if not all(isinstance(value, int | float | None) for value in values.values()):
+            return None
+
+        def quantize(digits):
+            changes = {
+                name: _quantize(value, digits)
+                for name, value in values.items()
+                if value is not None
+            }
+            before = {name: value or 0 for name, value in values.items()}
+            after = before | changes
+            match element:
+                case svg.Line():
+                    vertices = [
+                        ((after[x], after[y]), Point((before[x], before[y])))
+                        for x, y in (("x1", "y1"), ("x2", "y2"))
+                    ]
+                    deviation = self._deviation(original, quantized, vertices)
+                case svg.Rect():
+                    vertices = [
+                        (
+                            (
+                                after["x"] + dx * after["width"],
+                                after["y"] + dy * after["height"],
+                            ),
+                            Point(
+                                (
+                                    before["x"] + dx * before["width"],
+                                    before["y"] + dy * before["height"],
+                                )
+                            ),
+                        )
+                        for dx in (0, 1)
+                        for dy in (0, 1)
+                    ]
+                    deviation = self._deviation(original, quantized, vertices)
+                case _:
+                    # The center moves, and the outline moves with the radii.
+                    center = [
+                        (
+                            (after["cx"], after["cy"]),
+                            Point((before["cx"], before["cy"])),
+                        )
+                    ]
+                    radius_error = max(
+                        abs(after[name] - before[name])
+                        for name in ("r", "rx", "ry")
+                        if name in before
+                    )
+                    deviation = (
+                        self._deviation(original, quantized, center)
+                        + _norm(original) * radius_error
+                    )
+            return changes, deviation, 0
+
+        return quantize
+
+    def _quantize_path(
+        self,
+        commands: list[tuple[str, list[Point]]],
+        original: Affine,
+        quantized: Affine,
+    ) -> Callable[[int], tuple[dict, float, int]]:
+        def quantize(digits):
+            path_data = []
+            deviation = 0
+            removed = 0
+            current = start = ((0, 0), Point((0, 0)))
+            control = current  # the last control point, for `S` and `T`
+            previous = None  # the last curve or move command
+            run = []  # the vertices of consecutive `L` commands
+            for index, (letter, points) in enumerate(commands):
+                vertices = [(_quantize_point(point, digits), point) for point in points]
+                deviation = max(
+                    deviation, self._deviation(original, quantized, vertices)
+                )
+                following = (
+                    commands[index + 1][0] if index + 1 < len(commands) else None
+                )
+
+                match letter:
+                    case "L":
+                        run.extend(vertices)
+                        if following == "L":
+                            continue
+                        chain = [current, *run]
+                        kept, simplified = self._simplify(
+                            chain,
+                            original,
+                            quantized,
+                            closed=following == "Z" and current is start,
+                        )
+                        if len(kept) == 1 and following in ("S", "T"):
+                            # Keep a command for the smooth curve to reflect.
+                            kept.append(run[-1])
+                        deviation = max(deviation, simplified)
+                        removed += len(chain) - len(kept)
+                        for vertex in kept[1:]:
+                            path_data.append(
+                                _shortest_command("L", [vertex[0]], current[0], digits)
+                            )
+                            current = vertex
+                        current = control = run[-1]
+                        run = []
+                        continue
+                    case "Z":
+                        path_data.append(svg.ClosePath())
+                        current = control = start
+                        continue
+                    case "S" | "T":
+                        # The implicit control point moves with the previous one.
+                        if previous not in (
+                            ("C", "S") if letter == "S" else ("Q", "T")
+                        ):
+                            control = current
+                        reflected = (
+                            tuple(2 * c - p for c, p in zip(current[0], control[0])),
+                            Point(
+                                (
+                                    2 * current[1].x - control[1].x,
+                                    2 * current[1].y - control[1].y,
+                                )
+                            ),
+                        )
+                        deviation = max(
+                            deviation, self._deviation(original, quantized, [reflected])
+                        )
+
+                path_data.append(
+                    _shortest_command(
+                        letter, [value for value, _ in vertices], current[0], digits
+                    )
+                )
+                match letter:
+                    case "Q" | "C" | "S":
+                        control = vertices[-2]
+                    case "T":
+                        control = reflected
+                    case _:
+                        control = vertices[-1]
+                current = vertices[-1]
+                previous = letter
+                if letter == "M":
+                    start = current
+            return {"d": path_data}, deviation, removed
+
+        return quantize
@@ -0,0 +1,259 @@
+import math
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from nixoslogo.bbox import BoundingBox
+
+# === Constants ===
+
+# A straight line from one (x, y) point to another.
+Segment = tuple[tuple[float, float], tuple[float, float]]
+
+# === Functions ===
+
+
+def _overlap(a: BoundingBox, b: BoundingBox) -> float:
+    """The area shared by boxes `a` and `b`; boxes that only touch share none."""
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    if width <= 0 or height <= 0:
+        return 0
+    return width * height
+
+
+def _outside(box: BoundingBox, bounds: BoundingBox) -> float:
+    """The area of `box` that is not within `bounds`."""
+    return _area(box) - _overlap(box, bounds)
+
+
+def _area(box: BoundingBox) -> float:
+    return (box[2] - box[0]) * (box[3] - box[1])
+
+
+def _crosses(segment: Segment, box: BoundingBox) -> bool:
+    """Whether `segment` passes through the inside of `box`."""
+    (x0, y0), (x1, y1) = segment
+    dx, dy = x1 - x0, y1 - y0
+    low, high = 0.0, 1.0
+    # Clip the segment against each side of the box in turn.
+    for step, distance in (
+        (-dx, x0 - box[0]),
+        (dx, box[2] - x0),
+        (-dy, y0 - box[1]),
+        (dy, box[3] - y0),
+    ):
+        if step == 0:
+            if distance <= 0:
+                return False
+            continue
+        t = distance / step
+        if step < 0:
+            low = max(low, t)
+        else:
+            high = min(high, t)
+        if low >= high:
+            return False
+    return True
+
+
+def padded(box: BoundingBox, margin: float) -> BoundingBox:
+    """`box` grown by `margin` on every side."""
+    return (box[0] - margin, box[1] - margin, box[2] + margin, box[3] + margin)
+
+
+def polygon_segments(points: Sequence) -> list[Segment]:
+    """The edges of the closed polygon `points`."""
+    vertices = [(float(x), float(y)) for x, y in points]
+    return [(vertices[index - 1], vertices[index]) for index in range(len(vertices))]
+
+
+# === Classes ===
+
+
+class GridIndex:
+    """
+    A uniform grid of boxes and segments, for finding what a box runs into.
+
+    Every item is filed under each `cell_size` square cell its box covers, so
+    a query only tests the items filed under the cells of the queried box.
+    With cells about the size of a label, that is a handful of items, however
+    many have been inserted.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = cell_size
+        self.boxes: list[BoundingBox] = []
+        self.segments: list[Segment] = []
+        self._cells: defaultdict[tuple[int, int], list[tuple[str, int]]] = defaultdict(
+            list
+        )
+
+    def _keys(self, box: BoundingBox) -> Iterator[tuple[int, int]]:
+        min_x, min_y, max_x, max_y = (
+            math.floor(value / self.cell_size) for value in box
+        )
+        for column in range(min_x, max_x + 1):
+            for row in range(min_y, max_y + 1):
+                yield (column, row)
+
+    def _near(self, box: BoundingBox) -> set[tuple[str, int]]:
+        return {item for key in self._keys(box) for item in self._cells.get(key, ())}
+
+    def insert_box(self, box: BoundingBox):
+        self.boxes.append(box)
+        for key in self._keys(box):
+            self._cells[key].append(("box", len(self.boxes) - 1))
+
+    def insert_segment(self, segment: Segment):
+        (x0, y0), (x1, y1) = segment
+        self.segments.append(segment)
+        box = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        # Only file the segment under the cells it actually passes through.
+        for key in self._keys(box):
+            cell = (
+                key[0] * self.cell_size,
+                key[1] * self.cell_size,
+                (key[0] + 1) * self.cell_size,
+                (key[1] + 1) * self.cell_size,
+            )
+            if _crosses(segment, padded(cell, self.cell_size * 1e-9)):
+                self._cells[key].append(("segment", len(self.segments) - 1))
+
+    def overlap(self, box: BoundingBox) -> float:
+        """The total area `box` shares with the inserted boxes."""
+        return sum(
+            _overlap(box, self.boxes[index])
+            for kind, index in self._near(box)
+            if kind == "box"
+        )
+
+    def crossings(self, box: BoundingBox) -> int:
+        """How many inserted segments pass through `box`."""
+        return sum(
+            _crosses(self.segments[index], box)
+            for kind, index in self._near(box)
+            if kind == "segment"
+        )
+
+    def struck(self, segment: Segment) -> int:
+        """How many inserted boxes `segment` passes through."""
+        (x0, y0), (x1, y1) = segment
+        near = self._near((min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)))
+        return sum(
+            _crosses(segment, self.boxes[index])
+            for kind, index in near
+            if kind == "box"
+        )
+
+
+@dataclass(kw_only=True)
+class Candidate:
+    """
+    One way of placing a label.
+
+    `box` is where the label's text would be drawn, if it has any, and
+    `segments` are the lines drawn with it, such as dimension and extension
+    lines. `value` is whatever the caller needs to draw this choice.
+    """
+
+    box: BoundingBox | None = None
+    segments: Sequence[Segment] = ()
+    value: Any = None
+
+
+@dataclass(kw_only=True)
+class Label:
+    """
+    A label to place, with its candidates in order of preference.
+
+    Candidates are only built as far as they are needed, so they may be
+    given as a generator. Labels with a higher `priority` are placed first.
+    """
+
+    candidates: Iterable[Candidate]
+    priority: float = 0
+
+
+class PlacementSolver:
+    """
+    Place labels so their text does not collide with other text or lines.
+
+    Labels are placed greedily, highest priority first. Each label takes its
+    first candidate whose box stays within `bounds`, keeps `margin` clear of
+    the other boxes and is crossed by no line, and whose lines cross no
+    other box. If no candidate fits, the one that overlaps the other boxes
+    least is taken, and of those the one that collides least.
+    The chosen box and lines then become obstacles for the labels after it.
+
+    Collisions are found with a `GridIndex`, so placing `n` labels takes
+    `O(n log n)` time for the sort, plus a bounded amount of work for each
+    candidate that is tried.
+    """
+
+    def __init__(
+        self,
+        cell_size: float,
+        bounds: BoundingBox | None = None,
+        margin: float = 0,
+    ):
+        self.index = GridIndex(cell_size)
+        self.bounds = bounds
+        self.margin = margin
+
+    def add_obstacle_box(self, box: BoundingBox):
+        self.index.insert_box(box)
+
+    def add_obstacle_segments(self, segments: Iterable[Segment]):
+        for segment in segments:
+            self.index.insert_segment(segment)
+
+    def penalty(self, candidate: Candidate) -> float:
+        """How badly `candidate` collides, as an area; zero if it fits."""
+        penalty = 0.0
+        unit = self.index.cell_size**2
+        if candidate.box is not None:
+            unit = _area(candidate.box)
+            box = padded(candidate.box, self.margin)
+            penalty += self.index.overlap(box)
+            penalty += self.index.crossings(box) * _area(box)
+            if self.bounds is not None:
+                penalty += _outside(candidate.box, self.bounds)
+        for segment in candidate.segments:
+            penalty += self.index.struck(segment) * unit
+        return penalty
+
+    def overlap(self, candidate: Candidate) -> float:
+        """The area `candidate` shares with the boxes placed so far."""
+        if candidate.box is None:
+            return 0
+        return self.index.overlap(padded(candidate.box, self.margin))
+
+    def choose(self, label: Label) -> Candidate:
+        best, best_rank = None, (math.inf, math.inf)
+        for candidate in label.candidates:
+            penalty = self.penalty(candidate)
+            if penalty == 0:
+                return candidate
+            # Text over text cannot be read at all, so avoid that first.
+            rank = (self.overlap(candidate), penalty)
+            if rank < best_rank:
+                best, best_rank = candidate, rank
+        if best is None:
+            raise ValueError("A label needs at least one candidate")
+        return best
+
+    def place(self, labels: Sequence[Label]) -> list[Candidate]:
+        """The chosen candidate of each of `labels`, in the order given."""
+        chosen: list[Candidate | None] = [None] * len(labels)
+        order = sorted(range(len(labels)), key=lambda index: -labels[index].priority)
+        for index in order:
+            candidate = self.choose(labels[index])
+            if candidate.box is not None:
+                self.add_obstacle_box(padded(candidate.box, self.margin))
+            self.add_obstacle_segments(candidate.segments)
+            chosen[index] = candidate
+        return chosen
@@ -0,0 +1,319 @@
+import functools
+import itertools
+import math
+from collections.abc import Iterable, Sequence
+from enum import Enum, auto
+
+import svg
+from svg._types import Number
+
+# === Constants ===
+
+# A closed ring of vertices, counter-clockwise around filled area and clockwise
+# around holes. The closing vertex is not repeated.
+Ring = list[tuple[float, float]]
+
+# Non-overlapping rings that together bound an area.
+Region = list[Ring]
+
+# How far apart two points may be and still be treated as the same point.
+POLYGON_TOLERANCE = 1e-9
+
+# === Classes ===
+
+
+class Location(Enum):
+    """Where an edge fragment of one region lies relative to another region."""
+
+    INSIDE = auto()
+    OUTSIDE = auto()
+    SAME = auto()  # on a boundary edge running the same way
+    OPPOSITE = auto()  # on a boundary edge running the other way
+
+
+# === Functions ===
+
+
+def _cross(ax: float, ay: float, bx: float, by: float) -> float:
+    return ax * by - ay * bx
+
+
+def _signed_area(ring: Ring) -> float:
+    return sum(_cross(*ring[index - 1], *ring[index]) for index in range(len(ring))) / 2
+
+
+def area(region: Region) -> float:
+    """The filled area of `region`; holes count negatively."""
+    return sum(_signed_area(ring) for ring in region)
+
+
+def _clean(points: Iterable[Sequence[Number]]) -> Ring:
+    """The vertices of `points` without repeats or collinear vertices."""
+    ring = []
+    for x, y in points:
+        vertex = (float(x), float(y))
+        if not ring or math.dist(ring[-1], vertex) > POLYGON_TOLERANCE:
+            ring.append(vertex)
+    while len(ring) > 1 and math.dist(ring[0], ring[-1]) <= POLYGON_TOLERANCE:
+        ring.pop()
+
+    changed = True
+    while changed and len(ring) >= 3:
+        changed = False
+        for index in range(len(ring)):
+            (ax, ay), (bx, by), (cx, cy) = (
+                ring[index - 1],
+                ring[index],
+                ring[(index + 1) % len(ring)],
+            )
+            twice_area = _cross(bx - ax, by - ay, cx - ax, cy - ay)
+            if abs(twice_area) <= POLYGON_TOLERANCE * math.dist((ax, ay), (cx, cy)):
+                del ring[index]
+                changed = True
+                break
+    return ring if len(ring) >= 3 else []
+
+
+def region(points: Iterable[Sequence[Number]]) -> Region:
+    """
+    The region bounded by the simple polygon `points`.
+
+    `points` may be `Points`, a `PointArray` or any sequence of `(x, y)` pairs,
+    in either orientation.
+    """
+    ring = _clean(points)
+    if not ring:
+        return []
+    if _signed_area(ring) < 0:
+        ring.reverse()
+    return [ring]
+
+
+def _edges(region: Region) -> list[tuple[tuple, tuple]]:
+    return [
+        (ring[index - 1], ring[index]) for ring in region for index in range(len(ring))
+    ]
+
+
+def _is_endpoint(t: float, length: float) -> bool:
+    return t * length <= POLYGON_TOLERANCE or (1 - t) * length <= POLYGON_TOLERANCE
+
+
+def _cut(
+    a_edge: tuple[tuple, tuple],
+    b_edge: tuple[tuple, tuple],
+) -> tuple[list[tuple[float, tuple]], list[tuple[float, tuple]]]:
+    """
+    Where `a_edge` and `b_edge` have to be split so they only meet at ends.
+
+    Every split point is either a vertex of one of the edges or a crossing
+    computed once here, so both regions see exactly the same coordinates.
+    """
+    (px, py), (p2x, p2y) = a_edge
+    (qx, qy), (q2x, q2y) = b_edge
+    rx, ry = p2x - px, p2y - py
+    sx, sy = q2x - qx, q2y - qy
+    r_length, s_length = math.hypot(rx, ry), math.hypot(sx, sy)
+    if not r_length or not s_length:
+        return [], []
+
+    a_cuts, b_cuts = [], []
+    denominator = _cross(rx, ry, sx, sy)
+    qpx, qpy = qx - px, qy - py
+
+    if abs(denominator) <= POLYGON_TOLERANCE * r_length * s_length:
+        if abs(_cross(qpx, qpy, rx, ry)) > POLYGON_TOLERANCE * r_length:
+            return [], []
+        # Collinear: split each edge at the other's vertices inside it.
+        for point in b_edge:
+            t = ((point[0] - px) * rx + (point[1] - py) * ry) / r_length**2
+            if 0 < t < 1 and not _is_endpoint(t, r_length):
+                a_cuts.append((t, point))
+        for point in a_edge:
+            u = ((point[0] - qx) * sx + (point[1] - qy) * sy) / s_length**2
+            if 0 < u < 1 and not _is_endpoint(u, s_length):
+                b_cuts.append((u, point))
+        return a_cuts, b_cuts
+
+    t = _cross(qpx, qpy, sx, sy) / denominator
+    u = _cross(qpx, qpy, rx, ry) / denominator
+    t_slack = POLYGON_TOLERANCE / r_length
+    u_slack = POLYGON_TOLERANCE / s_length
+    if not (-t_slack <= t <= 1 + t_slack and -u_slack <= u <= 1 + u_slack):
+        return [], []
+
+    a_end = _is_endpoint(t, r_length)
+    b_end = _is_endpoint(u, s_length)
+    if a_end:
+        point = a_edge[0] if t < 0.5 else a_edge[1]
+    elif b_end:
+        point = b_edge[0] if u < 0.5 else b_edge[1]
+    else:
+        point = (px + t * rx, py + t * ry)
+    if not a_end:
+        a_cuts.append((t, point))
+    if not b_end:
+        b_cuts.append((u, point))
+    return a_cuts, b_cuts
+
+
+def _fragments(edges, cuts) -> list[tuple[tuple, tuple]]:
+    fragments = []
+    for (start, end), edge_cuts in zip(edges, cuts):
+        points = [start, *(point for _, point in sorted(edge_cuts)), end]
+        for first, second in itertools.pairwise(points):
+            if first != second:
+                fragments.append((first, second))
+    return fragments
+
+
+def _split(a: Region, b: Region):
+    """The edges of `a` and `b`, split wherever they meet."""
+    a_edges, b_edges = _edges(a), _edges(b)
+    a_cuts = [[] for _ in a_edges]
+    b_cuts = [[] for _ in b_edges]
+    for a_index, a_edge in enumerate(a_edges):
+        for b_index, b_edge in enumerate(b_edges):
+            a_edge_cuts, b_edge_cuts = _cut(a_edge, b_edge)
+            a_cuts[a_index].extend(a_edge_cuts)
+            b_cuts[b_index].extend(b_edge_cuts)
+    return (
+        _fragments(a_edges, a_cuts),
+        _fragments(b_edges, b_cuts),
+        a_edges,
+        b_edges,
+    )
+
+
+def _segment_distance(point, start, end) -> float:
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length_squared = dx * dx + dy * dy
+    t = ((point[0] - start[0]) * dx + (point[1] - start[1]) * dy) / length_squared
+    t = min(1, max(0, t))
+    return math.dist(point, (start[0] + t * dx, start[1] + t * dy))
+
+
+def _winding_number(point, edges) -> int:
+    x, y = point
+    winding = 0
+    for (ax, ay), (bx, by) in edges:
+        side = _cross(bx - ax, by - ay, x - ax, y - ay)
+        if ay <= y < by and side > 0:
+            winding += 1
+        elif by <= y < ay and side < 0:
+            winding -= 1
+    return winding
+
+
+def _locate(fragment, edges) -> Location:
+    (sx, sy), (ex, ey) = fragment
+    midpoint = ((sx + ex) / 2, (sy + ey) / 2)
+    for start, end in edges:
+        if _segment_distance(midpoint, start, end) <= POLYGON_TOLERANCE:
+            dot = (ex - sx) * (end[0] - start[0]) + (ey - sy) * (end[1] - start[1])
+            return Location.SAME if dot > 0 else Location.OPPOSITE
+    if _winding_number(midpoint, edges):
+        return Location.INSIDE
+    return Location.OUTSIDE
+
+
+def _turn(incoming, outgoing) -> float:
+    """The signed angle from `incoming` to `outgoing`; left turns are positive."""
+    (ax, ay), (bx, by) = incoming
+    (cx, cy), (dx, dy) = outgoing
+    ux, uy, vx, vy = bx - ax, by - ay, dx - cx, dy - cy
+    return math.atan2(_cross(ux, uy, vx, vy), ux * vx + uy * vy)
+
+
+def _link(fragments) -> Region:
+    """Join directed edge fragments end to start into closed rings."""
+    outgoing = {}
+    for index, (start, _) in enumerate(fragments):
+        outgoing.setdefault(start, []).append(index)
+
+    used = set()
+    rings = []
+    for first in range(len(fragments)):
+        if first in used:
+            continue
+        used.add(first)
+        chain = [first]
+        while fragments[chain[-1]][1] != fragments[first][0]:
+            candidates = [
+                index
+                for index in outgoing.get(fragments[chain[-1]][1], ())
+                if index not in used
+            ]
+            if not candidates:
+                break
+            # At a vertex shared by several rings, keep to the tightest left
+            # turn so touching rings stay separate.
+            following = max(
+                candidates,
+                key=lambda index: _turn(fragments[chain[-1]], fragments[index]),
+            )
+            used.add(following)
+            chain.append(following)
+        else:
+            ring = _clean(fragments[index][0] for index in chain)
+            if ring:
+                rings.append(ring)
+    return rings
+
+
+def _boolean(a: Region, b: Region, keep_a, keep_b, reverse_b=False) -> Region:
+    a_fragments, b_fragments, a_edges, b_edges = _split(a, b)
+    kept = [
+        fragment for fragment in a_fragments if _locate(fragment, b_edges) in keep_a
+    ]
+    for start, end in b_fragments:
+        if _locate((start, end), a_edges) in keep_b:
+            kept.append((end, start) if reverse_b else (start, end))
+    return _link(kept)
+
+
+def union(a: Region, b: Region) -> Region:
+    """The area covered by `a` or `b`."""
+    return _boolean(
+        a,
+        b,
+        keep_a={Location.OUTSIDE, Location.SAME},
+        keep_b={Location.OUTSIDE},
+    )
+
+
+def intersection(a: Region, b: Region) -> Region:
+    """The area covered by both `a` and `b`."""
+    return _boolean(
+        a,
+        b,
+        keep_a={Location.INSIDE, Location.SAME},
+        keep_b={Location.INSIDE},
+    )
+
+
+def difference(a: Region, b: Region) -> Region:
+    """The area covered by `a` but not `b`."""
+    return _boolean(
+        a,
+        b,
+        keep_a={Location.OUTSIDE, Location.OPPOSITE},
+        keep_b={Location.INSIDE},
+        reverse_b=True,
+    )
+
+
+def union_all(regions: Iterable[Region]) -> Region:
+    """The area covered by any of `regions`."""
+    return functools.reduce(union, regions, [])
+
+
+def to_path_data(region: Region) -> list[svg.PathData]:
+    """`region` as path data, one closed subpath per ring, for a nonzero fill."""
+    path_data = []
+    for ring in region:
+        (x, y), *rest = ring
+        path_data.append(svg.M(x, y))
+        path_data.extend(svg.L(x, y) for x, y in rest)
+        path_data.append(svg.Z())
+    return path_data
@@ -0,0 +1,511 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from nixoslogo.annotations import get_annotation_font_loader
+from nixoslogo.bundle import GLYPH_BUNDLE_ENVVAR, build_glyph_bundle, use_glyph_bundle
+from nixoslogo.cache import (
+    DEFAULT_CACHE_MAX_SIZE,
+    CacheEntry,
+    RenderCache,
+    get_default_cache,
+)
+from nixoslogo.core import FontOpenMode
+from nixoslogo.fonts import (
+    FONT_BACKEND_ENVVAR,
+    FontforgeBackend,
+    FontToolsBackend,
+    get_font_backend,
+)
+from nixoslogo.logotype import (
+    FONT_OPEN_MODE_ENVVAR,
+    font_loaders,
+    get_font_loader,
+    get_font_open_mode,
+    shared_font_loaders,
+)
+from nixoslogo.sharding import load_costs, parse_shard, save_costs, select_shard
+from nixoslogo.specs import ArtifactSpec, load_manifest
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the render manifest changes.
+RENDER_MANIFEST_VERSION = 1
+
+# Batch renders only ever read the fonts, so their loaders share one copy.
+BATCH_FONT_OPEN_MODE = FontOpenMode.SHARED_COPY
+
+# Keeps the shared font loader scope of a pool worker open until it exits.
+_worker_scope = ExitStack()
+
+
+@dataclass(kw_only=True)
+class RenderResult:
+    spec: ArtifactSpec
+    path: Path
+    seconds: float
+    sha256: str
+    size: int
+    # Whether the output was copied from the cache rather than rendered.
+    cached: bool = False
+    # The contents of the output, for artifacts rendered in memory.
+    data: bytes | None = None
+
+    @property
+    def relative_path(self) -> str:
+        """Path of the output file below the output root."""
+        return f"{self.spec.output}/{self.path.name}"
+
+
+def render_artifact(
+    spec: ArtifactSpec, output_root: Path, cache: RenderCache | None = None
+) -> tuple[Path, bool]:
+    """
+    Render `spec` under `output_root`.
+
+    With a `cache`, unchanged artifacts are copied out of it before the
+    renderable is built, so their fonts are never opened. Returns the path
+    of the output and whether it came from the cache.
+    """
+    directory = Path(output_root) / spec.output
+    directory.mkdir(parents=True, exist_ok=True)
+    if cache is None:
+        return spec.build().write_svg(directory=directory), False
+
+    key = spec.cache_key()
+    entry = cache.get(key)
+    if entry is not None:
+        path = directory / (entry.filename + ".svg")
+        path.write_bytes(entry.data)
+        return path, True
+
+    path = spec.build().write_svg(directory=directory)
+    cache.put(key, CacheEntry(filename=path.stem, data=path.read_bytes()))
+    return path, False
+
+
+def render_artifact_timed(
+    spec: ArtifactSpec, output_root: Path, cache: RenderCache | None = None
+) -> RenderResult:
+    start = time.perf_counter()
+    path, cached = render_artifact(spec, output_root, cache)
+    data = path.read_bytes()
+    return RenderResult(
+        spec=spec,
+        path=path,
+        seconds=time.perf_counter() - start,
+        sha256=hashlib.sha256(data).hexdigest(),
+        size=len(data),
+        cached=cached,
+    )
+
+
+def digest_artifact(
+    spec: ArtifactSpec, cache: RenderCache | None = None
+) -> RenderResult:
+    """
+    Render `spec` in memory and digest it, without writing any files.
+
+    With a `cache`, unchanged artifacts are read from it and new renders are
+    added to it, as `render_artifact` does.
+    """
+    start = time.perf_counter()
+    key = None if cache is None else spec.cache_key()
+    entry = None if cache is None else cache.get(key)
+    if entry is not None:
+        filename, data = entry.filename + ".svg", entry.data
+    else:
+        renderable = spec.build()
+        filename, data = renderable.make_svg_filename(), renderable.render_bytes()
+        if cache is not None:
+            cache.put(key, CacheEntry(filename=Path(filename).stem, data=data))
+    return RenderResult(
+        spec=spec,
+        path=Path(spec.output) / filename,
+        seconds=time.perf_counter() - start,
+        sha256=hashlib.sha256(data).hexdigest(),
+        size=len(data),
+        cached=entry is not None,
+        data=data,
+    )
+
+
+def _init_worker(
+    tempdir: Path,
+    glyph_bundle: Path | None = None,
+    font_backend: str | None = None,
+    font_open_mode: str | None = None,
+):
+    """
+    Open the logotype and annotation fonts once per pool worker.
+
+    Open fonts cannot be pickled, so every worker keeps its own shared
+    loaders for the lifetime of the process. Pool workers exit without
+    running `atexit` handlers, so their temporary files, such as font
+    copies, go into `tempdir`, which the parent removes.
+    """
+    tempfile.tempdir = str(tempdir)
+    use_glyph_bundle(glyph_bundle)
+    font_loaders.backend = get_font_backend(font_backend)
+    font_loaders.open_mode = get_font_open_mode(font_open_mode, BATCH_FONT_OPEN_MODE)
+    _worker_scope.enter_context(shared_font_loaders())
+    for warm_up in (get_font_loader, get_annotation_font_loader):
+        try:
+            warm_up()
+        except (ImportError, OSError) as e:
+            logger.warning(f"Unable to preload font, loading on demand: {e}")
+
+
+def _log_result(result: RenderResult):
+    if result.cached:
+        logger.info(f"Copied {result.spec.name} from the cache")
+    else:
+        logger.info(f"Rendered {result.spec.name} in {result.seconds:.3f}s")
+
+
+def _render_serial(
+    render: Callable[[ArtifactSpec], RenderResult], specs: list[ArtifactSpec]
+) -> list[RenderResult]:
+    results = []
+    with shared_font_loaders():
+        for spec in specs:
+            result = render(spec)
+            results.append(result)
+            _log_result(result)
+    return results
+
+
+def _render_parallel(
+    render: Callable[[ArtifactSpec], RenderResult],
+    specs: list[ArtifactSpec],
+    jobs: int,
+) -> list[RenderResult]:
+    results = [None] * len(specs)
+    bundle, backend = font_loaders.bundle, font_loaders.backend
+    open_mode = font_loaders.open_mode
+    tempdir = Path(tempfile.mkdtemp(prefix="nixoslogo_workers_"))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(
+                tempdir,
+                None if bundle is None else bundle.path,
+                None if backend is None else backend.name,
+                None if open_mode is None else open_mode.name,
+            ),
+        ) as executor:
+            futures = {
+                executor.submit(render, spec): index for index, spec in enumerate(specs)
+            }
+            for future in as_completed(futures):
+                result = results[futures[future]] = future.result()
+                _log_result(result)
+    finally:
+        # The pool has been shut down, so no worker is using the files.
+        shutil.rmtree(tempdir, ignore_errors=True)
+    return results
+
+
+def render_artifacts(
+    specs: Iterable[ArtifactSpec],
+    output_root: Path,
+    jobs: int = 1,
+    cache: RenderCache | None = None,
+) -> list[RenderResult]:
+    """
+    Render `specs` under `output_root`.
+
+    With `jobs` greater than one the artifacts are spread over a pool of
+    worker processes; `jobs` of zero uses one worker per CPU.
+    """
+    render = partial(render_artifact_timed, output_root=output_root, cache=cache)
+    return _render_all(render, specs, jobs)
+
+
+def digest_artifacts(
+    specs: Iterable[ArtifactSpec], jobs: int = 1, cache: RenderCache | None = None
+) -> list[RenderResult]:
+    """Like `render_artifacts`, but only digests the outputs in memory."""
+    return _render_all(partial(digest_artifact, cache=cache), specs, jobs)
+
+
+def _render_all(
+    render: Callable[[ArtifactSpec], RenderResult],
+    specs: Iterable[ArtifactSpec],
+    jobs: int,
+) -> list[RenderResult]:
+    specs = list(specs)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(specs))
+    if jobs <= 1:
+        return _render_serial(render, specs)
+    return _render_parallel(render, specs, jobs)
+
+
+def write_render_manifest(path: Path, results: Iterable[RenderResult]):
+    """Record the digest, size and source of every rendered file."""
+    files = [
+        {
+            "path": result.relative_path,
+            "sha256": result.sha256,
+            "size": result.size,
+            "artifact": result.spec.name,
+            "class": result.spec.renderable,
+            "kwargs": result.spec.kwargs,
+        }
+        for result in sorted(results, key=lambda result: result.relative_path)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": RENDER_MANIFEST_VERSION, "files": files}, f, indent=2)
+        f.write("\n")
+
+
+def _describe_source(renderable: str, kwargs: dict) -> str:
+    return f"{renderable} with {json.dumps(kwargs, separators=(',', ':'))}"
+
+
+def verify_render_manifest(
+    specs: list[ArtifactSpec], path: Path, jobs: int = 1
+) -> list[str]:
+    """
+    Re-render `specs` in memory and compare them with the render manifest.
+
+    Returns a description of every mismatch, naming the artifact and the
+    parameters it was rendered with.
+    """
+    with open(path, "rb") as f:
+        recorded = {elem["path"]: elem for elem in json.load(f)["files"]}
+
+    problems = []
+    rendered = set()
+    for result in digest_artifacts(specs, jobs=jobs):
+        rendered.add(result.relative_path)
+        expected = recorded.get(result.relative_path)
+        if expected is None:
+            problems.append(
+                f"{result.spec.name}: {result.relative_path} is not in {path} "
+                f"({_describe_source(result.spec.renderable, result.spec.kwargs)})"
+            )
+        elif expected["sha256"] != result.sha256:
+            problems.append(
+                f"{result.spec.name}: {result.relative_path} has sha256 "
+                f"{result.sha256}, expected {expected['sha256']} "
+                f"({_describe_source(result.spec.renderable, result.spec.kwargs)})"
+            )
+
+    names = {spec.name for spec in specs}
+    for relative_path, expected in recorded.items():
+        if expected["artifact"] in names and relative_path not in rendered:
+            problems.append(
+                f"{expected['artifact']}: {relative_path} was not rendered "
+                f"({_describe_source(expected['class'], expected['kwargs'])})"
+            )
+    return problems
+
+
+def select_artifacts(
+    specs: list[ArtifactSpec], names: list[str] | None
+) -> list[ArtifactSpec]:
+    """Select the named artifacts; all of them if `names` is None."""
+    if names is None:
+        return specs
+    known = {spec.name for spec in specs}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"Unknown artifacts: {', '.join(unknown)}")
+    return [spec for spec in specs if spec.name in names]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m nixoslogo.render",
+        description="Render the artifacts listed in a manifest.",
+    )
+    parser.add_argument(
+        "manifest",
+        type=Path,
+        help="JSON manifest of artifact specs",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("."),
+        help="directory the artifact outputs are written under",
+    )
+    parser.add_argument(
+        "-a",
+        "--artifact",
+        action="append",
+        dest="artifacts",
+        metavar="NAME",
+        help="only render the named artifact; may be repeated",
+    )
+    parser.add_argument(
+        "--artifacts-from",
+        type=argparse.FileType("r", encoding="utf-8"),
+        metavar="PATH",
+        help="only render the artifacts named in PATH, one per line; "
+        "'-' reads standard input",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes; 0 uses one per CPU (default: 1)",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="I/N",
+        help="only render the I-th of N cost-balanced shards of the artifacts",
+    )
+    parser.add_argument(
+        "--costs",
+        type=Path,
+        metavar="PATH",
+        help="JSON table of per-artifact render times used to balance shards",
+    )
+    parser.add_argument(
+        "--record-costs",
+        type=Path,
+        metavar="PATH",
+        help="merge the render times of this run into a JSON cost table; "
+        "artifacts copied from the cache keep their recorded times",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        metavar="DIR",
+        help="directory of previously rendered artifacts to reuse "
+        "(default: $NIXOSLOGO_CACHE_DIR, if set)",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=DEFAULT_CACHE_MAX_SIZE,
+        metavar="BYTES",
+        help="evict least recently used artifacts beyond this size",
+    )
+    parser.add_argument(
+        "--glyph-bundle",
+        type=Path,
+        default=os.getenv(GLYPH_BUNDLE_ENVVAR) or None,
+        metavar="PATH",
+        help="serve glyphs from a bundle instead of opening the fonts "
+        f"(default: ${GLYPH_BUNDLE_ENVVAR}, if set)",
+    )
+    parser.add_argument(
+        "--font-backend",
+        choices=(FontforgeBackend.name, FontToolsBackend.name),
+        default=os.getenv(FONT_BACKEND_ENVVAR) or None,
+        help="read the fonts with this library "
+        f"(default: ${FONT_BACKEND_ENVVAR}, or {FontforgeBackend.name})",
+    )
+    parser.add_argument(
+        "--font-open-mode",
+        choices=[mode.name.lower() for mode in FontOpenMode],
+        default=os.getenv(FONT_OPEN_MODE_ENVVAR) or None,
+        help="open the font files from a copy per loader, one copy shared by "
+        "the loaders, or in place "
+        f"(default: ${FONT_OPEN_MODE_ENVVAR}, or "
+        f"{BATCH_FONT_OPEN_MODE.name.lower()})",
+    )
+    parser.add_argument(
+        "--write-glyph-bundle",
+        type=Path,
+        metavar="PATH",
+        help="instead of writing files, render in memory and bundle every glyph "
+        "used into PATH",
+    )
+    parser.add_argument(
+        "--render-manifest",
+        type=Path,
+        metavar="PATH",
+        help="write the sha256, size and source of every rendered file to PATH",
+    )
+    parser.add_argument(
+        "--verify",
+        type=Path,
+        metavar="PATH",
+        help="instead of writing files, re-render in memory and compare against "
+        "the render manifest at PATH",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    names = args.artifacts
+    if args.artifacts_from is not None:
+        with args.artifacts_from as f:
+            names = (names or []) + [line.strip() for line in f if line.strip()]
+    specs = select_artifacts(load_manifest(args.manifest), names)
+    if args.shard is not None:
+        costs = load_costs(args.costs) if args.costs is not None else {}
+        specs = select_shard(specs, args.shard, costs)
+        logger.info(f"Shard {args.shard[0]}/{args.shard[1]}: {len(specs)} artifacts")
+
+    font_loaders.backend = get_font_backend(args.font_backend)
+    font_loaders.open_mode = get_font_open_mode(
+        args.font_open_mode, BATCH_FONT_OPEN_MODE
+    )
+
+    if args.write_glyph_bundle is not None:
+        build_glyph_bundle(specs, args.write_glyph_bundle)
+        logger.info(f"Wrote glyph bundle {args.write_glyph_bundle}")
+        return
+
+    use_glyph_bundle(args.glyph_bundle)
+
+    if args.verify is not None:
+        problems = verify_render_manifest(specs, args.verify, jobs=args.jobs)
+        for problem in problems:
+            logger.error(problem)
+        if problems:
+            raise SystemExit(f"{len(problems)} rendered files do not match")
+        logger.info(f"Verified {len(specs)} artifacts against {args.verify}")
+        return
+
+    if args.cache is not None:
+        cache = RenderCache(directory=args.cache, max_size=args.cache_max_size)
+    else:
+        cache = get_default_cache()
+
+    start = time.perf_counter()
+    results = render_artifacts(specs, args.output, jobs=args.jobs, cache=cache)
+    logger.info(
+        f"Rendered {len(specs)} artifacts in {time.perf_counter() - start:.3f}s"
+    )
+
+    if args.render_manifest is not None:
+        write_render_manifest(args.render_manifest, results)
+
+    if args.record_costs is not None:
+        # Copying from the cache says nothing about what a render costs.
+        save_costs(
+            args.record_costs,
+            {
+                result.spec.name: round(result.seconds, 6)
+                for result in results
+                if not result.cached
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import heapq
+import json
+import logging
+from collections.abc import Mapping
+from pathlib import Path
+
+from nixoslogo.specs import ArtifactSpec
+
+logger = logging.getLogger(__name__)
+
+# Cost used for every artifact when nothing has been recorded yet.
+DEFAULT_COST = 1.0
+
+
+def parse_shard(text: str) -> tuple[int, int]:
+    """
+    Parse `i/N` into a one-based shard index and a shard count.
+
+    Errors are raised as `argparse.ArgumentTypeError`, so that argparse
+    shows their message when this is used as an argument `type`.
+    """
+    try:
+        index, count = (int(elem) for elem in text.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Shard must look like i/N, got {text!r}"
+        ) from None
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(
+            f"Shard index must be between 1 and {count}, got {index}"
+        )
+    return index, count
+
+
+def load_costs(path: Path) -> dict[str, float]:
+    """Load the recorded render cost (in seconds) of each artifact, if any."""
+    try:
+        with open(path, "rb") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.info(f"No render costs recorded at {path}")
+        return {}
+
+
+def save_costs(path: Path, costs: Mapping[str, float]):
+    """Merge `costs` into the cost table at `path`, keeping other entries."""
+    merged = load_costs(path) | dict(costs)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(merged.items())), f, indent=2)
+        f.write("\n")
+
+
+def assign_shards(
+    names: list[str], costs: Mapping[str, float], count: int
+) -> list[list[str]]:
+    """
+    Split `names` into `count` shards of similar total cost.
+
+    Uses longest-processing-time-first: artifacts are taken from the most to
+    the least expensive and each goes to the currently cheapest shard.
+    Artifacts without a recorded cost are assumed to cost the average of the
+    recorded ones. Ties are broken by name and shard index, so the same names
+    and costs always give the same shards on every machine.
+    """
+    known = [costs[name] for name in names if name in costs]
+    fallback = sum(known) / len(known) if known else DEFAULT_COST
+
+    shards = [[] for _ in range(count)]
+    loads = [(0.0, index) for index in range(count)]
+    for name in sorted(names, key=lambda name: (-costs.get(name, fallback), name)):
+        load, index = heapq.heappop(loads)
+        shards[index].append(name)
+        heapq.heappush(loads, (load + costs.get(name, fallback), index))
+    return shards
+
+
+def select_shard(
+    specs: list[ArtifactSpec],
+    shard: tuple[int, int],
+    costs: Mapping[str, float],
+) -> list[ArtifactSpec]:
+    index, count = shard
+    names = set(assign_shards([spec.name for spec in specs], costs, count)[index - 1])
+    return [spec for spec in specs if spec.name in names]
@@ -0,0 +1,98 @@
+import importlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from nixoslogo.cache import make_cache_key
+from nixoslogo.core import BaseRenderable
+
+# === Constants ===
+
+REF_TAG = "$ref"
+CALL_TAG = "$call"
+
+# === Functions ===
+
+
+def resolve_dotted_path(path: str) -> Any:
+    """Import the longest module prefix of `path` and look up the rest as attributes."""
+    parts = path.split(".")
+    for index in range(len(parts), 0, -1):
+        module_name = ".".join(parts[:index])
+        try:
+            thing = importlib.import_module(module_name)
+        except ModuleNotFoundError as e:
+            # Only swallow the error for the path we tried, not its imports.
+            if not (module_name + ".").startswith(e.name + "."):
+                raise
+            continue
+        for attribute in parts[index:]:
+            thing = getattr(thing, attribute)
+        return thing
+    raise ImportError(f"Unable to resolve {path}")
+
+
+def set_dotted_attribute(thing: Any, path: str, value: Any):
+    *parents, attribute = path.split(".")
+    for parent in parents:
+        thing = getattr(thing, parent)
+    setattr(thing, attribute, value)
+
+
+def decode_value(value: Any) -> Any:
+    """
+    Turn a JSON manifest value into the Python object it describes.
+
+    `{"$ref": "a.b.C"}` looks up an attribute, e.g. an enum member or a class.
+    `{"$call": "a.b.f", "kwargs": {...}, "set": {...}}` calls a function or
+    class and then sets (dotted) attributes on the result.
+    Lists become tuples so they match the constants used in the scripts.
+    """
+    if isinstance(value, dict):
+        if REF_TAG in value:
+            return resolve_dotted_path(value[REF_TAG])
+        if CALL_TAG in value:
+            function = resolve_dotted_path(value[CALL_TAG])
+            result = function(**decode_value(value.get("kwargs", {})))
+            for path, attribute_value in value.get("set", {}).items():
+                set_dotted_attribute(result, path, decode_value(attribute_value))
+            return result
+        return {key: decode_value(elem) for key, elem in value.items()}
+    if isinstance(value, list):
+        return tuple(decode_value(elem) for elem in value)
+    return value
+
+
+def load_manifest(path: Path) -> list["ArtifactSpec"]:
+    with open(path, "rb") as f:
+        manifest = json.load(f)
+    return [ArtifactSpec.from_dict(artifact) for artifact in manifest["artifacts"]]
+
+
+# === Classes ===
+
+
+@dataclass(kw_only=True)
+class ArtifactSpec:
+    name: str
+    renderable: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    output: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ArtifactSpec":
+        return cls(
+            name=data["name"],
+            renderable=data["class"],
+            kwargs=data.get("kwargs", {}),
+            output=data.get("output", data["name"]),
+        )
+
+    def build(self) -> BaseRenderable:
+        renderable_class = resolve_dotted_path(self.renderable)
+        return renderable_class(**decode_value(self.kwargs))
+
+    def cache_key(self) -> str:
+        """Key of the rendered output, derived without building the renderable."""
+        return make_cache_key({"class": self.renderable, "kwargs": self.kwargs})
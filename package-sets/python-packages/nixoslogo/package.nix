@@ -2,9 +2,11 @@
   buildPythonPackage,
   coloraide,
   fontforge,
+  fonttools,
   jsonpickle,
   lib,
   lxml,
+  numpy,
   poetry-core,
   svg-py,
 }:
@@ -34,8 +36,10 @@ buildPythonPackage {
   dependencies = [
     coloraide
     fontforge
+    fonttools
     jsonpickle
     lxml
+    numpy
     svg-py
   ];
 
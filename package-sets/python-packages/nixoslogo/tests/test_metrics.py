@@ -0,0 +1,69 @@
+import os
+
+import pytest
+import svg
+
+# The palette is read when nixoslogo.core is imported.
+if not os.getenv("NIXOS_COLOR_PALETTE_FILE"):
+    pytest.skip("NIXOS_COLOR_PALETTE_FILE is not set", allow_module_level=True)
+
+from nixoslogo.hittest import HitTester
+from nixoslogo.logo import NixosLogo
+from nixoslogo.logomark import Logomark
+from nixoslogo.logotype import Logotype
+from nixoslogo.metrics import outline_metrics
+
+needs_fonts = pytest.mark.skipif(
+    not os.getenv("NIXOS_LOGOTYPE_FONT_FILE"),
+    reason="NIXOS_LOGOTYPE_FONT_FILE is not set",
+)
+
+
+def square(x, y, size, clockwise=False) -> list[svg.PathData]:
+    corners = [(x, y), (x + size, y), (x + size, y + size), (x, y + size)]
+    if clockwise:
+        corners.reverse()
+    (first_x, first_y), *rest = corners
+    return [
+        svg.MoveTo(first_x, first_y),
+        *(svg.LineTo(elem_x, elem_y) for elem_x, elem_y in rest),
+        svg.ClosePath(),
+    ]
+
+
+def test_area_ignores_the_winding_of_separate_contours():
+    path = svg.Path(d=square(0, 0, 10) + square(20, 0, 10, clockwise=True))
+    assert outline_metrics([[path]]).area[0] == pytest.approx(200)
+
+
+@pytest.mark.parametrize("clockwise", [False, True])
+def test_area_subtracts_nested_contours(clockwise):
+    path = svg.Path(d=square(0, 0, 10, clockwise) + square(3, 3, 4, not clockwise))
+    metrics = outline_metrics([[path]])
+    assert metrics.area[0] == pytest.approx(84)
+    assert metrics.centroid[0] == pytest.approx([5, 5])
+
+
+@pytest.mark.parametrize(
+    "make_renderable",
+    [
+        Logomark,
+        pytest.param(Logotype, marks=needs_fonts),
+        pytest.param(NixosLogo, marks=needs_fonts),
+    ],
+)
+def test_area_matches_hit_test_coverage(make_renderable):
+    try:
+        renderable = make_renderable()
+    except ImportError as e:
+        pytest.skip(f"Font backend not installed: {e}")
+    metrics = outline_metrics([renderable.make_svg_elements()])
+    bounding_box = tuple(metrics.bounding_box[0])
+    min_x, min_y, max_x, max_y = bounding_box
+
+    coverage = HitTester.of_renderable(renderable).coverage(
+        bounding_box, 500, 500, samples=2
+    )
+    filled = coverage.mean() * (max_x - min_x) * (max_y - min_y)
+    assert metrics.area[0] == pytest.approx(filled, rel=0.01)
+    assert metrics.coverage[0] == pytest.approx(coverage.mean(), rel=0.01)
@@ -0,0 +1,189 @@
+import itertools
+import os
+
+import pytest
+import svg
+
+# The palette is read when nixoslogo.core is imported.
+if not os.getenv("NIXOS_COLOR_PALETTE_FILE"):
+    pytest.skip("NIXOS_COLOR_PALETTE_FILE is not set", allow_module_level=True)
+
+from nixoslogo.annotations import Annotations
+from nixoslogo.bbox import measure
+from nixoslogo.core import DEFAULT_LOGOTYPE_SPACINGS, ClearSpace
+from nixoslogo.dimensioned import (
+    DimensionedLambda,
+    DimensionedLambdaAngular,
+    DimensionedLambdaAnnotatedParameters,
+    DimensionedLambdaAnnotatedVertices,
+    DimensionedLambdaLinear,
+    DimensionedLogo,
+    DimensionedLogomark,
+    DimensionedLogomarkGradientAnnotated,
+    DimensionedLogotype,
+)
+from nixoslogo.logotype import get_font_loader
+from nixoslogo.placement import Candidate, Label, PlacementSolver
+
+needs_annotation_fonts = pytest.mark.skipif(
+    not os.getenv("NIXOS_ANNOTATIONS_FONT_FILE"),
+    reason="NIXOS_ANNOTATIONS_FONT_FILE is not set",
+)
+needs_fonts = pytest.mark.skipif(
+    not os.getenv("NIXOS_ANNOTATIONS_FONT_FILE")
+    or not os.getenv("NIXOS_LOGOTYPE_FONT_FILE"),
+    reason="NIXOS_ANNOTATIONS_FONT_FILE or NIXOS_LOGOTYPE_FONT_FILE is not set",
+)
+
+# The small annotations are sized for a lambda radius of 512; much below
+# that, their labels no longer fit inside a thin lambda.
+RADII = [512, 768, 1024]
+THICKNESSES = [1 / 8, 3 / 16, 1 / 4, 5 / 16, 3 / 8]
+
+
+def label_boxes(elements):
+    """The boxes of the text groups among `elements`, however deeply nested."""
+    for elem in elements:
+        match elem:
+            case svg.G():
+                yield measure(elem)
+            case tuple() | list():
+                yield from label_boxes(elem)
+
+
+def assert_apart(elements):
+    boxes = list(label_boxes(elements))
+    assert boxes
+    for box1, box2 in itertools.combinations(boxes, 2):
+        width = min(box1[2], box2[2]) - max(box1[0], box2[0])
+        height = min(box1[3], box2[3]) - max(box1[1], box2[1])
+        assert width <= 0 or height <= 0, f"{box1} overlaps {box2}"
+
+
+@pytest.fixture
+def annotations():
+    try:
+        return Annotations.small()
+    except ImportError as e:
+        pytest.skip(f"Font backend not installed: {e}")
+
+
+def lambda_linear(annotations, **kwargs):
+    return DimensionedLambdaLinear(
+        annotations=annotations, auto_place=True, **kwargs
+    ).make_lambda_linear_dimensions()
+
+
+def lambda_angular(annotations, **kwargs):
+    return DimensionedLambdaAngular(
+        annotations=annotations, auto_place=True, **kwargs
+    ).make_lambda_angular_dimensions()
+
+
+def lambda_vertices(annotations, **kwargs):
+    return DimensionedLambdaAnnotatedVertices(
+        annotations=annotations, auto_place=True, **kwargs
+    ).make_named_lambda_vertices()
+
+
+def lambda_parameters(annotations, **kwargs):
+    return DimensionedLambdaAnnotatedParameters(
+        annotations=annotations, auto_place=True, **kwargs
+    ).make_parametric_annotations()
+
+
+def logomark_linear(annotations, **kwargs):
+    return DimensionedLogomark(
+        ilambda=DimensionedLambda(annotations=annotations, **kwargs),
+        annotations=annotations,
+        auto_place=True,
+    ).make_flake_linear_dimensions()
+
+
+def logomark_gradient(annotations, **kwargs):
+    logomark = DimensionedLogomarkGradientAnnotated(
+        ilambda=DimensionedLambda(annotations=annotations, **kwargs),
+        annotations=annotations,
+        auto_place=True,
+    )
+    return (
+        logomark.make_dimensioned_gradient_lines(),
+        logomark.make_gradient_annotations(),
+    )
+
+
+def test_solver_moves_a_label_off_a_placed_one():
+    solver = PlacementSolver(cell_size=10)
+    first = Candidate(box=(0, 0, 10, 10))
+    second = Candidate(box=(20, 0, 30, 10))
+    placed = solver.place(
+        [
+            Label(candidates=[first], priority=1),
+            Label(candidates=[first, second]),
+        ]
+    )
+    assert placed == [first, second]
+
+
+def test_solver_prefers_a_crossed_label_to_an_overlapping_one():
+    solver = PlacementSolver(cell_size=10)
+    solver.add_obstacle_box((0, 0, 10, 10))
+    solver.add_obstacle_segments([((20, -10), (20, 20))])
+    overlapping = Candidate(box=(8, 0, 18, 10))
+    crossed = Candidate(box=(15, 0, 25, 10))
+    assert solver.choose(Label(candidates=[overlapping, crossed])) is crossed
+
+
+@needs_annotation_fonts
+@pytest.mark.parametrize("thickness", THICKNESSES)
+@pytest.mark.parametrize("radius", RADII)
+@pytest.mark.parametrize(
+    "make_labels",
+    [
+        lambda_linear,
+        lambda_angular,
+        lambda_vertices,
+        lambda_parameters,
+        logomark_linear,
+        logomark_gradient,
+    ],
+)
+def test_placed_lambda_labels_do_not_overlap(
+    annotations, make_labels, radius, thickness
+):
+    assert_apart(make_labels(annotations, radius=radius, thickness=thickness))
+
+
+@needs_fonts
+@pytest.mark.parametrize("cap_height", [256, 512, 1024])
+def test_placed_logotype_labels_do_not_overlap(annotations, cap_height):
+    logotype = DimensionedLogotype(
+        loader=get_font_loader(capHeight=cap_height),
+        spacings=DEFAULT_LOGOTYPE_SPACINGS,
+        clear_space=ClearSpace.MINIMAL,
+        annotations=annotations,
+        auto_place=True,
+    )
+    assert_apart(
+        (
+            logotype.svg_bounding_box(),
+            logotype.dimension_cap_height(),
+            logotype.dimension_spacings(),
+        )
+    )
+
+
+@needs_fonts
+@pytest.mark.parametrize("radius", [256, 512, 1024])
+@pytest.mark.parametrize("thickness", [1 / 8, 1 / 4, 3 / 8])
+def test_placed_logo_label_clears_the_logo(annotations, radius, thickness):
+    logo = DimensionedLogo(
+        lambda_radius=radius,
+        lambda_thickness=thickness,
+        clear_space=ClearSpace.MINIMAL,
+        annotations=annotations,
+        auto_place=True,
+    )
+    solver = logo.make_placement_solver()
+    (label_box,) = label_boxes(logo.dimension_bearing())
+    assert solver.penalty(Candidate(box=label_box)) == 0
@@ -0,0 +1,28 @@
+{
+  jura,
+  nixos-color-palette,
+  python3,
+  route159,
+  writeShellApplication,
+}:
+writeShellApplication {
+
+  name = "predict-nixos-branding-fods";
+
+  runtimeInputs = [
+    (python3.withPackages (ps: [ ps.nixoslogo ]))
+  ];
+
+  runtimeEnv = {
+    NIXOS_ANNOTATIONS_FONT_FILE = "${jura}/share/fonts/truetype/jura/Jura-Regular.ttf";
+    NIXOS_COLOR_PALETTE_FILE = "${nixos-color-palette}/colors.toml";
+    NIXOS_LOGOTYPE_FONT_FILE = "${route159}/share/fonts/opentype/route159/Route159-Regular.otf";
+  };
+
+  text = ''
+    python -m nixoslogo.fods \
+      package-sets/top-level/nixos-branding/artifacts/manifest.json \
+      "$@"
+  '';
+
+}